@@ -389,7 +389,7 @@ def get_many_series_with_revisions(
 
         if series_with_revisions.IsError:
             if series_with_revisions.ErrorMessage == "Not found":
-                yield SeriesWithVintages("Not found", StatusCode.NOT_FOUND, None, [])
+                yield SeriesWithVintages("Not found", StatusCode.NOT_FOUND, None, [], request.name)
                 continue
             raise Exception(series_with_revisions.ErrorMessage)
 
@@ -404,7 +404,7 @@ def get_many_series_with_revisions(
         ):
             if not include_not_modified:
                 continue
-            yield SeriesWithVintages("Not modified", StatusCode.NOT_MODIFIED, None, [])
+            yield SeriesWithVintages("Not modified", StatusCode.NOT_MODIFIED, None, [], request.name)
             continue
 
         can_do_incremental_response = request.last_revision is not None
@@ -415,6 +415,7 @@ def get_many_series_with_revisions(
                 StatusCode.OTHER,
                 None,
                 [],
+                request.name,
             )
             continue
 
@@ -457,6 +458,7 @@ def get_many_series_with_revisions(
                     StatusCode.PARTIAL_CONTENT,
                     metadata,
                     list(_create_vintage_values(index, vintage_dates, complete_history)),
+                    request.name,
                 )
                 continue
         yield SeriesWithVintages(
@@ -464,4 +466,5 @@ def get_many_series_with_revisions(
             StatusCode.OK,
             metadata,
             list(_create_vintage_values(0, vintage_dates, complete_history)),
+            request.name,
         )
@@ -4,3 +4,6 @@ The core classes and types of the Macrobond Data API.
 
 from .client import Client
 from .api import Api
+from .revision_store import RevisionStore
+from .revision_info_cache import RevisionInfoCache
+from .unified_series_engine import UnifiedSeriesEngine
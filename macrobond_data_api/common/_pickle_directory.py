@@ -0,0 +1,54 @@
+import os
+import pickle
+from tempfile import NamedTemporaryFile
+from typing import Any, Generic, List, Optional, TypeVar
+from urllib.parse import quote, unquote
+
+_T = TypeVar("_T")
+
+_FILE_EXTENSION = ".pickle"
+
+
+def _dump_pickle(obj: Any, path: str) -> None:
+    # Write to a temporary file in the same directory and rename it, so that readers never see a partial file
+    with NamedTemporaryFile("wb", dir=os.path.dirname(path), suffix=".tmp", delete=False) as f:
+        pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(f.name, path)
+
+
+class _PickleDirectory(Generic[_T]):
+    """Objects stored by series name, one pickle file per series in a directory."""
+
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        """The directory where the series are stored."""
+        return self._directory
+
+    def names(self) -> List[str]:
+        """The names of the stored series in lower case."""
+        return [unquote(x[: -len(_FILE_EXTENSION)]) for x in os.listdir(self._directory) if x.endswith(_FILE_EXTENSION)]
+
+    def get(self, name: str) -> Optional[_T]:
+        """Get what is stored for a series or None if the series is not stored."""
+        try:
+            with open(self._path(name), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+
+    def remove(self, name: str) -> None:
+        """Remove a series."""
+        try:
+            os.remove(self._path(name))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory, quote(name.lower(), safe="") + _FILE_EXTENSION)
+
+    def _write(self, name: str, obj: _T) -> None:
+        _dump_pickle(obj, self._path(name))
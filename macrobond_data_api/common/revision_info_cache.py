@@ -0,0 +1,91 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Mapping, Sequence
+
+from macrobond_data_api.common.types import RevisionInfo
+from macrobond_data_api.common.types._time_key import _time_key
+
+from ._pickle_directory import _PickleDirectory
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .api import Api
+
+__pdoc__ = {
+    "RevisionInfoCache.__init__": False,
+}
+
+
+class RevisionInfoCache(_PickleDirectory[RevisionInfo]):
+    """
+    A local cache of the results of `macrobond_data_api.common.api.Api.get_revision_info`, one file per series in a
+    directory.
+
+    A cached series stays valid until it is modified after its last revision. Pass the modification times from a
+    data package list or a subscription list to `invalidate` to remove the series that may have new revisions.
+
+    Examples
+    --------
+    ```python
+    cache = RevisionInfoCache("revision_info")
+    with WebClient() as api:
+        subscription_list = api.subscription_list(last_modified)
+        for updates in subscription_list.poll_until_no_more_changes():
+            cache.invalidate(updates)
+        infos = cache.get_revision_info(api, "usgdp", "uscpi")
+    ```
+    """
+
+    def put(self, info: RevisionInfo) -> None:
+        """Store the revision information of a series. Results with an error are not stored."""
+        if info.error_message:
+            return
+        self._write(info.name, info)
+
+    def invalidate(self, modified: Mapping[str, datetime]) -> List[str]:
+        """
+        Remove the series that have been modified after their last cached revision.
+
+        Parameters
+        ----------
+        modified : Mapping[str, datetime]
+            The time when each series was last modified, for example the result of
+            `macrobond_data_api.web.subscription_list.SubscriptionList.poll` or
+            `{x.name: x.modified for x in update.items}` for a data package list update.
+
+        Returns
+        -------
+        List[str]
+            The names of the series that were removed.
+        """
+        ret: List[str] = []
+        for name, time in modified.items():
+            cached = self.get(name)
+            if cached is not None and _time_key(cached.time_stamp_of_last_revision) < _time_key(time):
+                self.remove(name)
+                ret.append(name)
+        return ret
+
+    def get_revision_info(self, api: "Api", *series_names: str, raise_error: bool = None) -> Sequence[RevisionInfo]:
+        """
+        Get the revision information of the series from the cache and download the series that are not cached with
+        `macrobond_data_api.common.api.Api.get_revision_info`. The downloaded results are stored in the cache.
+
+        Returns
+        -------
+        `Sequence[macrobond_data_api.common.types.revision_info.RevisionInfo]`
+            The result is in the same order as in the request.
+        """
+        cached: Dict[str, RevisionInfo] = {}
+        missing: List[str] = []
+        for name in series_names:
+            info = self.get(name)
+            if info is None:
+                missing.append(name)
+            else:
+                cached[name] = info
+
+        if missing:
+            for name, info in zip(missing, api.get_revision_info(*missing, raise_error=raise_error)):
+                self.put(info)
+                cached[name] = info
+
+        return [cached[x] for x in series_names]
@@ -0,0 +1,114 @@
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import RevisionHistoryRequest, SeriesWithVintages, VintageValues
+from macrobond_data_api.common.types._time_key import _time_key
+
+from ._pickle_directory import _PickleDirectory
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .api import Api
+
+__pdoc__ = {
+    "RevisionStore.__init__": False,
+}
+
+
+class RevisionStore(_PickleDirectory[SeriesWithVintages]):
+    """
+    A local store of the complete revision history of series, one file per series in a directory.
+
+    The store keeps the LastModifiedTimeStamp, LastRevisionTimeStamp and LastRevisionAdjustmentTimeStamp of each
+    series and uses them to create the requests for
+    `macrobond_data_api.common.api.Api.get_many_series_with_revisions`, so that the server only returns the
+    vintages that have been added since the last sync. Partial responses are merged into the stored history.
+
+    Examples
+    --------
+    ```python
+    store = RevisionStore("revisions")
+    with WebClient() as api:
+        store.sync(api, ["usgdp", "uscpi"])
+    usgdp = store.get("usgdp")
+    ```
+    """
+
+    def requests(self, names: Iterable[str]) -> List[RevisionHistoryRequest]:
+        """
+        Create the requests to get the revisions that have been added to the series since they were stored.
+        Series that are not stored are requested in full.
+        """
+        ret: List[RevisionHistoryRequest] = []
+        for name in names:
+            stored = self.get(name)
+            if stored is None:
+                ret.append(RevisionHistoryRequest(name))
+            else:
+                ret.append(
+                    RevisionHistoryRequest(
+                        name, stored.last_modified, stored.last_revision, stored.last_revision_adjustment
+                    )
+                )
+        return ret
+
+    def apply(self, series: SeriesWithVintages, name: Optional[str] = None) -> StatusCode:
+        """
+        Apply a response from `macrobond_data_api.common.api.Api.get_many_series_with_revisions` to the store.
+        A full response replaces the stored history. A partial response replaces the stored vintages from the first
+        vintage in the response and onwards. Responses that are not modified or errors leave the store unchanged.
+
+        Parameters
+        ----------
+        series : `macrobond_data_api.common.types.series_with_vintages.SeriesWithVintages`
+            The response.
+        name : str
+            The name of the series. The name in the response is used if not specified.
+
+        Returns
+        -------
+        `macrobond_data_api.common.enums.status_code.StatusCode`
+            The status code of the response.
+        """
+        name = name or series.name
+        if not name:
+            raise ValueError("The name of the series is not known")
+
+        if series.status_code == StatusCode.OK:
+            vintages: List[VintageValues] = list(series.vintages)
+        elif series.status_code == StatusCode.PARTIAL_CONTENT:
+            stored = self.get(name)
+            if stored is None:
+                raise ValueError("Partial response for a series that is not stored: " + name)
+            vintages = list(stored.vintages)
+            if series.vintages:
+                first = _time_key(series.vintages[0].vintage_time_stamp)
+                vintages = [x for x in vintages if _time_key(x.vintage_time_stamp) < first]
+                vintages.extend(series.vintages)
+        else:
+            return series.status_code
+
+        metadata = dict(series.metadata) if series.metadata is not None else None
+        self._write(name, SeriesWithVintages(None, StatusCode.OK, metadata, vintages, name))
+        return series.status_code
+
+    def sync(self, api: "Api", names: Optional[Sequence[str]] = None) -> Dict[str, StatusCode]:
+        """
+        Download the revisions that have been added since the last sync and merge them into the store.
+
+        Parameters
+        ----------
+        api : `macrobond_data_api.common.api.Api`
+            The API to download with.
+        names : Sequence[str]
+            The names of the series to sync. All stored series are synced if not specified.
+
+        Returns
+        -------
+        Dict[str, `macrobond_data_api.common.enums.status_code.StatusCode`]
+            The status of each series. Series that were not modified have the status NOT_MODIFIED.
+        """
+        requests = self.requests(self.names() if names is None else names)
+        ret = {x.name: StatusCode.NOT_MODIFIED for x in requests}
+        for request, series in zip(requests, api.get_many_series_with_revisions(requests, include_not_modified=True)):
+            ret[series.name or request.name] = self.apply(series, series.name or request.name)
+        return ret
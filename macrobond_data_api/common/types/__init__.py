@@ -10,6 +10,8 @@ from .search_filter import SearchFilter
 from .metadata_attribute_information import MetadataAttributeInformation
 from .series import Series, SeriesColumns
 
+from .lazy_series import LazySeries
+
 from .entity import Entity, EntityColumns
 
 from .unified_series import UnifiedSeries, UnifiedSeriesList, UnifiedSeriesDict, UnifiedSeriesColumns
@@ -27,16 +29,26 @@ from .get_entity_error import EntityErrorInfo, GetEntitiesError
 
 from .metadata_attribute_information import TypedDictMetadataAttributeInformation, MetadataAttributeInformationColumns
 
-from .series_observation_history import SeriesObservationHistory, SeriesObservationHistoryColumns
+from .series_observation_history import (
+    SeriesObservationHistory,
+    SeriesObservationHistoryColumns,
+    SeriesObservationHistoryResult,
+)
 
 from .revision_info import RevisionInfo, RevisionInfoDict
 
+from .revision_info_index import RevisionInfoIndex
+
 from .get_all_vintage_series_result import GetAllVintageSeriesResult
 
+from .vintage_matrix import VintageMatrix, VintageMatrixResult, NthReleasesResult
+
 from .metadata import Metadata
 
 from .series_with_vintages import SeriesWithVintages, VintageValues
 
+from .compact_vintage_values import CompactVintageValues
+
 from .revision_history_request import RevisionHistoryRequest
 
 from .values_metadata import ValuesMetadata
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from macrobond_data_api.common.enums import StatusCode
+
+
+@dataclass(init=False)
+class _SeriesResult:
+    """The name and status of a result computed for a series."""
+
+    __slots__ = ("name", "error_text", "status_code")
+
+    name: str
+    error_text: Optional[str]
+    status_code: StatusCode
+
+    def __init__(self, name: str, error_text: Optional[str], status_code: StatusCode) -> None:
+        self.name = name
+        """The name of the series."""
+
+        self.error_text = error_text
+        """The error text if there was an error or None if there was no error."""
+
+        self.status_code = status_code
+        """The status of the series."""
+
+    @property
+    def is_error(self) -> bool:
+        """True if there was an error, that is, if there is an error text or the status is not OK."""
+        return self.error_text is not None or self.status_code != StatusCode.OK
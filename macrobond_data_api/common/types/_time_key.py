@@ -0,0 +1,12 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+_MIN_TIME = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _time_key(time: Optional[datetime]) -> datetime:
+    # Times without time zone are treated as UTC so that they can be compared with times that have one,
+    # and a missing time is before all other times
+    if time is None:
+        return _MIN_TIME
+    return time if time.tzinfo else time.replace(tzinfo=timezone.utc)
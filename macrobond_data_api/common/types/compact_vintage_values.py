@@ -0,0 +1,186 @@
+from array import array
+from datetime import datetime
+from math import isnan
+from typing import Dict, Iterator, List, Optional, Sequence, overload
+
+from .series_with_vintages import VintageValues
+from .vintage_matrix import VintageMatrix
+
+__pdoc__ = {
+    "CompactVintageValues.__init__": False,
+}
+
+
+class CompactVintageValues(Sequence[VintageValues]):
+    """
+    A compact sequence of vintages of a series.
+    All vintages share one date axis and each vintage refers to a run of consecutive dates on the axis, so each date
+    is only stored once. The values of all vintages are stored in a single float64 array where missing values are
+    NaN. The `macrobond_data_api.common.types.series_with_vintages.VintageValues` are created on demand when the
+    sequence is indexed or iterated.
+    """
+
+    __slots__ = ("_dates", "_vintage_time_stamps", "_starts", "_lengths", "_value_offsets", "_values", "_gaps")
+
+    def __init__(
+        self,
+        dates: List[datetime],
+        vintage_time_stamps: List[Optional[datetime]],
+        starts: "array[int]",
+        lengths: "array[int]",
+        value_offsets: "array[int]",
+        values: "array[float]",
+        gaps: Dict[int, "array[int]"],
+    ) -> None:
+        self._dates = dates
+        self._vintage_time_stamps = vintage_time_stamps
+        self._starts = starts
+        self._lengths = lengths
+        self._value_offsets = value_offsets
+        self._values = values
+        self._gaps = gaps
+
+    @property
+    def dates(self) -> List[datetime]:
+        """The dates of all vintages in ascending order."""
+        return self._dates
+
+    @property
+    def vintage_time_stamps(self) -> List[Optional[datetime]]:
+        """The time when each vintage was recorded."""
+        return self._vintage_time_stamps
+
+    @property
+    def values(self) -> "array[float]":
+        """The values of all vintages, one vintage after the other, as float64 where missing values are NaN."""
+        return self._values
+
+    def date_indices(self, index: int) -> Sequence[int]:
+        """The indices in `dates` of the dates of the vintage at index."""
+        gaps = self._gaps.get(index if index >= 0 else index + len(self))
+        if gaps is not None:
+            return gaps
+        start = self._starts[index]
+        return range(start, start + self._lengths[index])
+
+    def value_range(self, index: int) -> range:
+        """The range of the values of the vintage at index in `values`."""
+        start = self._value_offsets[index]
+        return range(start, start + self._lengths[index])
+
+    def to_vintage_matrix(self) -> VintageMatrix:
+        """
+        Return the vintages as a `macrobond_data_api.common.types.vintage_matrix.VintageMatrix` with one row per
+        date and one column per vintage. This requires numpy, which is installed together with pandas.
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        rows = numpy.concatenate(
+            [numpy.asarray(self.date_indices(i), dtype=numpy.int64) for i in range(len(self))]
+            or [numpy.empty(0, dtype=numpy.int64)]
+        )
+        return VintageMatrix._from_flat(
+            self._dates,
+            list(self._vintage_time_stamps),
+            rows,
+            numpy.frombuffer(self._lengths, dtype=numpy.int64),
+            numpy.frombuffer(self._values, dtype=numpy.float64),
+        )
+
+    def to_list(self) -> List[VintageValues]:
+        """Return the vintages as a list of `macrobond_data_api.common.types.series_with_vintages.VintageValues`."""
+        return list(self)
+
+    @overload
+    def __getitem__(self, i: int) -> VintageValues:
+        pass
+
+    @overload
+    def __getitem__(self, s: slice) -> List[VintageValues]:
+        pass
+
+    def __getitem__(self, key):  # type: ignore
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        if key < -len(self) or key >= len(self):
+            raise IndexError("CompactVintageValues index out of range")
+        gaps = self._gaps.get(key if key >= 0 else key + len(self))
+        if gaps is not None:
+            dates = [self._dates[x] for x in gaps]
+        else:
+            start = self._starts[key]
+            dates = self._dates[start : start + self._lengths[key]]
+        value_range = self.value_range(key)
+        values: List[Optional[float]] = [
+            None if isnan(x) else x for x in self._values[value_range.start : value_range.stop]
+        ]
+        return VintageValues(self._vintage_time_stamps[key], dates, values)
+
+    def __iter__(self) -> Iterator[VintageValues]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (CompactVintageValues, list)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CompactVintageValues(len={len(self)}, dates={len(self._dates)})"
+
+
+class _CompactVintageValuesBuilder:
+    """
+    Builds a `CompactVintageValues` from vintages with ISO 8601 date strings. Each distinct date string is only
+    stored and parsed once.
+    """
+
+    __slots__ = ("_vintage_time_stamps", "_date_ids", "_id_of_date", "_values", "_value_offsets")
+
+    def __init__(self) -> None:
+        self._vintage_time_stamps: List[Optional[datetime]] = []
+        self._date_ids: List["array[int]"] = []
+        self._id_of_date: Dict[str, int] = {}
+        self._values: "array[float]" = array("d")
+        self._value_offsets: "array[int]" = array("q")
+
+    def append(
+        self, vintage_time_stamp: Optional[datetime], dates: Sequence[str], values: Sequence[Optional[float]]
+    ) -> None:
+        if len(dates) != len(values):
+            raise Exception("bad format: dates and values have different lengths")
+        id_of_date = self._id_of_date
+        self._vintage_time_stamps.append(vintage_time_stamp)
+        self._date_ids.append(array("q", (id_of_date.setdefault(x, len(id_of_date)) for x in dates)))
+        self._value_offsets.append(len(self._values))
+        self._values.extend(float("nan") if x is None else float(x) for x in values)
+
+    def build(self) -> CompactVintageValues:
+        date_strings = sorted(self._id_of_date)
+        index_of_id: "array[int]" = array("q", bytes(8 * len(date_strings)))
+        for i, date in enumerate(date_strings):
+            index_of_id[self._id_of_date[date]] = i
+
+        starts: "array[int]" = array("q")
+        lengths: "array[int]" = array("q")
+        gaps: Dict[int, "array[int]"] = {}
+        for i, ids in enumerate(self._date_ids):
+            indices = array("q", (index_of_id[x] for x in ids))
+            start = indices[0] if indices else 0
+            starts.append(start)
+            lengths.append(len(indices))
+            if any(x != start + j for j, x in enumerate(indices)):
+                gaps[i] = indices
+
+        return CompactVintageValues(
+            [datetime(int(x[0:4]), int(x[5:7]), int(x[8:10])) for x in date_strings],
+            self._vintage_time_stamps,
+            starts,
+            lengths,
+            self._value_offsets,
+            self._values,
+            gaps,
+        )
@@ -1,8 +1,11 @@
+from collections import Counter
 from dataclasses import dataclass
+from datetime import datetime
 
-from typing import TYPE_CHECKING, Any, Dict, Sequence, overload, List
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, overload, List
 
 from macrobond_data_api.common.types.vintage_series import VintageSeries
+from macrobond_data_api.common.types.vintage_matrix import VintageMatrix
 
 if TYPE_CHECKING:  # pragma: no cover
     from pandas import DataFrame
@@ -12,6 +15,19 @@ __pdoc__ = {
 }
 
 
+def _column_labels(time_stamps: List[Optional[datetime]]) -> List[Any]:
+    counts = Counter(time_stamps)
+    numbers: Dict[Optional[datetime], int] = {}
+    labels: List[Any] = []
+    for x in time_stamps:
+        if counts[x] == 1:
+            labels.append(x)
+        else:
+            numbers[x] = numbers.get(x, 0) + 1
+            labels.append(f"{x}_{numbers[x]}")
+    return labels
+
+
 @dataclass(init=False)
 class GetAllVintageSeriesResult(Sequence[VintageSeries]):
     """
@@ -33,24 +49,32 @@ class GetAllVintageSeriesResult(Sequence[VintageSeries]):
     def to_pd_data_frame(self) -> "DataFrame":
         """
         Return the result as a Pandas DataFrame.
+        There is one column per vintage, labeled by its revision time stamp. Vintages that share a time stamp are
+        labeled with the time stamp and a suffix, "_1", "_2" and so on, so that each vintage keeps its own column.
         """
         import pandas  # pylint: disable=import-outside-toplevel
 
-        df = pandas.DataFrame(
-            {
-                **{"date": self.series[len(self.series) - 1].dates},
-            }
-        )
+        matrix = self.to_vintage_matrix()
+        last_dates = self.series[len(self.series) - 1].dates or []
+        rows = pandas.Index(matrix.dates).get_indexer(last_dates)
 
-        for x in self.series:
-            arg: Any = {
-                **{"date": x.dates},
-                **{x.revision_time_stamp: pandas.Series(data=x.values, name="Value", dtype="float64")},
-            }
-            df_to_merge = pandas.DataFrame(arg)
-            df = df.merge(df_to_merge, how="left", left_on="date", right_on="date")
+        data: Dict[Any, Any] = {"date": last_dates}
+        for i, label in enumerate(_column_labels([x.revision_time_stamp for x in self.series])):
+            data[label] = pandas.Series(data=matrix.values[rows, i], name="Value", dtype="float64")
+        return pandas.DataFrame(data)
 
-        return df
+    def to_vintage_matrix(self) -> VintageMatrix:
+        """
+        Return the result as a `macrobond_data_api.common.types.vintage_matrix.VintageMatrix` with one row per
+        observation date and one column per vintage.
+        The matrix is built in one pass and can be used to get the first, nth release or the values as of a point in
+        time. This requires numpy, which is installed together with pandas.
+        """
+        return VintageMatrix._from_vintages(
+            [x.revision_time_stamp for x in self.series],
+            [x.dates or [] for x in self.series],
+            [x.values or [] for x in self.series],
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """
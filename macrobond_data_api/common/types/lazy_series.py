@@ -0,0 +1,83 @@
+from datetime import datetime
+from typing import Callable, List, Optional, Sequence, TYPE_CHECKING
+
+from macrobond_data_api.common.enums import StatusCode
+
+from .series import Series
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .metadata import Metadata
+
+__pdoc__ = {
+    "LazySeries.__init__": False,
+}
+
+
+class LazySeries(Series):
+    """
+    A `macrobond_data_api.common.types.series.Series` that keeps the undecoded values, dates and metadata of the
+    series from the response and decodes each of them the first time it is used.
+    This saves most of the time of a download when only a part of each series is used, for example the metadata.
+    """
+
+    __slots__ = ("_values", "_dates", "_metadata", "_load_values", "_load_dates", "_load_metadata")
+
+    def __init__(
+        self,
+        name: str,
+        load_values: Callable[[], List[Optional[float]]],
+        load_dates: Callable[[], List[datetime]],
+        load_metadata: Callable[[], "Metadata"],
+    ) -> None:
+        super().__init__(name, "", StatusCode.OK, None, None, [], [])
+        self._values: Optional[Sequence[Optional[float]]] = None
+        self._dates: Optional[Sequence[datetime]] = None
+        self._metadata: Optional["Metadata"] = None
+        self._load_values: Optional[Callable[[], List[Optional[float]]]] = load_values
+        self._load_dates: Optional[Callable[[], List[datetime]]] = load_dates
+        self._load_metadata: Optional[Callable[[], "Metadata"]] = load_metadata
+
+    @property
+    def values(self) -> Sequence[Optional[float]]:
+        """
+        The values of the series.
+        The number of values is the same as the number of `Series.dates`.
+        """
+        if self._load_values is not None:
+            self._values = self._load_values()
+            self._load_values = None
+        return self._values or []
+
+    @values.setter
+    def values(self, values: Sequence[Optional[float]]) -> None:
+        self._values = values
+        self._load_values = None
+
+    @property
+    def dates(self) -> Sequence[datetime]:
+        """
+        The dates of the periods corresponding to the values
+        The number of dates is the same as the number of `Series.values`.
+        """
+        if self._load_dates is not None:
+            self._dates = self._load_dates()
+            self._load_dates = None
+        return self._dates or []
+
+    @dates.setter
+    def dates(self, dates: Sequence[datetime]) -> None:
+        self._dates = dates
+        self._load_dates = None
+
+    @property
+    def metadata(self) -> "Metadata":
+        """The metadata of the entity."""
+        if self._load_metadata is not None:
+            self._metadata = self._load_metadata()
+            self._load_metadata = None
+        return self._metadata if self._metadata is not None else {}
+
+    @metadata.setter
+    def metadata(self, metadata: "Metadata") -> None:
+        self._metadata = metadata
+        self._load_metadata = None
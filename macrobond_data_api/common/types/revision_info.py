@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, Sequence, List, TypedDict
 
+from .revision_info_index import RevisionInfoIndex
+
 if TYPE_CHECKING:  # pragma: no cover
     from pandas import DataFrame
 
@@ -33,6 +35,7 @@ class RevisionInfo:
         "time_stamp_of_first_revision",
         "time_stamp_of_last_revision",
         "vintage_time_stamps",
+        "_index",
     )
 
     name: str
@@ -76,6 +79,18 @@ class RevisionInfo:
         A tuple with the timestams of all stored revisions in time order with the oldest first.
         """
 
+        self._index: Optional[RevisionInfoIndex] = None
+
+    @property
+    def index(self) -> RevisionInfoIndex:
+        """
+        An index of `vintage_time_stamps` for finding which vintage applies at a point in time with a binary search.
+        It is created on first access and then kept with the object.
+        """
+        if self._index is None:
+            self._index = RevisionInfoIndex.from_time_stamps(self.vintage_time_stamps)
+        return self._index
+
     def to_dict(self) -> RevisionInfoDict:
         """Returns a dictionary with the information of the series revisions."""
         return {
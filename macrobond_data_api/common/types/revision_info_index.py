@@ -0,0 +1,79 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+__pdoc__ = {
+    "RevisionInfoIndex.__init__": False,
+}
+
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_microseconds(time: datetime) -> int:
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=timezone.utc)
+    return (time - _EPOCH_UTC) // _MICROSECOND
+
+
+class RevisionInfoIndex:
+    """
+    An index of the vintage time stamps of a series for looking up which vintage applies at a point in time.
+    The time stamps are stored as a sorted int64 array of microseconds since the Unix epoch and are searched with a
+    binary search. Times without time zone are treated as UTC. The returned time stamps are in UTC.
+    """
+
+    __slots__ = ("_epoch_microseconds",)
+
+    def __init__(self, epoch_microseconds: "array[int]") -> None:
+        self._epoch_microseconds = epoch_microseconds
+
+    @classmethod
+    def from_time_stamps(cls, vintage_time_stamps: Iterable[datetime]) -> "RevisionInfoIndex":
+        """Create an index from vintage time stamps."""
+        return cls(array("q", sorted(_to_epoch_microseconds(x) for x in vintage_time_stamps)))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RevisionInfoIndex":
+        """Create an index from a dictionary created by `to_dict`."""
+        return cls(array("q", data["epoch_microseconds"]))
+
+    @property
+    def epoch_microseconds(self) -> "array[int]":
+        """The vintage time stamps as a sorted int64 array of microseconds since the Unix epoch."""
+        return self._epoch_microseconds
+
+    def vintage_index_at(self, time: datetime) -> int:
+        """The index of the latest vintage recorded at or before the time, or -1 if there is none."""
+        return bisect_right(self._epoch_microseconds, _to_epoch_microseconds(time)) - 1
+
+    def vintage_at(self, time: datetime) -> Optional[datetime]:
+        """The time stamp of the latest vintage recorded at or before the time, or None if there is none."""
+        index = self.vintage_index_at(time)
+        return self.time_stamp(index) if index >= 0 else None
+
+    def vintages_between(self, start: datetime, end: datetime) -> List[datetime]:
+        """The time stamps of the vintages recorded at or after start and before end."""
+        lo = bisect_left(self._epoch_microseconds, _to_epoch_microseconds(start))
+        hi = bisect_left(self._epoch_microseconds, _to_epoch_microseconds(end))
+        return [self.time_stamp(i) for i in range(lo, hi)]
+
+    def time_stamp(self, index: int) -> datetime:
+        """The time stamp of the vintage at index."""
+        return _EPOCH_UTC + self._epoch_microseconds[index] * _MICROSECOND
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the index as a dictionary that can be serialized, for example as JSON."""
+        return {"epoch_microseconds": self._epoch_microseconds.tolist()}
+
+    def __len__(self) -> int:
+        return len(self._epoch_microseconds)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RevisionInfoIndex):
+            return self._epoch_microseconds == other._epoch_microseconds
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RevisionInfoIndex(len={len(self)})"
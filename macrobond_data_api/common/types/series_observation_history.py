@@ -3,6 +3,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING, Literal
 
+from macrobond_data_api.common.enums import StatusCode
+
+from ._series_result import _SeriesResult
+
 if TYPE_CHECKING:  # pragma: no cover
     from pandas import Series, DataFrame
 
@@ -12,6 +16,7 @@ SeriesObservationHistoryColumns = List[SeriesObservationHistoryColumnsLiterals]
 
 __pdoc__ = {
     "SeriesObservationHistory.__init__": False,
+    "SeriesObservationHistoryResult.__init__": False,
 }
 
 
@@ -70,3 +75,24 @@ class SeriesObservationHistory:
 
     def _repr_html_(self) -> str:
         return self.to_pd_data_frame()._repr_html_()
+
+
+@dataclass(init=False)
+class SeriesObservationHistoryResult(_SeriesResult):
+    """The history of changes of observations in a series, or the error if the history could not be downloaded"""
+
+    __slots__ = ("history",)
+
+    history: Sequence[SeriesObservationHistory]
+
+    def __init__(
+        self,
+        name: str,
+        error_text: Optional[str],
+        status_code: StatusCode,
+        history: Sequence[SeriesObservationHistory],
+    ) -> None:
+        super().__init__(name, error_text, status_code)
+
+        self.history = history
+        """The history of each requested observation or an empty sequence if there was an error"""
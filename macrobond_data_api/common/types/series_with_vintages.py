@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Sequence
 
 from macrobond_data_api.common.enums import StatusCode
 
@@ -39,7 +39,7 @@ class VintageValues:
 class SeriesWithVintages:
     """A time series with times of change"""
 
-    __slots__ = ("error_text", "status_code", "metadata", "vintages")
+    __slots__ = ("error_text", "status_code", "metadata", "vintages", "name")
 
     error_text: Optional[str]
     """The error text if there was an error or not specified if there was no error"""
@@ -54,13 +54,16 @@ class SeriesWithVintages:
     The time when this version of the series was recorded
     """
 
-    vintages: List[VintageValues]
+    vintages: Sequence[VintageValues]
     """
     If specified, incremental updates can be return. PartialContent (206) will be returned in 
     that case. 
     The value should be from the metadata LastRevisionAdjustmentTimeStamp of the previous response.
     """
 
+    name: Optional[str]
+    """The name of the series in the request or None if it is not known"""
+
     @property
     def primary_name(self) -> str:
         """The primary name of the entity."""
@@ -112,9 +115,11 @@ class SeriesWithVintages:
         error_text: Optional[str],
         status_code: StatusCode,
         metadata: Optional[Metadata],
-        vintages: List[VintageValues],
+        vintages: Sequence[VintageValues],
+        name: Optional[str] = None,
     ) -> None:
         self.error_text = error_text
         self.status_code = status_code
         self.metadata = metadata
         self.vintages = vintages
+        self.name = name
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Sequence, Optional, TYPE_CHECKING, overload, Literal, TypedDict
+from typing import Any, Dict, List, Sequence, Optional, TYPE_CHECKING, overload, Literal, TypedDict, cast
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 UnifiedSeriesColumnsLiterals = Literal["Dates", "Series"]
 
@@ -14,6 +14,7 @@ __pdoc__ = {
 }
 
 if TYPE_CHECKING:  # pragma: no cover
+    from numpy import ndarray
     from pandas import DataFrame
     from .metadata import Metadata
 
@@ -62,7 +63,11 @@ class UnifiedSeries:
         """The metadata of the series."""
 
         self.values = values
-        """The values of the series."""
+        """
+        The values of the series.
+        If the series was downloaded with `as_matrix=True`, this is a float64 view of a column of
+        `UnifiedSeriesList.to_numpy` where missing values are NaN.
+        """
 
     def to_dict(self) -> Dict[str, Any]:
         if self.is_error:
@@ -92,6 +97,7 @@ class UnifiedSeriesList(Sequence[UnifiedSeries]):
     __slots__ = (
         "series",
         "dates",
+        "_matrix",
     )
 
     series: Sequence[UnifiedSeries]
@@ -104,16 +110,51 @@ class UnifiedSeriesList(Sequence[UnifiedSeries]):
         """
         return any(self)
 
-    def __init__(
-        self,
-        series: List[UnifiedSeries],
-        dates: List[datetime],
-    ) -> None:
+    def __init__(self, series: List[UnifiedSeries], dates: List[datetime], matrix: "ndarray" = None) -> None:
         super().__init__()
         self.series = series
         """The list of series"""
         self.dates = dates
         """The dates of the observations"""
+        self._matrix = matrix
+
+    def to_numpy(self) -> "ndarray":
+        """
+        The values as a float64 matrix with one row per date and one column per series, where NaN means a missing
+        value or a series with an error.
+        If the result was downloaded with `as_matrix=True`, this is the matrix that the values were decoded into and
+        the values of each series are views of its columns, so no values are copied.
+        This requires numpy, which is installed together with pandas.
+        """
+        if self._matrix is not None:
+            return self._matrix
+
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        matrix = numpy.full((len(self.dates), len(self.series)), numpy.nan, order="F")
+        for i, x in enumerate(self.series):
+            if not x.is_error:
+                matrix[:, i] = numpy.array(x.values, dtype=numpy.float64)
+        return matrix
+
+    def _with_matrix(self, matrix: "ndarray") -> "UnifiedSeriesList":
+        series = [
+            x if x.is_error else UnifiedSeries(x.name, "", x.metadata, cast(List[Optional[float]], matrix[:, i]))
+            for i, x in enumerate(self.series)
+        ]
+        return UnifiedSeriesList(series, list(self.dates), matrix)
+
+    def dates_to_numpy(self) -> "ndarray":
+        """
+        The dates as a datetime64 array. Dates with a time zone are converted to UTC.
+        This requires numpy, which is installed together with pandas.
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        return numpy.array(
+            [x.astimezone(timezone.utc).replace(tzinfo=None) if x.tzinfo else x for x in self.dates],
+            dtype="datetime64[us]",
+        )
 
     def to_dict(self) -> UnifiedSeriesDict:
         return {
@@ -127,6 +168,12 @@ class UnifiedSeriesList(Sequence[UnifiedSeries]):
     def to_pd_data_frame(self) -> "DataFrame":
         import pandas  # pylint: disable=import-outside-toplevel
 
+        if self._matrix is not None:
+            columns = ["Error: " + x.error_message if x.is_error else x.name for x in self]
+            data_frame = pandas.DataFrame(self._matrix, columns=columns, copy=False)
+            data_frame.insert(0, "date", pandas.DatetimeIndex(self.dates_to_numpy()))
+            return data_frame
+
         return pandas.DataFrame(
             {
                 **{"date": self.dates},
@@ -0,0 +1,288 @@
+from bisect import bisect_right
+from datetime import datetime
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
+
+from macrobond_data_api.common.enums import StatusCode
+
+from ._time_key import _time_key
+
+from ._series_result import _SeriesResult
+
+if TYPE_CHECKING:  # pragma: no cover
+    from numpy import ndarray
+    from pandas import DataFrame
+
+__pdoc__ = {
+    "VintageMatrix.__init__": False,
+    "VintageMatrixResult.__init__": False,
+    "NthReleasesResult.__init__": False,
+}
+
+
+class VintageMatrix:
+    """
+    The vintages of a time series as a real-time data triangle.
+    `values` is a float64 matrix with one row per observation date and one column per vintage, where NaN means that
+    the observation has no value in that vintage.
+
+    This class requires numpy, which is installed together with pandas.
+    """
+
+    __slots__ = ("dates", "vintage_time_stamps", "values", "_time_keys")
+
+    dates: List[datetime]
+    vintage_time_stamps: List[Optional[datetime]]
+    values: "ndarray"
+
+    def __init__(self, dates: List[datetime], vintage_time_stamps: List[Optional[datetime]], values: "ndarray") -> None:
+        self.dates = dates
+        """The observation dates in ascending order, one per row."""
+        self.vintage_time_stamps = vintage_time_stamps
+        """The time when each vintage was recorded, one per column in ascending order."""
+        self.values = values
+        """The values as a float64 matrix of observation dates × vintages."""
+        self._time_keys = [_time_key(x) for x in vintage_time_stamps]
+
+    @classmethod
+    def _from_vintages(
+        cls,
+        vintage_time_stamps: List[Optional[datetime]],
+        dates: Sequence[Sequence[datetime]],
+        values: Sequence[Sequence[Optional[float]]],
+    ) -> "VintageMatrix":
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        all_dates = sorted({x for vintage_dates in dates for x in vintage_dates})
+        row_of_date: Dict[datetime, int] = {x: i for i, x in enumerate(all_dates)}
+
+        lengths = [len(x) for x in dates]
+        rows = numpy.fromiter((row_of_date[x] for vintage_dates in dates for x in vintage_dates), numpy.int64)
+        columns = numpy.repeat(numpy.arange(len(dates), dtype=numpy.int64), lengths)
+        flat_values = numpy.fromiter(
+            (numpy.nan if x is None else x for vintage_values in values for x in vintage_values), numpy.float64
+        )
+
+        matrix = numpy.full((len(all_dates), len(dates)), numpy.nan)
+        matrix[rows, columns] = flat_values
+        return cls(all_dates, list(vintage_time_stamps), matrix)
+
+    @classmethod
+    def _from_flat(
+        cls,
+        dates: List[datetime],
+        vintage_time_stamps: List[Optional[datetime]],
+        rows: "ndarray",
+        lengths: "ndarray",
+        flat_values: "ndarray",
+    ) -> "VintageMatrix":
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        columns = numpy.repeat(numpy.arange(len(lengths), dtype=numpy.int64), lengths)
+        matrix = numpy.full((len(dates), len(lengths)), numpy.nan)
+        matrix[rows, columns] = flat_values
+        return cls(dates, vintage_time_stamps, matrix)
+
+    def nth_release(self, nth: int) -> "ndarray":
+        """
+        The value of each observation after it had been revised nth times, where 0 is the first release.
+        A new release is counted each time the value of the observation changes from one vintage to the next.
+        The value is NaN if the observation has fewer releases.
+
+        Parameters
+        ----------
+        nth : int
+            The release to get, where 0 is the first release.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            A float64 array with one value per observation date.
+        """
+        return self.nth_releases([nth])[nth]
+
+    def nth_releases(self, nths: Iterable[int]) -> Dict[int, "ndarray"]:
+        """
+        Like `nth_release`, but for many releases at once. The releases are found in a single pass over the matrix.
+
+        Parameters
+        ----------
+        nths : Iterable[int]
+            The releases to get, for example `range(13)`.
+
+        Returns
+        -------
+        Dict[int, `numpy.ndarray`]
+            A float64 array with one value per observation date for each release.
+        """
+        return self._values_at_columns(self.nth_release_columns(nths))
+
+    def _values_at_columns(self, columns: Dict[int, "ndarray"]) -> Dict[int, "ndarray"]:
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        rows = numpy.arange(self.values.shape[0])
+        ret: Dict[int, "ndarray"] = {}
+        for nth, nth_columns in columns.items():
+            values = numpy.full(len(rows), numpy.nan)
+            has_release = nth_columns >= 0
+            values[has_release] = self.values[rows[has_release], nth_columns[has_release]]
+            ret[nth] = values
+        return ret
+
+    def nth_release_columns(self, nths: Iterable[int]) -> Dict[int, "ndarray"]:
+        """
+        The vintage, as a column index, of each observation in which it was revised the nth time.
+        The index is -1 if the observation has fewer releases. Use this with `vintage_time_stamps` to get the time of
+        change of each release.
+
+        Parameters
+        ----------
+        nths : Iterable[int]
+            The releases to get, where 0 is the first release.
+
+        Returns
+        -------
+        Dict[int, `numpy.ndarray`]
+            An int64 array with one column index per observation date for each release.
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        nths = list(nths)
+        if any(x < 0 for x in nths):
+            raise ValueError("nth must be zero or larger")
+
+        values = self.values
+        rows, columns = values.shape
+        if rows == 0 or columns == 0:
+            return {x: numpy.full(rows, -1, dtype=numpy.int64) for x in nths}
+
+        present = ~numpy.isnan(values)
+        last_index = numpy.where(present, numpy.arange(columns), -1)
+        numpy.maximum.accumulate(last_index, axis=1, out=last_index)
+        previous_index = numpy.concatenate([numpy.full((rows, 1), -1), last_index[:, :-1]], axis=1)
+        previous = numpy.take_along_axis(values, numpy.maximum(previous_index, 0), axis=1)
+        is_release = present & ((previous_index < 0) | (values != previous))
+        release_count = numpy.cumsum(is_release, axis=1)
+        total = release_count[:, -1]
+
+        ret: Dict[int, "ndarray"] = {}
+        for nth in nths:
+            column = (release_count <= nth).sum(axis=1)
+            ret[nth] = numpy.where(total > nth, column, -1).astype(numpy.int64)
+        return ret
+
+    def first_release(self) -> "ndarray":
+        """
+        The first released value of each observation.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            A float64 array with one value per observation date.
+        """
+        return self.nth_release(0)
+
+    def as_of(self, time: datetime) -> "ndarray":
+        """
+        The values of the series as they were known at a point in time, that is, the latest vintage that was recorded
+        at or before the time. All values are NaN if the time is before the first vintage.
+
+        Parameters
+        ----------
+        time : datetime
+            The point in time. A time without time zone is treated as UTC.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            A float64 array with one value per observation date.
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        column = bisect_right(self._time_keys, _time_key(time)) - 1
+        if column < 0:
+            return numpy.full(len(self.dates), numpy.nan)
+        return self.values[:, column].copy()
+
+    def as_of_many(self, times: Sequence[datetime]) -> "VintageMatrix":
+        """
+        The values of the series as they were known at each of the points in time.
+        This is like calling `as_of` for each time, but the vintages are looked up with a single binary search per
+        time and the result is returned as one matrix.
+
+        Parameters
+        ----------
+        times : Sequence[datetime]
+            The points in time. A time without time zone is treated as UTC.
+
+        Returns
+        -------
+        `VintageMatrix`
+            A matrix with one column per point in time, where `vintage_time_stamps` are the points in time.
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        keys = self._time_keys
+        columns = numpy.fromiter((bisect_right(keys, _time_key(x)) - 1 for x in times), numpy.int64, len(times))
+        if self.values.shape[1] == 0:
+            return VintageMatrix(self.dates, list(times), numpy.full((len(self.dates), len(times)), numpy.nan))
+        values = self.values[:, numpy.maximum(columns, 0)]
+        values[:, columns < 0] = numpy.nan
+        return VintageMatrix(self.dates, list(times), values)
+
+    def to_pd_data_frame(self) -> "DataFrame":
+        """
+        Return the matrix as a Pandas DataFrame with the observation dates as index and one column per vintage.
+        """
+        import pandas  # pylint: disable=import-outside-toplevel
+
+        return pandas.DataFrame(
+            self.values, index=pandas.Index(self.dates, name="date"), columns=self.vintage_time_stamps
+        )
+
+    def __repr__(self) -> str:
+        return f"VintageMatrix(dates={len(self.dates)}, vintages={len(self.vintage_time_stamps)})"
+
+
+@dataclass(init=False)
+class VintageMatrixResult(_SeriesResult):
+    """A `VintageMatrix` for a series, or the error if the series could not be downloaded."""
+
+    __slots__ = ("matrix",)
+
+    matrix: Optional[VintageMatrix]
+
+    def __init__(
+        self, name: str, error_text: Optional[str], status_code: StatusCode, matrix: Optional[VintageMatrix]
+    ) -> None:
+        super().__init__(name, error_text, status_code)
+        self.matrix = matrix
+        """The matrix or None if there was an error."""
+
+
+@dataclass(init=False)
+class NthReleasesResult(_SeriesResult):
+    """Many releases of a series, or the error if the series could not be downloaded."""
+
+    __slots__ = ("dates", "releases", "times_of_change")
+
+    dates: List[datetime]
+    releases: Dict[int, "ndarray"]
+    times_of_change: Optional[Dict[int, List[Optional[datetime]]]]
+
+    def __init__(
+        self,
+        name: str,
+        error_text: Optional[str],
+        status_code: StatusCode,
+        dates: List[datetime],
+        releases: Dict[int, "ndarray"],
+        times_of_change: Optional[Dict[int, List[Optional[datetime]]]],
+    ) -> None:
+        super().__init__(name, error_text, status_code)
+        self.dates = dates
+        """The observation dates. All releases are aligned to these dates."""
+        self.releases = releases
+        """A float64 array for each release with one value per observation date, where NaN means no release."""
+        self.times_of_change = times_of_change
+        """The time of change of each value in `releases` if requested, where None means no release."""
@@ -0,0 +1,614 @@
+import re
+from math import isnan
+from calendar import monthrange
+from datetime import date, datetime, timedelta, tzinfo
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, List, Match, Optional, Sequence, Tuple, Union
+
+from macrobond_data_api.common.enums import (
+    CalendarDateMode,
+    CalendarMergeMode,
+    SeriesFrequency,
+    SeriesMissingValueMethod,
+    SeriesPartialPeriodsMethod,
+    SeriesToHigherFrequencyMethod,
+    SeriesToLowerFrequencyMethod,
+    SeriesWeekdays,
+)
+from macrobond_data_api.common.types import (
+    EntityErrorInfo,
+    GetEntitiesError,
+    Series,
+    SeriesEntry,
+    StartOrEndPoint,
+    UnifiedSeries,
+    UnifiedSeriesList,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from numpy import ndarray
+    from .api import Api
+
+__pdoc__ = {
+    "UnifiedSeriesEngine.__init__": False,
+}
+
+_EPOCH = date(1970, 1, 1)
+
+_MONTHS_PER_PERIOD = {
+    SeriesFrequency.ANNUAL: 12,
+    SeriesFrequency.SEMIANNUAL: 6,
+    SeriesFrequency.QUADMONTHLY: 4,
+    SeriesFrequency.QUARTERLY: 3,
+    SeriesFrequency.BIMONTHLY: 2,
+    SeriesFrequency.MONTHLY: 1,
+}
+
+_RELATIVE_POINT = re.compile(r"([+-]?\d+)([dwmqy]?)")
+# StartOrEndPoint.point_in_time writes years with four digits, so those are the only plain numbers that are not a
+# number of observations
+_YEAR = re.compile(r"\d{4}")
+
+
+def _match_relative_point(text: Optional[str]) -> Optional[Match[str]]:
+    if not text or _YEAR.fullmatch(text):
+        return None
+    return _RELATIVE_POINT.fullmatch(text)
+
+
+def _is_relative_point(text: Optional[str]) -> bool:
+    # A number of observations, days, weeks, months, quarters or years relative to the end of the data
+    return _match_relative_point(text) is not None
+
+
+class _CachedSeries:
+    __slots__ = ("series", "frequency", "day_mask", "days", "values", "is_flow", "is_pp100", "tz")
+
+    def __init__(self, series: Series) -> None:
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        metadata = series.metadata
+        self.series = series
+        self.frequency = SeriesFrequency[str(metadata["Frequency"]).upper()]
+        self.day_mask = int(metadata.get("DayMask") or SeriesWeekdays.MONDAY_TO_FRIDAY)
+        self.days = numpy.fromiter(((x.date() - _EPOCH).days for x in series.dates), numpy.int64, len(series.dates))
+        self.values = numpy.fromiter(
+            (numpy.nan if x is None else x for x in series.values), numpy.float64, len(series.values)
+        )
+        self.is_flow = str(metadata.get("Class") or "").lower() == "flow"
+        self.is_pp100 = bool(metadata.get("PP100"))
+        self.tz: Optional[tzinfo] = series.dates[0].tzinfo if series.dates else None
+
+
+class UnifiedSeriesEngine:
+    """
+    Converts series to a common frequency and calendar on the client, like
+    `macrobond_data_api.common.api.Api.get_unified_series`, from series that have already been downloaded.
+    The series are kept in the engine, so the same series can be unified many times with different settings without
+    downloading them again. Series that are not in the engine are downloaded with
+    `macrobond_data_api.common.api.Api.get_series` if an api is given.
+
+    The engine uses the metadata Frequency and DayMask of the series, and Class and PP100 to pick a method when the
+    method is AUTO. Flow series are summed when converted to a lower frequency and distributed when converted to a
+    higher frequency, other series are averaged and repeated. Missing values are filled with AUTO by repeating the
+    previous value for stock series and with zero for flow series. Weekly periods start on Monday.
+
+    The results follow the documented behavior of the server, but are not guaranteed to be identical to it.
+    Currency conversion, vintages, quadratic and cubic distribution and the past rate of change partial period method
+    are not supported.
+
+    This class requires numpy, which is installed together with pandas.
+
+    Examples
+    --------
+    ```python
+    with WebClient() as api:
+        engine = UnifiedSeriesEngine(api)
+        monthly = engine.get_unified_series("usgdp", "uscpi", frequency=SeriesFrequency.MONTHLY)
+        quarterly = engine.get_unified_series("usgdp", "uscpi", frequency=SeriesFrequency.QUARTERLY)
+    ```
+    """
+
+    def __init__(self, api: Optional["Api"] = None) -> None:
+        self._api = api
+        self._series: Dict[str, _CachedSeries] = {}
+        self._lock = Lock()
+
+    def add(self, *series: Series) -> None:
+        """Add downloaded series to the engine. Series with an error are ignored."""
+        cached = [_CachedSeries(x) for x in series if not x.is_error]
+        with self._lock:
+            for x in cached:
+                self._series[x.series.name.lower()] = x
+
+    def remove(self, *series_names: str) -> None:
+        """Remove series from the engine, for example when they have been updated."""
+        with self._lock:
+            for name in series_names:
+                self._series.pop(name.lower(), None)
+
+    def names(self) -> List[str]:
+        """The names of the series in the engine in lower case."""
+        with self._lock:
+            return list(self._series)
+
+    def get_unified_series(
+        self,
+        *series_entries: Union[SeriesEntry, str],
+        frequency: SeriesFrequency = SeriesFrequency.HIGHEST,
+        weekdays: SeriesWeekdays = SeriesWeekdays.MONDAY_TO_FRIDAY,
+        calendar_merge_mode: CalendarMergeMode = CalendarMergeMode.AVAILABLE_IN_ANY,
+        currency: str = "",
+        start_point: StartOrEndPoint = None,
+        end_point: StartOrEndPoint = None,
+        raise_error: bool = None,
+    ) -> UnifiedSeriesList:
+        """
+        Convert one or more series to a common frequency and calendar.
+        The parameters are the same as for `macrobond_data_api.common.api.Api.get_unified_series`.
+
+        Returns
+        -------
+        `macrobond_data_api.common.types.unified_series.UnifiedSeriesList`
+        The result is in the same order as in the request.
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        if currency:
+            raise ValueError("Currency conversion is not supported by the UnifiedSeriesEngine")
+        entries = [SeriesEntry(x) if isinstance(x, str) else x for x in series_entries]
+        if any(x.vintage is not None for x in entries):
+            raise ValueError("Vintages are not supported by the UnifiedSeriesEngine")
+
+        cached = self._get_cached([x.name for x in entries])
+        found = [(i, x) for i, x in enumerate(cached) if isinstance(x, _CachedSeries)]
+
+        dates: List[datetime] = []
+        rows: List[List[Optional[float]]] = [[] for _ in entries]
+        if found:
+            frequency = _resolve_frequency(frequency, [x.frequency for _, x in found])
+            converted = [_convert(x, entries[i], frequency, weekdays) for i, x in found]
+            calendar = _merge_calendars(calendar_merge_mode, frequency, weekdays, [x[0] for x in converted])
+            matrix = numpy.full((len(found), len(calendar)), numpy.nan)
+            for matrix_row, (keys, values), (i, x) in zip(matrix, converted, found):
+                span = _align(matrix_row, calendar, keys, values)
+                _fill_missing_values(matrix_row, span, _missing_value_method(entries[i], x))
+
+            calendar, matrix, start, end = _trim(frequency, weekdays, calendar, matrix, start_point, end_point)
+            tz = found[0][1].tz
+            dates = [_to_datetime(x, tz) for x in _start_days(frequency, calendar[start : end + 1]).tolist()]
+            for (i, _), row_values in zip(found, matrix[:, start : end + 1].tolist()):
+                rows[i] = [None if isnan(x) else x for x in row_values]
+
+        series: List[UnifiedSeries] = []
+        for entry, cached_series, row in zip(entries, cached, rows):
+            if isinstance(cached_series, _CachedSeries):
+                series.append(UnifiedSeries(entry.name, "", cached_series.series.metadata, row))
+            else:
+                series.append(UnifiedSeries(entry.name, cached_series, {}, []))
+
+        ret = UnifiedSeriesList(series, dates)
+
+        if self._api is not None and raise_error is None:
+            raise_error = self._api.raise_error
+        if raise_error:
+            errors = [EntityErrorInfo(x, y) for x, y in ret.get_errors().items()]
+            if errors:
+                raise GetEntitiesError(errors)
+
+        return ret
+
+    def _get_cached(self, names: Sequence[str]) -> List[Union[_CachedSeries, str]]:
+        with self._lock:
+            missing = [x for x in names if x.lower() not in self._series]
+        errors: Dict[str, str] = {}
+        if missing and self._api is not None:
+            downloaded = self._api.get_series(list(dict.fromkeys(missing)), raise_error=False)
+            self.add(*downloaded)
+            errors = {x.name.lower(): x.error_message or "" for x in downloaded if x.is_error}
+
+        ret: List[Union[_CachedSeries, str]] = []
+        with self._lock:
+            for name in names:
+                cached = self._series.get(name.lower())
+                ret.append(cached if cached else errors.get(name.lower()) or "The series is not in the engine")
+        return ret
+
+
+def _resolve_frequency(frequency: SeriesFrequency, frequencies: List[SeriesFrequency]) -> SeriesFrequency:
+    if frequency == SeriesFrequency.HIGHEST:
+        return max(frequencies)
+    if frequency == SeriesFrequency.LOWEST:
+        return min(frequencies)
+    return frequency
+
+
+def _to_keys(frequency: SeriesFrequency, days: "ndarray") -> "ndarray":
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    if frequency == SeriesFrequency.DAILY:
+        return days
+    if frequency == SeriesFrequency.WEEKLY:
+        return (days + 3) // 7
+    months = days.astype("datetime64[D]").astype("datetime64[M]").astype(numpy.int64)
+    return months // _MONTHS_PER_PERIOD[frequency]
+
+
+def _start_days(frequency: SeriesFrequency, keys: "ndarray") -> "ndarray":
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    if frequency == SeriesFrequency.DAILY:
+        return keys
+    if frequency == SeriesFrequency.WEEKLY:
+        return keys * 7 - 3
+    months = keys * _MONTHS_PER_PERIOD[frequency]
+    return months.astype("datetime64[M]").astype("datetime64[D]").astype(numpy.int64)
+
+
+def _in_weekdays(days: "ndarray", weekdays: int) -> "ndarray":
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    return (numpy.left_shift(1, (days + 4) % 7) & weekdays) != 0
+
+
+def _key_range(frequency: SeriesFrequency, weekdays: int, first: int, last: int) -> "ndarray":
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    keys = numpy.arange(first, last + 1, dtype=numpy.int64)
+    if frequency == SeriesFrequency.DAILY:
+        keys = keys[_in_weekdays(keys, weekdays)]
+    return keys
+
+
+def _next_keys(frequency: SeriesFrequency, weekdays: int, after: int, count: int) -> "ndarray":
+    if frequency == SeriesFrequency.DAILY:
+        return _key_range(frequency, weekdays, after + 1, after + 7 * (count + 1))[:count]
+    return _key_range(frequency, weekdays, after + 1, after + count)
+
+
+def _convert(
+    cached: _CachedSeries, entry: SeriesEntry, frequency: SeriesFrequency, weekdays: int
+) -> Tuple["ndarray", "ndarray"]:
+    if len(cached.days) == 0:
+        return cached.days, cached.values
+    if cached.frequency == frequency:
+        keys = _to_keys(frequency, cached.days)
+        if frequency != SeriesFrequency.DAILY:
+            return keys, cached.values
+        in_weekdays = _in_weekdays(keys, weekdays)
+        return keys[in_weekdays], cached.values[in_weekdays]
+    if cached.frequency > frequency:
+        return _to_lower_frequency(cached, entry, frequency)
+    return _to_higher_frequency(cached, entry, frequency, weekdays)
+
+
+def _to_lower_frequency(
+    cached: _CachedSeries, entry: SeriesEntry, frequency: SeriesFrequency
+) -> Tuple["ndarray", "ndarray"]:
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    method = entry.to_lower_frequency_method
+    if method == SeriesToLowerFrequencyMethod.CONDITIONAL_PERCENTAGE_CHANGE:
+        method = (
+            SeriesToLowerFrequencyMethod.PERCENTAGE_CHANGE if cached.is_pp100 else SeriesToLowerFrequencyMethod.AUTO
+        )
+    if method == SeriesToLowerFrequencyMethod.AUTO:
+        method = SeriesToLowerFrequencyMethod.FLOW if cached.is_flow else SeriesToLowerFrequencyMethod.AVERAGE
+
+    keys = _to_keys(frequency, cached.days)
+    unique_keys, aggregated = _aggregate(method, keys, cached.values)
+
+    partial_method = entry.partial_periods_method
+    if partial_method == SeriesPartialPeriodsMethod.PAST_RATE_OF_CHANGE:
+        raise ValueError("The partial periods method PAST_RATE_OF_CHANGE is not supported by the UnifiedSeriesEngine")
+
+    keep = numpy.ones(len(unique_keys), dtype=bool)
+    for group in sorted({0, len(unique_keys) - 1}):
+        in_group = keys == unique_keys[group]
+        expected = _source_keys_in_period(cached, frequency, int(unique_keys[group]))
+        source_keys = _to_keys(cached.frequency, cached.days[in_group])
+        before = int(numpy.searchsorted(expected, source_keys[0])) if group == 0 else 0
+        after = 0
+        if group == len(unique_keys) - 1:
+            after = len(expected) - int(numpy.searchsorted(expected, source_keys[-1], "right"))
+        if before == 0 and after == 0:
+            continue
+        if partial_method in (SeriesPartialPeriodsMethod.NONE, SeriesPartialPeriodsMethod.AUTO):
+            keep[group] = False
+        else:
+            padded = _pad_partial_period(partial_method, cached.values[in_group], before, after)
+            aggregated[group] = _aggregate(method, numpy.zeros(len(padded), dtype=numpy.int64), padded)[1][0]
+    return unique_keys[keep], aggregated[keep]
+
+
+def _source_keys_in_period(cached: _CachedSeries, frequency: SeriesFrequency, key: int) -> "ndarray":
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    first_day, end_day = _start_days(frequency, numpy.array([key, key + 1], dtype=numpy.int64)).tolist()
+    if cached.frequency == SeriesFrequency.DAILY:
+        return _key_range(SeriesFrequency.DAILY, cached.day_mask, first_day, end_day - 1)
+    first, last = _to_keys(cached.frequency, numpy.array([first_day, end_day - 1], dtype=numpy.int64)).tolist()
+    return numpy.arange(first, last + 1, dtype=numpy.int64)
+
+
+def _pad_partial_period(method: SeriesPartialPeriodsMethod, values: "ndarray", before: int, after: int) -> "ndarray":
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    valid = values[~numpy.isnan(values)]
+    if len(valid) == 0:
+        first = last = numpy.nan
+    elif method == SeriesPartialPeriodsMethod.REPEAT_LAST_VALUE:
+        first, last = valid[0], valid[-1]
+    elif method == SeriesPartialPeriodsMethod.FLOW_CURRENT_SUM:
+        first = last = valid.mean()
+    else:
+        first = last = 0.0
+    return numpy.concatenate([numpy.full(before, first), values, numpy.full(after, last)])
+
+
+def _aggregate(method: SeriesToLowerFrequencyMethod, keys: "ndarray", values: "ndarray") -> Tuple["ndarray", "ndarray"]:
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    unique_keys, group = numpy.unique(keys, return_inverse=True)
+    groups = len(unique_keys)
+    valid = ~numpy.isnan(values)
+    valid_group = group[valid]
+    valid_values = values[valid]
+    count = numpy.bincount(valid_group, minlength=groups)
+
+    result: "ndarray"
+    if method in (SeriesToLowerFrequencyMethod.FLOW, SeriesToLowerFrequencyMethod.AVERAGE):
+        result = numpy.bincount(valid_group, weights=valid_values, minlength=groups)
+        if method == SeriesToLowerFrequencyMethod.AVERAGE:
+            result = result / numpy.maximum(count, 1)
+    elif method == SeriesToLowerFrequencyMethod.PERCENTAGE_CHANGE:
+        result = numpy.expm1(numpy.bincount(valid_group, weights=numpy.log1p(valid_values / 100), minlength=groups))
+        result *= 100
+    elif method in (SeriesToLowerFrequencyMethod.FIRST, SeriesToLowerFrequencyMethod.LAST):
+        result = numpy.full(groups, numpy.nan)
+        if len(valid_group):
+            change = numpy.flatnonzero(numpy.diff(valid_group))
+            if method == SeriesToLowerFrequencyMethod.FIRST:
+                positions = numpy.concatenate([[0], change + 1])
+            else:
+                positions = numpy.concatenate([change, [len(valid_group) - 1]])
+            result[valid_group[positions]] = valid_values[positions]
+    elif method == SeriesToLowerFrequencyMethod.HIGHEST:
+        result = numpy.full(groups, -numpy.inf)
+        numpy.maximum.at(result, valid_group, valid_values)
+    elif method == SeriesToLowerFrequencyMethod.LOWEST:
+        result = numpy.full(groups, numpy.inf)
+        numpy.minimum.at(result, valid_group, valid_values)
+    else:
+        raise ValueError(f"The method {method.name} is not supported by the UnifiedSeriesEngine")
+
+    result[count == 0] = numpy.nan
+    return unique_keys, result
+
+
+def _to_higher_frequency(
+    cached: _CachedSeries, entry: SeriesEntry, frequency: SeriesFrequency, weekdays: int
+) -> Tuple["ndarray", "ndarray"]:
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    method = entry.to_higher_frequency_method
+    if method == SeriesToHigherFrequencyMethod.CONDITIONAL_PERCENTAGE_CHANGE:
+        method = (
+            SeriesToHigherFrequencyMethod.PERCENTAGE_CHANGE if cached.is_pp100 else SeriesToHigherFrequencyMethod.AUTO
+        )
+    if method == SeriesToHigherFrequencyMethod.AUTO:
+        method = SeriesToHigherFrequencyMethod.DISTRIBUTE if cached.is_flow else SeriesToHigherFrequencyMethod.SAME
+
+    source_keys = _to_keys(cached.frequency, cached.days)
+    first_day, end_day = _start_days(cached.frequency, source_keys[[0, -1]] + [0, 1]).tolist()
+    first, last = _to_keys(frequency, numpy.array([first_day, end_day - 1], dtype=numpy.int64)).tolist()
+    keys = _key_range(frequency, weekdays, first, last)
+
+    owners = _to_keys(cached.frequency, _start_days(frequency, keys))
+    positions = numpy.searchsorted(source_keys, owners)
+    found = (positions < len(source_keys)) & (source_keys[numpy.minimum(positions, len(source_keys) - 1)] == owners)
+    keys = keys[found]
+    positions = positions[found]
+    values = cached.values[positions]
+    counts = numpy.bincount(positions, minlength=len(source_keys))[positions]
+    is_first = numpy.concatenate([[True], numpy.diff(positions) != 0])
+
+    if method == SeriesToHigherFrequencyMethod.SAME:
+        return keys, values
+    if method == SeriesToHigherFrequencyMethod.DISTRIBUTE:
+        return keys, values / counts
+    if method == SeriesToHigherFrequencyMethod.PULSE:
+        return keys, numpy.where(is_first, values, numpy.nan)
+    if method == SeriesToHigherFrequencyMethod.PERCENTAGE_CHANGE:
+        return keys, numpy.expm1(numpy.log1p(values / 100) / counts) * 100
+    if method == SeriesToHigherFrequencyMethod.LINEAR_INTERPOLATION:
+        is_last = numpy.concatenate([numpy.diff(positions) != 0, [True]])
+        anchors = numpy.flatnonzero(is_last & ~numpy.isnan(values))
+        result = numpy.full(len(keys), numpy.nan)
+        if len(anchors):
+            index = numpy.arange(anchors[0], anchors[-1] + 1)
+            result[index] = numpy.interp(index, anchors, values[anchors])
+        return keys, result
+    raise ValueError(f"The method {method.name} is not supported by the UnifiedSeriesEngine")
+
+
+def _merge_calendars(
+    mode: CalendarMergeMode, frequency: SeriesFrequency, weekdays: int, calendars: List["ndarray"]
+) -> "ndarray":
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    non_empty = [x for x in calendars if len(x)]
+    if not non_empty:
+        return numpy.zeros(0, dtype=numpy.int64)
+    if mode == CalendarMergeMode.FULL_CALENDAR:
+        return _key_range(frequency, weekdays, min(int(x[0]) for x in non_empty), max(int(x[-1]) for x in non_empty))
+    if mode == CalendarMergeMode.AVAILABLE_IN_ALL:
+        if len(non_empty) != len(calendars):
+            return numpy.zeros(0, dtype=numpy.int64)
+        ret = non_empty[0]
+        for calendar in non_empty[1:]:
+            ret = numpy.intersect1d(ret, calendar, assume_unique=True)
+        return ret
+    return numpy.unique(numpy.concatenate(non_empty))
+
+
+def _align(row: "ndarray", calendar: "ndarray", keys: "ndarray", values: "ndarray") -> Tuple[int, int]:
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    if len(calendar) == 0 or len(keys) == 0:
+        return 0, 0
+    positions = numpy.searchsorted(calendar, keys)
+    found = (positions < len(calendar)) & (calendar[numpy.minimum(positions, len(calendar) - 1)] == keys)
+    row[positions[found]] = values[found]
+    return int(numpy.searchsorted(calendar, keys[0])), int(numpy.searchsorted(calendar, keys[-1], "right"))
+
+
+def _missing_value_method(entry: SeriesEntry, cached: _CachedSeries) -> SeriesMissingValueMethod:
+    if entry.missing_value_method == SeriesMissingValueMethod.AUTO:
+        return SeriesMissingValueMethod.ZERO_VALUE if cached.is_flow else SeriesMissingValueMethod.PREVIOUS_VALUE
+    return entry.missing_value_method
+
+
+def _fill_missing_values(row: "ndarray", span: Tuple[int, int], method: SeriesMissingValueMethod) -> None:
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    values = row[span[0] : span[1]]
+    missing = numpy.isnan(values)
+    if method == SeriesMissingValueMethod.NONE or not missing.any():
+        return
+    if method == SeriesMissingValueMethod.ZERO_VALUE:
+        values[missing] = 0
+        return
+    valid = numpy.flatnonzero(~missing)
+    if len(valid) == 0:
+        return
+    if method == SeriesMissingValueMethod.PREVIOUS_VALUE:
+        previous = numpy.maximum.accumulate(numpy.where(missing, -1, numpy.arange(len(values))))
+        values[previous >= 0] = values[previous[previous >= 0]]
+    elif method == SeriesMissingValueMethod.LINEAR_INTERPOLATION:
+        index = numpy.arange(valid[0], valid[-1] + 1)
+        values[index] = numpy.interp(index, valid, values[valid])
+
+
+def _data_range(matrix: "ndarray", mode: CalendarDateMode) -> Tuple[int, int]:
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    has_data = ~numpy.isnan(matrix)
+    with_data = has_data.any(axis=1)
+    if not with_data.any():
+        return 0, -1
+    has_data = has_data[with_data]
+    firsts = has_data.argmax(axis=1)
+    lasts = has_data.shape[1] - 1 - has_data[:, ::-1].argmax(axis=1)
+    if mode == CalendarDateMode.DATA_IN_ALL_SERIES and with_data.all():
+        return int(firsts.max()), int(lasts.min())
+    if mode == CalendarDateMode.DATA_IN_ALL_SERIES:
+        return 0, -1
+    return int(firsts.min()), int(lasts.max())
+
+
+def _parse_point(text: str) -> Union[None, Tuple[int, str], Tuple[date, date]]:
+    if not text:
+        return None
+    match = _match_relative_point(text)
+    if match:
+        return int(match.group(1)), match.group(2)
+    parts = [int(x) for x in text.split("-")]
+    if len(parts) == 1:
+        return date(parts[0], 1, 1), date(parts[0], 12, 31)
+    if len(parts) == 2:
+        return date(parts[0], parts[1], 1), date(parts[0], parts[1], monthrange(parts[0], parts[1])[1])
+    return date(parts[0], parts[1], parts[2]), date(parts[0], parts[1], parts[2])
+
+
+def _shift_day(day: int, count: int, unit: str) -> int:
+    if unit == "d":
+        return day + count
+    if unit == "w":
+        return day + 7 * count
+    months = count * {"m": 1, "q": 3, "y": 12}[unit]
+    time = _EPOCH + timedelta(days=day)
+    month = time.year * 12 + time.month - 1 + months
+    year, month = divmod(month, 12)
+    shifted = date(year, month + 1, min(time.day, monthrange(year, month + 1)[1]))
+    return (shifted - _EPOCH).days
+
+
+def _trim(
+    frequency: SeriesFrequency,
+    weekdays: int,
+    calendar: "ndarray",
+    matrix: "ndarray",
+    start_point: Optional[StartOrEndPoint],
+    end_point: Optional[StartOrEndPoint],
+) -> Tuple["ndarray", "ndarray", int, int]:
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    if len(calendar) == 0:
+        return calendar, matrix, 0, -1
+
+    end_mode = end_point.mode if end_point else CalendarDateMode.DATA_IN_ANY_SERIES
+    start_mode = start_point.mode if start_point else CalendarDateMode.DATA_IN_ANY_SERIES
+    start, _ = _data_range(matrix, start_mode)
+    _, end = _data_range(matrix, end_mode)
+
+    calendar, end = _end_of(frequency, weekdays, calendar, end, _parse_point(end_point.time if end_point else ""))
+    # The end point is before the first date, so there is nothing to shift a relative start point from
+    if end < 0:
+        return calendar, matrix, 0, -1
+
+    if len(calendar) > matrix.shape[1]:
+        padding = numpy.full((matrix.shape[0], len(calendar) - matrix.shape[1]), numpy.nan)
+        matrix = numpy.concatenate([matrix, padding], axis=1)
+
+    parsed = _parse_point(start_point.time if start_point else "")
+    if isinstance(parsed, tuple) and isinstance(parsed[0], int):
+        count, unit = parsed
+        if unit:
+            shifted = _shift_day(int(_start_days(frequency, calendar[end : end + 1])[0]), count, unit)
+            start = int(numpy.searchsorted(_start_days(frequency, calendar), shifted))
+        else:
+            start = end + count
+    elif isinstance(parsed, tuple):
+        start = int(numpy.searchsorted(_start_days(frequency, calendar), (parsed[0] - _EPOCH).days))
+
+    if start > end:
+        return calendar, matrix, 0, -1
+    return calendar, matrix, max(start, 0), end
+
+
+# Returns the calendar, extended if the end point is after it, and the index of the end point in it
+def _end_of(
+    frequency: SeriesFrequency,
+    weekdays: int,
+    calendar: "ndarray",
+    end: int,
+    parsed: Union[None, Tuple[int, str], Tuple[date, date]],
+) -> Tuple["ndarray", int]:
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    end_key: Optional[int] = None
+    if isinstance(parsed, tuple) and isinstance(parsed[0], int):
+        count, unit = parsed
+        if end < 0:
+            return calendar, end
+        if unit:
+            shifted = _shift_day(int(_start_days(frequency, calendar[end : end + 1])[0]), count, unit)
+            end_key = int(_to_keys(frequency, numpy.array([shifted], dtype=numpy.int64))[0])
+        else:
+            end += count
+            if end >= len(calendar):
+                extra = _next_keys(frequency, weekdays, int(calendar[-1]), end - len(calendar) + 1)
+                calendar = numpy.concatenate([calendar, extra])
+    elif isinstance(parsed, tuple):
+        end_key = int(_to_keys(frequency, numpy.array([(parsed[1] - _EPOCH).days], dtype=numpy.int64))[0])
+    if end_key is not None:
+        if end_key > calendar[-1]:
+            calendar = numpy.concatenate([calendar, _key_range(frequency, weekdays, int(calendar[-1]) + 1, end_key)])
+        end = int(numpy.searchsorted(calendar, end_key, "right")) - 1
+    return calendar, end
+
+
+def _to_datetime(day: int, tz: Optional[tzinfo]) -> datetime:
+    time = _EPOCH + timedelta(days=day)
+    return datetime(time.year, time.month, time.day, tzinfo=tz)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+import gzip
+from io import BufferedReader, BytesIO
+from json import dumps as json_dumps
+from time import perf_counter
+from typing import Any, Iterator, List, Optional, Sequence
+
+import ijson
+from requests import Response
+from urllib3 import HTTPResponse
+
+from macrobond_data_api.web.session import _ResponseAsFileObject
+
+
+class _IterContentFileObject:
+    # The adapter used before _ResponseAsFileObject, kept for comparison
+    def __init__(self, response: Response, chunk_size: int = 65536) -> None:
+        self.data = response.iter_content(chunk_size=chunk_size)
+
+    def read(self, n: int) -> bytes:
+        if n == 0:
+            return b""
+        return next(self.data, b"")
+
+
+def _body(size_MB: int) -> bytes:
+    item = {
+        "metadata": {"PrimName": "series", "Description": "Benchmark series", "Frequency": "monthly"},
+        "values": [x * 1.25 for x in range(400)],
+        "dates": [f"{1990 + x // 12}-{x % 12 + 1:02}-01T00:00:00" for x in range(400)],
+    }
+    one = bytes(json_dumps(item), "utf-8")
+    count = max(1, size_MB * 1024 * 1024 // (len(one) + 1))
+    return b"[" + b",".join([one] * count) + b"]"
+
+
+def _response(body: bytes, gzipped: bool) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.raw = HTTPResponse(
+        BytesIO(body),
+        headers={"Content-Encoding": "gzip"} if gzipped else {},
+        preload_content=False,
+    )
+    return response
+
+
+def _backends(names: Sequence[str]) -> Iterator[Any]:
+    for name in names:
+        try:
+            yield ijson.get_backend(name)
+        except ImportError:
+            print(f"ijson backend {name} is not available")
+
+
+def ijson_backend_benchmark(
+    size_MB: int = 200, backends: Optional[Sequence[str]] = None, buffer_sizes: Optional[Sequence[int]] = None
+) -> None:
+    """
+    Compare the time to parse a streamed response with every available ijson backend, using the previous
+    iter_content adapter and the buffered `io.RawIOBase` adapter that `macrobond_data_api.web.session.Session` uses.
+    The responses are served from memory through urllib3, plain and gzip compressed.
+
+    Parameters
+    ----------
+    size_MB : int, Optional
+        The size of the uncompressed JSON document, default to `200`.
+
+    backends : Sequence[str], Optional
+        The ijson backends to use, default to `["yajl2_c", "yajl2_cffi", "yajl2", "python"]`.
+
+    buffer_sizes : Sequence[int], Optional
+        The buffer sizes of the buffered adapter, default to `[65536, 1048576]`.
+    """
+    print(f"Generating {size_MB} MB")
+    body = _body(size_MB)
+    compressed = gzip.compress(body, 1)
+
+    sizes = buffer_sizes if buffer_sizes else [65536, 1024 * 1024]
+    for backend in _backends(backends if backends else ["yajl2_c", "yajl2_cffi", "yajl2", "python"]):
+        for gzipped in (False, True):
+            data = compressed if gzipped else body
+            rows: List[str] = []
+
+            start = perf_counter()
+            count = sum(1 for _ in backend.items(_IterContentFileObject(_response(data, gzipped)), "item"))
+            rows.append(f"iter_content {perf_counter() - start:.2f}s")
+
+            for size in sizes:
+                start = perf_counter()
+                file_object = BufferedReader(_ResponseAsFileObject(_response(data, gzipped)), size)
+                count = sum(1 for _ in backend.items(file_object, "item"))
+                rows.append(f"buffered {size // 1024} kB {perf_counter() - start:.2f}s")
+
+            encoding = "gzip" if gzipped else "plain"
+            print(f"{backend.backend_name:<12}{encoding:<7}{count} items  " + "  ".join(rows))
+
+
+if __name__ == "__main__":
+    ijson_backend_benchmark()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+from datetime import datetime, timedelta, timezone
+from random import Random
+from timeit import Timer
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, cast
+
+from macrobond_data_api.web.json_codec import JsonCodec, get_json_codec
+from macrobond_data_api.web._web_api_series import _create_series
+
+if TYPE_CHECKING:  # pragma: no cover
+    from macrobond_data_api.web.session import Session
+
+
+def _metadata(random: Random, i: int) -> Dict[str, Any]:
+    return {
+        "PrimName": f"series{i}",
+        "Description": "Benchmark series " * 4,
+        "Frequency": "monthly",
+        "Region": ["us"],
+        "Currency": "usd",
+        "Class": "stock",
+        "DisplayUnit": random.randint(0, 10),
+        "FullDescription": "Benchmark series with a longer description " * 4,
+        "LastModifiedTimeStamp": "2024-01-02T03:04:05.678Z",
+        "StartDate": "1990-01-01T00:00:00",
+    }
+
+
+def _fetch_series(random: Random, count: int, length: int) -> List[Dict[str, Any]]:
+    start = datetime(1990, 1, 1, tzinfo=timezone.utc)
+    dates = [(start + timedelta(days=30 * x)).isoformat() for x in range(length)]
+    return [
+        {
+            "values": [random.uniform(-1000, 1000) if random.random() > 0.05 else None for _ in range(length)],
+            "dates": dates,
+            "metadata": _metadata(random, i),
+        }
+        for i in range(count)
+    ]
+
+
+def _unified_series(random: Random, count: int, length: int) -> Dict[str, Any]:
+    start = datetime(1990, 1, 1)
+    return {
+        "dates": [(start + timedelta(days=x)).isoformat() for x in range(length)],
+        "series": [
+            {
+                "values": [round(random.uniform(0, 100), 4) for _ in range(length)],
+                "metadata": _metadata(random, i),
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def _search(random: Random, count: int) -> Dict[str, Any]:
+    return {"isTruncated": False, "entities": [_metadata(random, i) for i in range(count)]}
+
+
+def _payloads() -> Dict[str, Any]:
+    random = Random(1)
+    return {
+        "fetchseries 100 x 400": _fetch_series(random, 100, 400),
+        "fetchseries 10 x 10000": _fetch_series(random, 10, 10000),
+        "fetchunifiedseries 50 x 2000": _unified_series(random, 50, 2000),
+        "search 1000 entities": _search(random, 1000),
+    }
+
+
+def _codecs(names: Sequence[str]) -> List[JsonCodec]:
+    codecs: List[JsonCodec] = []
+    for name in names:
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            print(f"{name} is not installed")
+    return codecs
+
+
+def _best(timer: Timer, repeat: int) -> float:
+    number = timer.autorange()[0]
+    return min(timer.repeat(repeat, number)) / number
+
+
+def json_codec_benchmark(codecs: Optional[Sequence[str]] = None, repeat: int = 5) -> None:
+    """
+    Compare the JSON codecs that can be used by `macrobond_data_api.web.session.Session` on generated payloads
+    shaped like the responses of the Web API.
+
+    Parameters
+    ----------
+    codecs : Sequence[str], Optional
+        The names of the codecs to compare, default to `["json", "orjson", "msgspec"]`.
+        Codecs that are not installed are skipped.
+
+    repeat : int, Optional
+        The number of times each measurement is repeated, the best time is used. Default to `5`.
+    """
+    selected = _codecs(codecs if codecs else ["json", "orjson", "msgspec"])
+    baseline = selected[0]
+    print(
+        f"{'payload':<32}{'size':>10}  " + "".join(f"{x.name + ' loads':>16}{x.name + ' dumps':>16}" for x in selected)
+    )
+    for name, payload in _payloads().items():
+        data = baseline.dumps(payload)
+        row = f"{name:<32}{len(data) / 1024 / 1024:>8.2f}MB  "
+        for codec in selected:
+            if codec.loads(codec.dumps(payload)) != baseline.loads(data):
+                print(f"{codec.name} does not round trip {name}")
+            loads = _best(Timer(lambda: codec.loads(data)), repeat)  # pylint: disable=cell-var-from-loop
+            dumps = _best(Timer(lambda: codec.dumps(payload)), repeat)  # pylint: disable=cell-var-from-loop
+            row += f"{loads * 1000:>14.2f}ms{dumps * 1000:>14.2f}ms"
+        print(row)
+
+    _typed_decoding_benchmark(repeat)
+
+
+class _BenchmarkSession:
+    def _create_metadata(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return data or {}
+
+
+def _typed_decoding_benchmark(repeat: int) -> None:
+    try:
+        from macrobond_data_api.web._msgspec_decoding import (  # pylint: disable=import-outside-toplevel
+            _decode_series,
+        )
+    except ImportError:
+        return
+
+    session = cast("Session", _BenchmarkSession())
+    for count, length in ((200, 400), (200, 2000)):
+        data = get_json_codec("json").dumps(_fetch_series(Random(1), count, length))
+        names = [f"series{i}" for i in range(count)]
+        codecs = [get_json_codec(x) for x in ("json", "orjson")]
+        row = f"{f'{count} series x {length}':<24}"
+        for codec in codecs:
+            time = _best(
+                Timer(
+                    lambda: [
+                        _create_series(x, y, session)  # pylint: disable=cell-var-from-loop
+                        for x, y in zip(codec.loads(data), names)  # pylint: disable=cell-var-from-loop
+                    ]
+                ),
+                repeat,
+            )
+            row += f"{codec.name + ' + _create_series':>28}{time * 1000:>10.2f}ms"
+        time = _best(Timer(lambda: _decode_series(data, names, session)), repeat)  # pylint: disable=cell-var-from-loop
+        row += f"{'msgspec typed':>28}{time * 1000:>10.2f}ms"
+        print(row)
+
+
+if __name__ == "__main__":
+    json_codec_benchmark()
@@ -3,3 +3,7 @@ from .web_api import WebApi
 from .configuration import Configuration
 from .web_client import WebClient
 from .data_package_list_poller import DataPackageListPoller
+from .async_data_package_list_poller import AsyncDataPackageListPoller
+from .async_subscription_list import AsyncSubscriptionList
+from .unified_series_cache import UnifiedSeriesCache
+from .json_codec import JsonCodec
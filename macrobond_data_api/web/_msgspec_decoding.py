@@ -0,0 +1,101 @@
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, cast
+
+import msgspec  # pylint: disable=import-error
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import Entity, LazySeries, Metadata, Series
+from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .session import _MetadataCreator
+
+# Typed schemas of EntityResponse and SeriesResponse. msgspec converts the values while decoding, so the list is used
+# as it is in the Series. The dates are parsed with _parse_iso8601 like with the other codecs, since msgspec rounds
+# fractions of seconds with more than six digits and rejects dates without a time.
+
+
+class _EntityStruct(msgspec.Struct, rename="camel"):
+    error_text: Optional[str] = None
+    error_code: Optional[int] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+
+class _SeriesStruct(_EntityStruct, rename="camel"):
+    values: Optional[List[Optional[float]]] = None
+    dates: Optional[List[str]] = None
+
+
+class _RawSeriesStruct(msgspec.Struct, rename="camel"):
+    # The parts of the series are kept as JSON text and decoded by LazySeries when they are used
+    error_text: Optional[str] = None
+    error_code: Optional[int] = None
+    metadata: msgspec.Raw = msgspec.Raw()
+    values: msgspec.Raw = msgspec.Raw()
+    dates: msgspec.Raw = msgspec.Raw()
+
+
+_entities_decoder = msgspec.json.Decoder(List[_EntityStruct])
+_series_decoder = msgspec.json.Decoder(List[_SeriesStruct])
+_raw_series_decoder = msgspec.json.Decoder(List[_RawSeriesStruct])
+_values_decoder = msgspec.json.Decoder(Optional[List[Optional[float]]])
+_dates_decoder = msgspec.json.Decoder(Optional[List[str]])
+_metadata_decoder = msgspec.json.Decoder(Optional[Dict[str, Any]])
+
+
+def _decode_entities(content: bytes, names: Sequence[str], session: "_MetadataCreator") -> List[Entity]:
+    ret: List[Entity] = []
+    for entity, name in zip(_entities_decoder.decode(content), names):
+        if entity.error_text:
+            ret.append(Entity(name, entity.error_text, StatusCode(cast(int, entity.error_code)), None))
+        else:
+            metadata = session._create_metadata(entity.metadata)
+            ret.append(Entity(name, None, StatusCode.OK, cast(Dict[str, Any], metadata)))
+    return ret
+
+
+def _decode_series(content: bytes, names: Sequence[str], session: "_MetadataCreator") -> List[Series]:
+    ret: List[Series] = []
+    for series, name in zip(_series_decoder.decode(content), names):
+        if series.error_text:
+            ret.append(
+                Series(name, series.error_text, StatusCode(cast(int, series.error_code)), None, None, None, None)
+            )
+        else:
+            metadata = session._create_metadata(series.metadata)
+            dates = [_parse_iso8601(x) for x in series.dates] if series.dates is not None else None
+            ret.append(Series(name, "", StatusCode.OK, metadata, None, series.values, dates))
+    return ret
+
+
+def _decode_lazy_series(content: bytes, names: Sequence[str], session: "_MetadataCreator") -> List[Series]:
+    ret: List[Series] = []
+    for series, name in zip(_raw_series_decoder.decode(content), names):
+        if series.error_text:
+            ret.append(
+                Series(name, series.error_text, StatusCode(cast(int, series.error_code)), None, None, None, None)
+            )
+        else:
+            ret.append(
+                LazySeries(
+                    name,
+                    partial(_decode_raw, _values_decoder, series.values),
+                    partial(_decode_dates, series.dates),
+                    partial(_decode_metadata, series.metadata, session),
+                )
+            )
+    return ret
+
+
+def _decode_raw(decoder: Any, raw: msgspec.Raw) -> Any:
+    # An empty Raw is a missing or null field
+    return decoder.decode(raw) or [] if raw else []
+
+
+def _decode_dates(raw: msgspec.Raw) -> List[datetime]:
+    return [_parse_iso8601(x) for x in _decode_raw(_dates_decoder, raw)]
+
+
+def _decode_metadata(raw: msgspec.Raw, session: "_MetadataCreator") -> Metadata:
+    return session._create_metadata(_metadata_decoder.decode(raw) if raw else None)
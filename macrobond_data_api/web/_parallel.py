@@ -0,0 +1,191 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from queue import Full, Queue
+from threading import Event
+from typing import Callable, Deque, Iterable, Iterator, List, Tuple, TypeVar, Union
+
+ParallelItemTypeVar = TypeVar("ParallelItemTypeVar")
+ParallelResultTypeVar = TypeVar("ParallelResultTypeVar")
+
+
+def parallel_map(
+    func: Callable[[ParallelItemTypeVar], ParallelResultTypeVar],
+    items: Iterable[ParallelItemTypeVar],
+    max_workers: int,
+) -> Iterator[ParallelResultTypeVar]:
+    """
+    Like `map`, but calls func on up to max_workers threads. The results are returned in the order of the items and
+    at most max_workers items are in flight, so the items are consumed lazily. Exceptions are raised in order.
+    """
+    for _, future in _parallel_submit(func, items, max_workers, False):
+        yield future.result()
+
+
+def parallel_as_completed(
+    func: Callable[[ParallelItemTypeVar], ParallelResultTypeVar],
+    items: Iterable[ParallelItemTypeVar],
+    max_workers: int,
+) -> Iterator[Tuple[ParallelItemTypeVar, "Future[ParallelResultTypeVar]"]]:
+    """
+    Calls func on up to max_workers threads and returns each item together with its completed future, in the order
+    they complete. At most max_workers items are in flight, so the items are consumed lazily.
+    """
+    return _parallel_submit(func, items, max_workers, True)
+
+
+def _parallel_submit(
+    func: Callable[[ParallelItemTypeVar], ParallelResultTypeVar],
+    items: Iterable[ParallelItemTypeVar],
+    max_workers: int,
+    as_completed: bool,
+) -> Iterator[Tuple[ParallelItemTypeVar, "Future[ParallelResultTypeVar]"]]:
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    if max_workers == 1:
+        for item in items:
+            future: "Future[ParallelResultTypeVar]" = Future()
+            try:
+                future.set_result(func(item))
+            except Exception as ex:  # pylint: disable=broad-except
+                future.set_exception(ex)
+            yield item, future
+        return
+
+    item_iterator = iter(items)
+    in_flight: Deque[Tuple[ParallelItemTypeVar, "Future[ParallelResultTypeVar]"]] = deque()
+    with ThreadPoolExecutor(max_workers) as executor:
+        try:
+            for item in item_iterator:
+                in_flight.append((item, executor.submit(func, item)))
+                if len(in_flight) == max_workers:
+                    break
+
+            while in_flight:
+                if as_completed:
+                    index = _wait_for_first(in_flight)
+                    completed = in_flight[index]
+                    del in_flight[index]
+                else:
+                    completed = in_flight.popleft()
+                    completed[1].exception()
+
+                for item in item_iterator:
+                    in_flight.append((item, executor.submit(func, item)))
+                    break
+
+                yield completed
+        finally:
+            for _, pending in in_flight:
+                pending.cancel()
+
+
+def parallel_decode(
+    fetch: Callable[[ParallelItemTypeVar], bytes],
+    decode: Callable[[ParallelItemTypeVar, bytes], ParallelResultTypeVar],
+    items: Iterable[ParallelItemTypeVar],
+    max_workers: int,
+    executor: Executor,
+) -> Iterator[Tuple[ParallelItemTypeVar, "Future[ParallelResultTypeVar]"]]:
+    """
+    Calls fetch on up to max_workers threads and then decode with the item and the fetched bytes on executor,
+    typically a `concurrent.futures.ProcessPoolExecutor`, so decoding is not limited by the GIL. decode and the items
+    must be picklable for a process pool. Each item is returned together with the future of its result, in the order
+    of the items. If fetch raises, the future holds that exception. At most max_workers fetched items wait for
+    decode, so memory stays bounded.
+    """
+    in_flight: Deque[Tuple[ParallelItemTypeVar, "Future[ParallelResultTypeVar]"]] = deque()
+    try:
+        for item, fetched in _parallel_submit(fetch, items, max_workers, False):
+            exception = fetched.exception()
+            if exception is not None:
+                failed: "Future[ParallelResultTypeVar]" = Future()
+                failed.set_exception(exception)
+                in_flight.append((item, failed))
+            else:
+                in_flight.append((item, executor.submit(decode, item, fetched.result())))
+            if len(in_flight) > max_workers:
+                yield in_flight.popleft()
+        while in_flight:
+            yield in_flight.popleft()
+    finally:
+        for _, pending in in_flight:
+            pending.cancel()
+
+
+def _wait_for_first(in_flight: Deque[Tuple[ParallelItemTypeVar, "Future[ParallelResultTypeVar]"]]) -> int:
+    for index, (_, future) in enumerate(in_flight):
+        if future.done():
+            return index
+    wait([x[1] for x in in_flight], return_when=FIRST_COMPLETED)
+    for index, (_, future) in enumerate(in_flight):
+        if future.done():
+            return index
+    raise Exception("no future completed")  # pragma: no cover
+
+
+class _StreamEnd:
+    __slots__ = ()
+
+
+def parallel_stream(
+    func: Callable[[ParallelItemTypeVar], Iterable[ParallelResultTypeVar]],
+    items: Iterable[ParallelItemTypeVar],
+    max_workers: int,
+    on_error: Callable[[ParallelItemTypeVar, int, Exception], Iterable[ParallelResultTypeVar]],
+    buffer_size: int = 0,
+) -> Iterator[ParallelResultTypeVar]:
+    """
+    Iterates func over up to max_workers items at the same time and returns the results as they are produced.
+    The results are passed through a queue of buffer_size results, max_workers * 4 by default, so a slow consumer
+    makes the workers wait instead of buffering whole responses.
+    If func raises, on_error is called with the item, the number of results it produced and the exception, and the
+    results of on_error are returned instead. This isolates the items from each other.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    queue: "Queue[Union[ParallelResultTypeVar, _StreamEnd]]" = Queue(buffer_size or max_workers * 4)
+    stop = Event()
+    end = _StreamEnd()
+
+    def put(result: Union[ParallelResultTypeVar, _StreamEnd]) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(result, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def work(item: ParallelItemTypeVar) -> None:
+        count = 0
+        try:
+            try:
+                for result in func(item):
+                    if not put(result):
+                        return
+                    count += 1
+            except Exception as ex:  # pylint: disable=broad-except
+                for result in on_error(item, count, ex):
+                    if not put(result):
+                        return
+        finally:
+            put(end)
+
+    executor = ThreadPoolExecutor(max_workers)
+    futures: List["Future[None]"] = []
+    try:
+        futures = [executor.submit(work, x) for x in items]
+        remaining = len(futures)
+        while remaining > 0:
+            result = queue.get()
+            if isinstance(result, _StreamEnd):
+                remaining -= 1
+            else:
+                yield result
+    finally:
+        stop.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
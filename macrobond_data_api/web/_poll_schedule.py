@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from .web_types.data_package_list_state import DataPackageListState
+
+
+def _seconds_until(time: datetime) -> float:
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=timezone.utc)
+    return (time - datetime.now(timezone.utc)).total_seconds()
+
+
+def _error_delay(attempt: int, on_error_delay: float, max_on_error_delay: float) -> float:
+    return min(max_on_error_delay, on_error_delay * 2 ** (attempt - 1))
+
+
+class _PollSchedule:
+    """
+    Keeps track of the poll interval of a poller.
+    The interval is halved, down to min_delay, when a poll finds changes and doubled, up to max_delay, when it does
+    not, so that a busy list is polled often and a quiet list rarely. It starts from the interval saved from a
+    previous run, or from max_delay, and the first poll is counted like the others.
+    """
+
+    __slots__ = ("interval",)
+
+    def __init__(self, interval: Optional[float] = None) -> None:
+        self.interval = interval
+
+    def next_delay(
+        self,
+        state: Optional[DataPackageListState],
+        change_count: int,
+        min_delay: float,
+        max_delay: float,
+        incomplete_delay: float,
+        download_full_list_on_or_after: Optional[datetime] = None,
+    ) -> float:
+        if state == DataPackageListState.INCOMPLETE:
+            delay = incomplete_delay
+        else:
+            interval = self.interval if self.interval is not None else max_delay
+            if state == DataPackageListState.UP_TO_DATE:
+                interval = interval / 2 if change_count > 0 else interval * 2
+            self.interval = min(max(interval, min_delay), max_delay)
+            delay = self.interval
+
+        if download_full_list_on_or_after is not None:
+            delay = min(delay, _seconds_until(download_full_list_on_or_after))
+
+        return max(0.0, delay)
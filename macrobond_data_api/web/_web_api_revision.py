@@ -1,5 +1,7 @@
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence, cast
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, List, Optional, Sequence, Tuple, cast
 
 import ijson
 
@@ -14,13 +16,20 @@ from macrobond_data_api.common.types import (
     VintageValues,
     RevisionHistoryRequest,
     ValuesMetadata,
+    CompactVintageValues,
+    VintageMatrixResult,
+    NthReleasesResult,
+    SeriesObservationHistoryResult,
 )
+from macrobond_data_api.common.types.compact_vintage_values import _CompactVintageValuesBuilder
 from macrobond_data_api.common.enums import StatusCode
 from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
 from macrobond_data_api.common.types._repr_html_sequence import _ReprHtmlSequence
 from ._split_in_to_chunks import split_in_to_chunks
+from ._parallel import parallel_as_completed, parallel_decode, parallel_map, parallel_stream
 
-from .session import ProblemDetailsException, Session
+from .json_codec import get_json_codec
+from .session import ProblemDetailsException, Session, _DictMetadataSession, _MetadataCreator
 
 if TYPE_CHECKING:  # pragma: no cover
     from .web_api import WebApi
@@ -31,6 +40,7 @@ if TYPE_CHECKING:  # pragma: no cover
         RevisionHistoryRequest as WebRevisionHistoryRequest,
         SeriesWithTimesOfChangeResponse,
         VintageValuesResponse,
+        SeriesObservationHistoryResponse,
     )
 
 
@@ -38,7 +48,18 @@ def _optional_str_to_datetime(datetime_str: Optional[str]) -> Optional[datetime]
     return _parse_iso8601(datetime_str) if datetime_str else None
 
 
-def get_revision_info(self: "WebApi", *series_names: str, raise_error: Optional[bool] = None) -> Sequence[RevisionInfo]:
+def get_revision_info(
+    self: "WebApi", *series_names: str, raise_error: Optional[bool] = None, chunk_size: int = 200, max_workers: int = 4
+) -> Sequence[RevisionInfo]:
+    """
+    Get information about if revision history is available for a series and a list of revision timestamps.
+    See `macrobond_data_api.common.api.Api.get_revision_info`.
+
+    The names are requested in chunks of chunk_size series, since all names of a request are sent in the query
+    string. When there is more than one chunk, up to max_workers chunks are downloaded at the same time. The result
+    is in the same order as in the request.
+    """
+
     def to_obj(name: str, serie: "SeriesWithRevisionsInfoResponse") -> RevisionInfo:
         error_text = serie.get("errorText")
         if error_text:
@@ -62,7 +83,14 @@ def get_revision_info(self: "WebApi", *series_names: str, raise_error: Optional[
             vintage_time_stamps,
         )
 
-    response = self.session.series.get_revision_info(*series_names)
+    chunks = list(split_in_to_chunks(series_names, chunk_size))
+    response = [
+        x
+        for chunk in parallel_map(
+            lambda x: self.session.series.get_revision_info(*x), chunks, max(1, min(max_workers, len(chunks)))
+        )
+        for x in chunk
+    ]
 
     if self.raise_error if raise_error is None else raise_error:
         GetEntitiesError._raise_if([(x, y.get("errorText")) for x, y in zip(series_names, response)])
@@ -132,6 +160,114 @@ def get_vintage_series(
     return _ReprHtmlSequence(series)
 
 
+def get_vintage_series_many(
+    self: "WebApi",
+    times: Sequence[datetime],
+    series_names: Sequence[str],
+    max_workers: int = 1,
+    raise_error: Optional[bool] = None,
+) -> Generator[VintageMatrixResult, None, None]:
+    """
+    Get the vintages of one or more series as of many points in time.
+
+    Unlike `get_vintage_series`, which makes one request per point in time, this downloads the complete revision
+    history of each series once and looks up the vintage for each point in time locally with a binary search over
+    the vintage time stamps. A point in time gets the latest vintage recorded at or before it.
+
+    This requires numpy, which is installed together with pandas.
+
+    Parameters
+    ----------
+    times : Sequence[datetime]
+        The points in time.
+    series_names : Sequence[str]
+        The names of the series.
+    max_workers : int
+        The maximum number of chunks of series downloaded at the same time. See `get_many_series_with_revisions`.
+    raise_error : bool
+        If True, an exception is raised when a series could not be downloaded.
+
+    Returns
+    -------
+    Generator[`macrobond_data_api.common.types.vintage_matrix.VintageMatrixResult`]
+        One result per series with a `macrobond_data_api.common.types.vintage_matrix.VintageMatrix` that has one row
+        per observation date and one column per point in time. The results are returned as they are downloaded.
+    """
+    for name, series in _get_compact_revision_histories(self, series_names, max_workers, raise_error):
+        if series.status_code != StatusCode.OK:
+            yield VintageMatrixResult(name, series.error_text, series.status_code, None)
+            continue
+        matrix = cast(CompactVintageValues, series.vintages).to_vintage_matrix()
+        yield VintageMatrixResult(name, None, StatusCode.OK, matrix.as_of_many(times))
+
+
+def get_nth_releases(
+    self: "WebApi",
+    nths: Iterable[int],
+    series_names: Sequence[str],
+    include_times_of_change: bool = False,
+    max_workers: int = 1,
+    raise_error: Optional[bool] = None,
+) -> Generator[NthReleasesResult, None, None]:
+    """
+    Get many releases of one or more series.
+
+    Unlike `get_nth_release`, which makes one request per release, this downloads the complete revision history of
+    each series once and finds all requested releases locally in one pass over the vintages. A new release is
+    counted each time the value of an observation changes from one vintage to the next.
+
+    This requires numpy, which is installed together with pandas.
+
+    Parameters
+    ----------
+    nths : Iterable[int]
+        The releases to get, where 0 is the first release. For example `range(13)`.
+    series_names : Sequence[str]
+        The names of the series.
+    include_times_of_change : bool
+        If True, the time of change of each release is included.
+    max_workers : int
+        The maximum number of chunks of series downloaded at the same time. See `get_many_series_with_revisions`.
+    raise_error : bool
+        If True, an exception is raised when a series could not be downloaded.
+
+    Returns
+    -------
+    Generator[`macrobond_data_api.common.types.vintage_matrix.NthReleasesResult`]
+        One result per series with one array per release aligned to the same observation dates.
+        The results are returned as they are downloaded.
+    """
+    nths = list(nths)
+    for name, series in _get_compact_revision_histories(self, series_names, max_workers, raise_error):
+        if series.status_code != StatusCode.OK:
+            yield NthReleasesResult(name, series.error_text, series.status_code, [], {}, None)
+            continue
+
+        matrix = cast(CompactVintageValues, series.vintages).to_vintage_matrix()
+        columns = matrix.nth_release_columns(nths)
+        releases = matrix._values_at_columns(columns)
+        times_of_change = None
+        if include_times_of_change:
+            times = matrix.vintage_time_stamps
+            times_of_change = {nth: [times[x] if x >= 0 else None for x in y.tolist()] for nth, y in columns.items()}
+        yield NthReleasesResult(name, None, StatusCode.OK, matrix.dates, releases, times_of_change)
+
+
+def _get_compact_revision_histories(
+    self: "WebApi", series_names: Sequence[str], max_workers: int, raise_error: Optional[bool]
+) -> Generator[Tuple[str, SeriesWithVintages], None, None]:
+    raise_error = self.raise_error if raise_error is None else raise_error
+    requests = [RevisionHistoryRequest(x) for x in series_names]
+    for request, series in zip(
+        requests,
+        self.get_many_series_with_revisions(requests, include_not_modified=True, max_workers=max_workers, compact=True),
+    ):
+        name = series.name or request.name
+        if raise_error and series.status_code != StatusCode.OK:
+            GetEntitiesError._raise_if([(name, series.error_text or str(series.status_code))])
+        yield name, series
+
+
 def get_one_nth_release(
     self: "WebApi",
     nth: int,
@@ -224,16 +360,60 @@ def get_observation_history(self: "WebApi", series_name: str, *times: datetime)
             raise Exception(ex.detail) from ex
         raise ex
 
-    return _ReprHtmlSequence(
-        [
-            SeriesObservationHistory(
-                _parse_iso8601(x["observationDate"]),
-                [float(y) if y is not None else y for y in x["values"]],
-                [_optional_str_to_datetime(y) for y in x["timeStamps"]],
-            )
-            for x in response
-        ]
-    )
+    return _ReprHtmlSequence(_create_observation_history(response))
+
+
+def get_observation_history_many(
+    self: "WebApi", requests: Iterable[Tuple[str, Sequence[datetime]]], max_workers: int = 4
+) -> Generator[SeriesObservationHistoryResult, None, None]:
+    """
+    Get the history of observations in many series.
+    The requests are sent over the shared session with up to max_workers requests at the same time and the results
+    are returned as they complete, so they are not in the order of the requests.
+    An error for one series, such as a series that is not found, is returned in the result for that series instead
+    of being raised.
+
+    Parameters
+    ----------
+    requests : Iterable[Tuple[str, Sequence[datetime]]]
+        The name of each series and the dates of the observations to get the history of.
+    max_workers : int
+        The maximum number of requests in flight at the same time.
+
+    Returns
+    -------
+    Generator[`macrobond_data_api.common.types.series_observation_history.SeriesObservationHistoryResult`]
+    """
+    session = self.session
+
+    def fetch(request: Tuple[str, Sequence[datetime]]) -> SeriesObservationHistoryResult:
+        name, times = request
+        try:
+            response = session.series.fetch_observation_history(name, list(times))
+        except ProblemDetailsException as ex:
+            status_code = StatusCode(ex.status) if ex.status in {x.value for x in StatusCode} else StatusCode.OTHER
+            return SeriesObservationHistoryResult(name, ex.detail or str(ex), status_code, [])
+        return SeriesObservationHistoryResult(name, None, StatusCode.OK, _create_observation_history(response))
+
+    for request, future in parallel_as_completed(fetch, requests, max_workers):
+        exception = future.exception()
+        if exception is not None:
+            yield SeriesObservationHistoryResult(request[0], str(exception), StatusCode.OTHER, [])
+        else:
+            yield future.result()
+
+
+def _create_observation_history(
+    response: List["SeriesObservationHistoryResponse"],
+) -> List[SeriesObservationHistory]:
+    return [
+        SeriesObservationHistory(
+            _parse_iso8601(x["observationDate"]),
+            [float(y) if y is not None else y for y in x["values"]],
+            [_optional_str_to_datetime(y) for y in x["timeStamps"]],
+        )
+        for x in response
+    ]
 
 
 def _create_vintage_values(vintage_values: "VintageValuesResponse") -> VintageValues:
@@ -247,6 +427,18 @@ def _create_vintage_values(vintage_values: "VintageValuesResponse") -> VintageVa
     return VintageValues(vintage_time_stamp, dates, values)
 
 
+def _create_compact_vintage_values(vintages: List["VintageValuesResponse"]) -> CompactVintageValues:
+    builder = _CompactVintageValuesBuilder()
+    for vintage_values in vintages:
+        _vintage_time_stamp = vintage_values.get("vintageTimeStamp")
+        builder.append(
+            _parse_iso8601(_vintage_time_stamp) if _vintage_time_stamp else None,
+            vintage_values["dates"],
+            vintage_values["values"],
+        )
+    return builder.build()
+
+
 def _create_web_revision_h_request(requests: Sequence[RevisionHistoryRequest]) -> List["WebRevisionHistoryRequest"]:
     return [
         {
@@ -262,28 +454,140 @@ def _create_web_revision_h_request(requests: Sequence[RevisionHistoryRequest]) -
 
 
 def get_many_series_with_revisions(
-    self: "WebApi", requests: Sequence[RevisionHistoryRequest], include_not_modified: bool = False
+    self: "WebApi",
+    requests: Sequence[RevisionHistoryRequest],
+    include_not_modified: bool = False,
+    max_workers: int = 1,
+    compact: bool = False,
+    decode_executor: Optional[Executor] = None,
 ) -> Generator[SeriesWithVintages, None, None]:
+    """
+    Download all revisions for one or more series.
+    See `macrobond_data_api.common.api.Api.get_many_series_with_revisions`.
+
+    The requests are sent in chunks of 200 series. When max_workers is more than 1, up to max_workers chunks are
+    downloaded at the same time and the series are returned as they arrive, so they are not in the order of the
+    requests. Use `macrobond_data_api.common.types.series_with_vintages.SeriesWithVintages.name` to match them.
+    Only a few series are buffered between the downloads and the caller, so memory stays bounded.
+    If a chunk fails, the series of that chunk that have not been returned yet are returned with status
+    `macrobond_data_api.common.enums.status_code.StatusCode.OTHER` and the error as error text, and the other chunks
+    continue.
+
+    If compact is True, the vintages of each series are returned as a
+    `macrobond_data_api.common.types.compact_vintage_values.CompactVintageValues` that shares one date axis between
+    all vintages and stores the values in a float64 array. This uses a fraction of the memory for series with many
+    vintages.
+
+    If decode_executor is set, typically to a `concurrent.futures.ProcessPoolExecutor`, the responses are downloaded
+    on up to max_workers threads and decoded by the executor, so decoding can use more than one core. The series are
+    then returned in the order of the requests. The executor is not shut down, so it can be reused between calls.
+
+    Examples
+    --------
+    ```python
+    with ProcessPoolExecutor() as pool:
+        for series in api.get_many_series_with_revisions(requests, max_workers=4, decode_executor=pool):
+            ...
+    ```
+    """
     if len(requests) == 0:
         yield from ()
-    for requests_chunkd in split_in_to_chunks(requests, 200):
-        with self.session.series.post_fetch_all_vintage_series(
-            _create_web_revision_h_request(requests_chunkd), stream=True
-        ) as response:
-            self.session.raise_on_error(response)
-            ijson_items = ijson.items(self.session._response_to_file_object(response), "item")
-            item: "SeriesWithVintagesResponse"
-            for item in ijson_items:
-                error_code = item.get("errorCode")
-                status_code = StatusCode(error_code) if error_code else StatusCode.OK
-
-                if not include_not_modified and status_code == StatusCode.NOT_MODIFIED:
-                    continue
-
-                _metadata = item.get("metadata")
-                metadata = self.session._create_metadata(_metadata) if _metadata else None
-
-                _vintages = item.get("vintages")
-                vintages = [_create_vintage_values(x) for x in _vintages] if _vintages else []
-
-                yield SeriesWithVintages(item.get("errorText"), status_code, metadata, vintages)
+
+    series: Iterable[SeriesWithVintages]
+    if decode_executor is not None:
+        series = _decode_series_with_revisions_in_executor(self, requests, max_workers, compact, decode_executor)
+    elif max_workers > 1:
+        series = parallel_stream(
+            partial(_fetch_series_with_revisions, self, compact=compact),
+            split_in_to_chunks(requests, 200),
+            max_workers,
+            _series_with_revisions_errors,
+        )
+    else:
+        series = (
+            x for chunk in split_in_to_chunks(requests, 200) for x in _fetch_series_with_revisions(self, chunk, compact)
+        )
+
+    for one_series in series:
+        if not include_not_modified and one_series.status_code == StatusCode.NOT_MODIFIED:
+            continue
+        yield one_series
+
+
+def _fetch_series_with_revisions(
+    self: "WebApi", requests: Sequence[RevisionHistoryRequest], compact: bool = False
+) -> Generator[SeriesWithVintages, None, None]:
+    with self.session.series.post_fetch_all_vintage_series(
+        _create_web_revision_h_request(requests), stream=True
+    ) as response:
+        self.session.raise_on_error(response)
+        ijson_items = ijson.items(self.session._response_to_file_object(response), "item")
+        item: "SeriesWithVintagesResponse"
+        for item, request in zip(ijson_items, requests):
+            yield _create_series_with_vintages(item, request.name, self.session, compact)
+
+
+def _create_series_with_vintages(
+    item: "SeriesWithVintagesResponse", name: str, session: _MetadataCreator, compact: bool
+) -> SeriesWithVintages:
+    error_code = item.get("errorCode")
+    status_code = StatusCode(error_code) if error_code else StatusCode.OK
+
+    _metadata = item.get("metadata")
+    metadata = session._create_metadata(_metadata) if _metadata else None
+
+    _vintages = item.get("vintages")
+    vintages: Sequence[VintageValues]
+    if compact:
+        vintages = _create_compact_vintage_values(_vintages or [])
+    else:
+        vintages = [_create_vintage_values(x) for x in _vintages] if _vintages else []
+
+    return SeriesWithVintages(item.get("errorText"), status_code, metadata, vintages, name)
+
+
+def _decode_series_with_revisions_in_executor(
+    self: "WebApi",
+    requests: Sequence[RevisionHistoryRequest],
+    max_workers: int,
+    compact: bool,
+    executor: Executor,
+) -> Generator[SeriesWithVintages, None, None]:
+    for chunk, future in parallel_decode(
+        partial(_fetch_series_with_revisions_content, self),
+        partial(_decode_series_with_revisions, codec=self.session.json_codec.name, compact=compact),
+        split_in_to_chunks(requests, 200),
+        max_workers,
+        executor,
+    ):
+        try:
+            chunk_series = future.result()
+        except Exception as ex:  # pylint: disable=broad-except
+            yield from _series_with_revisions_errors(chunk, 0, ex)
+            continue
+        for one_series in chunk_series:
+            # The metadata is None in the same cases as when the series is created in this process
+            if one_series.metadata is not None:
+                one_series.metadata = self.session._create_metadata(cast(Dict[str, Any], one_series.metadata))
+            yield one_series
+
+
+def _fetch_series_with_revisions_content(self: "WebApi", requests: Sequence[RevisionHistoryRequest]) -> bytes:
+    return self.session.series.post_fetch_all_vintage_series(_create_web_revision_h_request(requests)).content
+
+
+def _decode_series_with_revisions(
+    requests: Sequence[RevisionHistoryRequest], content: bytes, codec: str, compact: bool
+) -> List[SeriesWithVintages]:
+    # Runs in a worker process, the metadata is wrapped by the session of the caller
+    session = _DictMetadataSession()
+    return [
+        _create_series_with_vintages(x, y.name, session, compact)
+        for x, y in zip(get_json_codec(codec).loads(content), requests)
+    ]
+
+
+def _series_with_revisions_errors(
+    requests: Sequence[RevisionHistoryRequest], count: int, exception: Exception
+) -> List[SeriesWithVintages]:
+    return [SeriesWithVintages(str(exception), StatusCode.OTHER, None, [], x.name) for x in requests[count:]]
@@ -1,24 +1,43 @@
+import warnings
+from concurrent.futures import Executor
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence, Tuple, Union, cast
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, List, Optional, Sequence, Tuple, Union, cast
+
+import ijson
 
 from macrobond_data_api.common.types._repr_html_sequence import _ReprHtmlSequence
 from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
 
-from macrobond_data_api.common.enums import SeriesWeekdays, SeriesFrequency, CalendarMergeMode, StatusCode
+from macrobond_data_api.common.enums import (
+    SeriesWeekdays,
+    SeriesFrequency,
+    CalendarMergeMode,
+    CalendarDateMode,
+    SeriesMissingValueMethod,
+    StatusCode,
+)
 from macrobond_data_api.common.types import (
     GetEntitiesError,
     EntityErrorInfo,
     Series,
+    LazySeries,
     Entity,
     UnifiedSeries,
     UnifiedSeriesList,
     SeriesEntry,
 )
+from macrobond_data_api.common.unified_series_engine import _is_relative_point
 
-from .session import Session
+from .session import Session, _DictMetadataSession, _MetadataCreator
+from .json_codec import MsgspecJsonCodec, get_json_codec
 from ._split_in_to_chunks import split_in_to_chunks
+from ._parallel import parallel_decode, parallel_map
+from .web_types.unified_series_split_warning import UnifiedSeriesSplitWarning
 
 if TYPE_CHECKING:  # pragma: no cover
+    from numpy import ndarray
+
     from .web_api import WebApi
 
     from macrobond_data_api.common.types import StartOrEndPoint
@@ -44,15 +63,15 @@ def _create_entity(response: "EntityResponse", name: str, session: Session) -> E
     return Entity(name, None, StatusCode.OK, cast(Dict[str, Any], metadata))
 
 
-def _create_series(response: "SeriesResponse", name: str, session: Session) -> Series:
+def _create_series(response: "SeriesResponse", name: str, session: _MetadataCreator) -> Series:
     error_text = response.get("errorText")
 
     if error_text:
         return Series(name, error_text, StatusCode(cast(int, response["errorCode"])), None, None, None, None)
 
-    dates = [_parse_iso8601(x) for x in cast(List[str], response["dates"])]
+    dates = _create_dates(cast(List[str], response["dates"]))
 
-    values = [float(x) if x is not None else x for x in cast(List[Optional[float]], response["values"])]
+    values = _create_values(cast(List[Optional[float]], response["values"]))
 
     metadata = session._create_metadata(response["metadata"])
 
@@ -60,13 +79,61 @@ def _create_series(response: "SeriesResponse", name: str, session: Session) -> S
     return Series(name, "", StatusCode.OK, metadata, None, values, dates)
 
 
+def _create_lazy_series(response: "SeriesResponse", name: str, session: _MetadataCreator) -> Series:
+    if response.get("errorText"):
+        return _create_series(response, name, session)
+
+    return LazySeries(
+        name,
+        partial(_create_values, cast(List[Optional[float]], response["values"])),
+        partial(_create_dates, cast(List[str], response["dates"])),
+        partial(session._create_metadata, response["metadata"]),
+    )
+
+
+def _create_dates(dates: List[str]) -> List[datetime]:
+    return [_parse_iso8601(x) for x in dates]
+
+
+def _create_values(values: List[Optional[float]]) -> List[Optional[float]]:
+    return [float(x) if x is not None else x for x in values]
+
+
 def get_one_series(self: "WebApi", series_name: str, raise_error: Optional[bool] = None) -> Series:
     return self.get_series([series_name], raise_error=raise_error)[0]
 
 
-def get_series(self: "WebApi", series_names: Sequence[str], raise_error: Optional[bool] = None) -> Sequence[Series]:
-    response = self.session.series.get_fetch_series(*series_names)
-    series = [_create_series(x, y, self.session) for x, y in zip(response, series_names)]
+def get_series(
+    self: "WebApi", series_names: Sequence[str], raise_error: Optional[bool] = None, lazy: bool = False
+) -> Sequence[Series]:
+    """
+    Download one or more series. See `macrobond_data_api.common.api.Api.get_series`.
+
+    If lazy is True, the series are returned as `macrobond_data_api.common.types.lazy_series.LazySeries` that keep
+    the undecoded values, dates and metadata of each series and decode them the first time they are used. This is
+    faster when only a part of each series is used, for example the metadata or the last few values.
+    With the msgspec codec, only the JSON text of each part is kept until it is used.
+    """
+    series: List[Series]
+    if isinstance(self.session.json_codec, MsgspecJsonCodec):
+        from ._msgspec_decoding import (  # pylint: disable=import-outside-toplevel
+            _decode_lazy_series,
+            _decode_series,
+        )
+
+        response = self.session.get_or_raise("v1/series/fetchseries", params={"n": series_names})
+        decode = _decode_lazy_series if lazy else _decode_series
+        series = decode(response.content, series_names, self.session)
+    elif lazy:
+        series = [
+            _create_lazy_series(x, y, self.session)
+            for x, y in zip(self.session.series.get_fetch_series(*series_names), series_names)
+        ]
+    else:
+        series = [
+            _create_series(x, y, self.session)
+            for x, y in zip(self.session.series.get_fetch_series(*series_names), series_names)
+        ]
     if self.raise_error if raise_error is None else raise_error:
         GetEntitiesError._raise_if([(x, y.error_message) for x, y in zip(series_names, series)])
     return _ReprHtmlSequence(series)
@@ -77,16 +144,45 @@ def get_one_entity(self: "WebApi", entity_name: str, raise_error: Optional[bool]
 
 
 def get_entities(self: "WebApi", entity_names: Sequence[str], raise_error: Optional[bool] = None) -> Sequence[Entity]:
-    response = self.session.series.fetch_entities(*entity_names)
-    entitys = [_create_entity(x, y, self.session) for x, y in zip(response, entity_names)]
+    entitys: List[Entity]
+    if isinstance(self.session.json_codec, MsgspecJsonCodec):
+        from ._msgspec_decoding import _decode_entities  # pylint: disable=import-outside-toplevel
+
+        response = self.session.get_or_raise("v1/series/fetchentities", params={"n": entity_names})
+        entitys = _decode_entities(response.content, entity_names, self.session)
+    else:
+        entitys = [
+            _create_entity(x, y, self.session)
+            for x, y in zip(self.session.series.fetch_entities(*entity_names), entity_names)
+        ]
     if self.raise_error if raise_error is None else raise_error:
         GetEntitiesError._raise_if([(x, y.error_message) for x, y in zip(entity_names, entitys)])
     return _ReprHtmlSequence(entitys)
 
 
 def get_many_series(
-    self: "WebApi", series: Sequence[Union[str, Tuple[str, Optional[datetime]]]], include_not_modified: bool = False
+    self: "WebApi",
+    series: Sequence[Union[str, Tuple[str, Optional[datetime]]]],
+    include_not_modified: bool = False,
+    max_workers: int = 1,
+    decode_executor: Optional[Executor] = None,
 ) -> Generator[Series, None, None]:
+    """
+    Download one or more series. See `macrobond_data_api.common.api.Api.get_many_series`.
+
+    If decode_executor is set, typically to a `concurrent.futures.ProcessPoolExecutor`, the requests are sent in
+    chunks of 200 series on up to max_workers threads and the responses are decoded by the executor, so decoding can
+    use more than one core. The series are returned in the order of the requests. The executor is not shut down, so
+    it can be reused between calls.
+
+    Examples
+    --------
+    ```python
+    with ProcessPoolExecutor() as pool:
+        for series in api.get_many_series(names, decode_executor=pool):
+            ...
+    ```
+    """
     if len(series) == 0:
         yield from ()
 
@@ -97,18 +193,59 @@ def get_many_series(
     if len(names) != len(series_as_tuple):
         raise ValueError("duplicate of series")
 
+    if decode_executor is not None:
+        for ret in _decode_many_series_in_executor(self, series_as_tuple, max_workers, decode_executor):
+            if ret.status_code == StatusCode.NOT_MODIFIED and not include_not_modified:
+                continue
+            yield ret
+        return
+
     for chunk in split_in_to_chunks(series_as_tuple, 200):
-        requests: List["EntityRequest"] = [
-            {"name": x[0], "ifModifiedSince": x[1].isoformat() if x[1] else None} for x in chunk
-        ]
-        response_list = self.session.series.post_fetch_series(*requests)
-        for response, request in zip(response_list, requests):
-            ret = _create_series(response, request["name"], self.session)
+        requests = _create_entity_requests(chunk)
+        chunk_series: Iterable[Series]
+        if isinstance(self.session.json_codec, MsgspecJsonCodec):
+            from ._msgspec_decoding import _decode_series  # pylint: disable=import-outside-toplevel
+
+            response = self.session.post_or_raise("v1/series/fetchseries", json=requests)
+            chunk_series = _decode_series(response.content, [x["name"] for x in requests], self.session)
+        else:
+            response_list = self.session.series.post_fetch_series(*requests)
+            chunk_series = (_create_series(x, y["name"], self.session) for x, y in zip(response_list, requests))
+        for ret in chunk_series:
             if ret.status_code == StatusCode.NOT_MODIFIED and not include_not_modified:
                 continue
             yield ret
 
 
+def _create_entity_requests(series: Sequence[Tuple[str, Optional[datetime]]]) -> List["EntityRequest"]:
+    return [{"name": x[0], "ifModifiedSince": x[1].isoformat() if x[1] else None} for x in series]
+
+
+def _decode_many_series_in_executor(
+    self: "WebApi", series: List[Tuple[str, Optional[datetime]]], max_workers: int, executor: Executor
+) -> Generator[Series, None, None]:
+    def fetch(requests: List["EntityRequest"]) -> bytes:
+        return self.session.post_or_raise("v1/series/fetchseries", json=requests).content
+
+    chunks = (_create_entity_requests(x) for x in split_in_to_chunks(series, 200))
+    decode = partial(_decode_series_chunk, codec=self.session.json_codec.name)
+    for _, future in parallel_decode(fetch, decode, chunks, max_workers, executor):
+        for one_series in future.result():
+            one_series.metadata = self.session._create_metadata(cast(Dict[str, Any], one_series.metadata))
+            yield one_series
+
+
+def _decode_series_chunk(requests: List["EntityRequest"], content: bytes, codec: str) -> List[Series]:
+    # Runs in a worker process, the metadata is wrapped by the session of the caller
+    session = _DictMetadataSession()
+    names = [x["name"] for x in requests]
+    if codec == MsgspecJsonCodec.name:
+        from ._msgspec_decoding import _decode_series  # pylint: disable=import-outside-toplevel
+
+        return _decode_series(content, names, session)
+    return [_create_series(x, y, session) for x, y in zip(get_json_codec(codec).loads(content), names)]
+
+
 def get_unified_series(
     self: "WebApi",
     *series_entries: Union[SeriesEntry, str],
@@ -118,8 +255,30 @@ def get_unified_series(
     currency: str = "",
     start_point: Optional["StartOrEndPoint"] = None,
     end_point: Optional["StartOrEndPoint"] = None,
-    raise_error: Optional[bool] = None
+    raise_error: Optional[bool] = None,
+    chunk_size: int = 500,
+    max_workers: int = 4,
+    as_matrix: bool = False
 ) -> UnifiedSeriesList:
+    """
+    Get one or more series and convert them to a common frequency and calendar.
+    See `macrobond_data_api.common.api.Api.get_unified_series`.
+
+    Requests with more than chunk_size series are split into requests of chunk_size series with the same calendar
+    parameters, and up to max_workers of them are downloaded at the same time. The results are merged on a common
+    date axis. With `macrobond_data_api.common.enums.calendar_merge_mode.CalendarMergeMode.AVAILABLE_IN_ALL` the
+    date axis is the intersection of the date axes of the requests. When the date axes of the requests differ and
+    the merged result may differ from the result of a single request, for example because the frequency is HIGHEST
+    or LOWEST, a start or end point is relative or missing values are filled, a
+    `macrobond_data_api.web.web_types.unified_series_split_warning.UnifiedSeriesSplitWarning` is issued.
+
+    If as_matrix is True, the values are decoded straight into a float64 matrix with one row per date and one column
+    per series, where missing values are NaN. The values of each series are views of the columns, and
+    `macrobond_data_api.common.types.unified_series.UnifiedSeriesList.to_numpy` and
+    `macrobond_data_api.common.types.unified_series.UnifiedSeriesList.to_pd_data_frame` use the matrix without
+    copying it. This requires numpy, which is installed together with pandas.
+    """
+
     def convert_to_unified_series_entry(entry_or_name: Union[SeriesEntry, str]) -> "UnifiedSeriesEntry":
         if isinstance(entry_or_name, str):
             entry_or_name = SeriesEntry(entry_or_name)
@@ -151,27 +310,19 @@ def get_unified_series(
         request["endPoint"] = end_point.time
         request["endDateMode"] = end_point.mode
 
-    response = self.session.series.fetch_unified_series(request)
-
-    str_dates = response.get("dates")
+    cache = self.unified_series_cache
+    if cache is not None:
+        cached = cache.get(request, as_matrix, self.session)
+        if cached is not None:
+            return cached
 
-    dates = [_parse_iso8601(x) for x in str_dates] if str_dates else []
+    if len(web_series_entries) > chunk_size:
+        ret = _fetch_split_unified_series(self, request, chunk_size, max_workers, as_matrix)
+    else:
+        ret = _fetch_unified_series(self, request, as_matrix)
 
-    series: List[UnifiedSeries] = []
-    for i, one_series in enumerate(response["series"]):
-        name = request["seriesEntries"][i]["name"]
-        error_text = one_series.get("errorText")
-
-        if error_text:
-            series.append(UnifiedSeries(name, error_text, {}, []))
-        else:
-            values = [float(x) if x is not None else x for x in cast(List[Optional[float]], one_series["values"])]
-
-            metadata = self.session._create_metadata(one_series["metadata"])
-
-            series.append(UnifiedSeries(name, "", metadata, values))
-
-    ret = UnifiedSeriesList(series, dates)
+    if cache is not None:
+        cache.put(request, ret, as_matrix)
 
     if self.raise_error if raise_error is None else raise_error:
         errors = [EntityErrorInfo(x, y) for x, y in ret.get_errors().items()]
@@ -179,3 +330,168 @@ def get_unified_series(
             raise GetEntitiesError(errors)
 
     return ret
+
+
+def _fetch_unified_series(self: "WebApi", request: "UnifiedSeriesRequest", as_matrix: bool) -> UnifiedSeriesList:
+    with self.session.series.post_fetch_unified_series(request, stream=True) as response:
+        self.session.raise_on_error(response)
+        events = ijson.parse(self.session._response_to_file_object(response), use_float=True)
+        return _parse_unified_series(self, request, events, as_matrix)
+
+
+def _parse_unified_series(
+    self: "WebApi", request: "UnifiedSeriesRequest", events: Iterable[Tuple[str, str, Any]], as_matrix: bool
+) -> UnifiedSeriesList:
+    # The values of one series at a time are kept in a list and then moved to the result,
+    # so the whole response is never held in memory as bytes or as parsed JSON.
+    dates: List[datetime] = []
+    series: List[UnifiedSeries] = []
+    matrix: Optional["ndarray"] = None
+    values: List[Optional[float]] = []
+    error_text = ""
+    metadata: Optional[Dict[str, Any]] = None
+    metadata_builder: Optional[ijson.ObjectBuilder] = None
+
+    for prefix, event, value in events:
+        if prefix == "series.item.values.item":
+            # use_float parses the non-integer numbers as float instead of Decimal, integers are still int
+            values.append(value if value is None or isinstance(value, float) else float(value))
+        elif metadata_builder is not None:
+            metadata_builder.event(event, value)
+            if prefix == "series.item.metadata" and event == "end_map":
+                metadata = metadata_builder.value
+                metadata_builder = None
+        elif prefix == "series.item.metadata" and event == "start_map":
+            metadata_builder = ijson.ObjectBuilder()
+            metadata_builder.event(event, value)
+        elif prefix == "series.item.errorText" and event == "string":
+            error_text = value
+        elif prefix == "series.item" and event == "start_map":
+            values, error_text, metadata = [], "", None
+        elif prefix == "series.item" and event == "end_map":
+            name = request["seriesEntries"][len(series)]["name"]
+            if error_text:
+                series.append(UnifiedSeries(name, error_text, {}, []))
+                continue
+            if matrix is not None:
+                matrix[:, len(series)] = values
+                values = cast(List[Optional[float]], matrix[:, len(series)])
+            series.append(UnifiedSeries(name, "", self.session._create_metadata(metadata), values))
+        elif prefix == "dates.item":
+            dates.append(_parse_iso8601(value))
+        elif prefix == "dates" and event == "end_array" and as_matrix and not series:
+            import numpy  # pylint: disable=import-outside-toplevel
+
+            matrix = numpy.full((len(dates), len(request["seriesEntries"])), numpy.nan, order="F")
+
+    ret = UnifiedSeriesList(series, dates, matrix)
+    if as_matrix and matrix is None:
+        return ret._with_matrix(ret.to_numpy())
+    return ret
+
+
+def _fetch_split_unified_series(
+    self: "WebApi", request: "UnifiedSeriesRequest", chunk_size: int, max_workers: int, as_matrix: bool
+) -> UnifiedSeriesList:
+    def fetch(entries: Sequence["UnifiedSeriesEntry"]) -> UnifiedSeriesList:
+        sub_request = request.copy()
+        sub_request["seriesEntries"] = list(entries)
+        return _fetch_unified_series(self, sub_request, as_matrix)
+
+    chunks = list(split_in_to_chunks(request["seriesEntries"], chunk_size))
+    results = list(parallel_map(fetch, chunks, max(1, min(max_workers, len(chunks)))))
+
+    dates, reasons = _merge_unified_dates(request, [list(x.dates) for x in results if x.dates])
+    if reasons:
+        warnings.warn(
+            "The unified series request was split and the result may differ from a single request: "
+            + ", ".join(reasons),
+            UnifiedSeriesSplitWarning,
+            stacklevel=3,
+        )
+
+    if as_matrix:
+        return _merge_unified_series_matrices(results, dates)
+
+    series: List[UnifiedSeries] = []
+    for result in results:
+        if list(result.dates) == dates:
+            series.extend(result)
+            continue
+        index = {x: i for i, x in enumerate(result.dates)}
+        positions = [index.get(x) for x in dates]
+        for one_series in result:
+            if one_series.is_error:
+                series.append(one_series)
+            else:
+                values = one_series.values
+                series.append(
+                    UnifiedSeries(
+                        one_series.name,
+                        "",
+                        one_series.metadata,
+                        [None if x is None else values[x] for x in positions],
+                    )
+                )
+
+    return UnifiedSeriesList(series, dates)
+
+
+def _merge_unified_series_matrices(results: List[UnifiedSeriesList], dates: List[datetime]) -> UnifiedSeriesList:
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    matrix = numpy.full((len(dates), sum(len(x) for x in results)), numpy.nan, order="F")
+    column = 0
+    for result in results:
+        columns = slice(column, column + len(result))
+        if list(result.dates) == dates:
+            matrix[:, columns] = result.to_numpy()
+        elif result.dates:
+            index = {x: i for i, x in enumerate(result.dates)}
+            positions = numpy.array([index.get(x, -1) for x in dates], dtype=numpy.int64)
+            found = positions >= 0
+            matrix[found, columns] = result.to_numpy()[positions[found]]
+        column += len(result)
+
+    return UnifiedSeriesList([x for result in results for x in result], dates)._with_matrix(matrix)
+
+
+def _merge_unified_dates(
+    request: "UnifiedSeriesRequest", axes: List[List[datetime]]
+) -> Tuple[List[datetime], List[str]]:
+    if not axes:
+        return [], []
+    if all(x == axes[0] for x in axes):
+        return axes[0], []
+
+    reasons: List[str] = []
+    common_start = max(x[0] for x in axes)
+    common_end = min(x[-1] for x in axes)
+
+    if request.get("calendarMergeMode") == CalendarMergeMode.AVAILABLE_IN_ALL:
+        in_all = set.intersection(*[{y for y in x if common_start <= y <= common_end} for x in axes])
+        outside = {y for x in axes for y in x if y < common_start or y > common_end}
+        dates = sorted(in_all | outside)
+        if outside:
+            reasons.append("the calendars could not be intersected outside the common date range")
+    else:
+        dates = sorted({y for x in axes for y in x})
+        if request.get("calendarMergeMode") == CalendarMergeMode.FULL_CALENDAR:
+            ranges = sorted((x[0], x[-1]) for x in axes)
+            if any(ranges[i + 1][0] > max(y[1] for y in ranges[: i + 1]) for i in range(len(ranges) - 1)):
+                reasons.append("the full calendar has a gap between the date ranges of the requests")
+
+    if request.get("startDateMode") == CalendarDateMode.DATA_IN_ALL_SERIES and not request.get("startPoint"):
+        dates = [x for x in dates if x >= common_start]
+    if request.get("endDateMode") == CalendarDateMode.DATA_IN_ALL_SERIES and not request.get("endPoint"):
+        dates = [x for x in dates if x <= common_end]
+
+    if request.get("frequency") in (SeriesFrequency.HIGHEST, SeriesFrequency.LOWEST):
+        reasons.append("the frequency was resolved separately for each request")
+    if (_is_relative_point(request.get("startPoint")) or _is_relative_point(request.get("endPoint"))) and any(
+        x[-1] != axes[0][-1] for x in axes
+    ):
+        reasons.append("the relative start or end point was resolved separately for each request")
+    if any(x.get("missingValueMethod") not in (None, SeriesMissingValueMethod.NONE) for x in request["seriesEntries"]):
+        reasons.append("missing values were filled on the calendar of each request")
+    return dates, reasons
@@ -13,6 +13,7 @@ from .web_types.data_package_list import DataPackageList
 from .web_types.data_package_body import DataPackageBody
 
 from .subscription_list import SubscriptionList
+from .async_subscription_list import AsyncSubscriptionList
 
 if TYPE_CHECKING:  # pragma: no cover
     from macrobond_data_api.common.types import SearchFilter
@@ -187,7 +188,11 @@ def get_data_package_list_iterative(
 
 
 def get_data_package_list_chunked(
-    self: "WebApi", if_modified_since: Optional[datetime] = None, chunk_size: int = 200
+    self: "WebApi",
+    if_modified_since: Optional[datetime] = None,
+    chunk_size: int = 200,
+    compact: bool = False,
+    read_ahead: int = 0,
 ) -> DataPackageListContextManager:
     # pylint: disable=line-too-long
     """
@@ -206,12 +211,22 @@ def get_data_package_list_chunked(
 
     chunk_size : int, optional
         The maximum number of items to include in each List in DataPackageListContext.items
+
+    compact : bool, optional
+        Set this value to True to get each chunk as a
+        `macrobond_data_api.web.web_types.data_package_list_chunk.DataPackageListChunk`
+        instead of a List of tuples. This uses much less memory for large lists.
+
+    read_ahead : int, optional
+        If larger than 0, the response is read and parsed on a background thread into a buffer of up to this many
+        chunks ahead of the consumer. This keeps the connection drained when processing of the chunks is slow.
+        Use DataPackageListContext.read_ahead_metrics to size the buffer.
     Returns
     -------
     `macrobond_data_api.web.web_types.data_package_list_context.DataPackageListContextManager`
     """
     # pylint: enable=line-too-long
-    return DataPackageListContextManager(if_modified_since, chunk_size, self)
+    return DataPackageListContextManager(if_modified_since, chunk_size, self, compact, read_ahead)
 
 
 # Search
@@ -271,3 +286,16 @@ def subscription_list(self: "WebApi", last_modified: datetime, poll_interval: ti
         raise ValueError("WebApi is not open")
 
     return SubscriptionList(self._session, last_modified, poll_interval)
+
+
+def async_subscription_list(
+    self: "WebApi", last_modified: datetime, poll_interval: timedelta = None
+) -> AsyncSubscriptionList:
+    """
+    Retrieves an asyncio version of the subscription list with the specified date since last update.
+    See `macrobond_data_api.web.async_subscription_list.AsyncSubscriptionList`.
+    """
+    if not self._session._is_open:
+        raise ValueError("WebApi is not open")
+
+    return AsyncSubscriptionList(self._session, last_modified, poll_interval)
@@ -0,0 +1,249 @@
+import asyncio
+from concurrent.futures import Executor
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar
+
+from .web_api import WebApi
+from .web_types.data_package_body import DataPackageBody
+from .web_types.data_pacakge_list_item import DataPackageListItem
+from .web_types.data_package_list_state import DataPackageListState
+from .web_types.data_package_list_update import DataPackageListUpdate
+from ._poll_schedule import _PollSchedule, _error_delay, _seconds_until
+
+_T = TypeVar("_T")
+
+
+class AsyncDataPackageListPoller:
+    """
+    An asyncio counterpart of `macrobond_data_api.web.data_package_list_poller.DataPackageListPoller`.
+    Iterate over the object to poll for changed series in the data package list. Each iteration returns a
+    `macrobond_data_api.web.web_types.data_package_list_update.DataPackageListUpdate` with a chunk of items from a
+    full or incremental listing. Polling continues until the task is cancelled or `abort` is called.
+
+    The time between polls is spent in the event loop instead of blocking a thread, so many pollers can share one
+    event loop. The HTTP requests are run in an executor and use the connection pool of the session.
+    The time between polls adapts to how often the list changes in the same way as for `DataPackageListPoller`.
+
+    If a listing still fails after `max_attempts` attempts, the exception is raised from the iterator.
+    `download_full_list_on_or_after` and `time_stamp_for_if_modified_since` are only updated when a listing has
+    completed, so they can be saved and passed to a new poller to resume.
+
+    Parameters
+    ----------
+    api : WebApi
+        The API instance to use.
+    download_full_list_on_or_after : datetime
+        The saved value of `download_full_list_on_or_after` from the previous run. `None` on first run.
+    time_stamp_for_if_modified_since: datetime
+        The saved value of `time_stamp_for_if_modified_since` from the previous run. `None`on first run.
+    chunk_size : int
+        The maximum number of items in each update.
+    executor : Executor
+        The executor to run the HTTP requests in. The default executor of the event loop is used if not specified.
+    up_to_date_interval: float
+        The saved value of `up_to_date_interval` from the previous run. `None` on first run.
+
+    Examples
+    --------
+    ```python
+    async def main(api: WebApi) -> None:
+        async for update in AsyncDataPackageListPoller(api):
+            for item in update.items:
+                print(f'Series "{item.name}", last updated "{item.modified}"')
+    ```
+    """
+
+    def __init__(
+        self,
+        api: WebApi,
+        download_full_list_on_or_after: Optional[datetime] = None,
+        time_stamp_for_if_modified_since: Optional[datetime] = None,
+        chunk_size: int = 200,
+        executor: Optional[Executor] = None,
+        up_to_date_interval: Optional[float] = None,
+    ) -> None:
+        self.up_to_date_delay = 15 * 60
+        """ The longest time to wait, in seconds, between polls. """
+        self.min_up_to_date_delay = 60
+        """
+        The shortest time to wait, in seconds, between polls when the list is changing frequently. The default is
+        one minute.
+        """
+        self.incomplete_delay = 15
+        """ The time to wait, in seconds, between continuing partial updates. """
+        self.on_error_delay = 30
+        """ The time to wait, in seconds, before retrying after the first error. It is doubled for each retry. """
+        self.max_on_error_delay = 10 * 60
+        """ The longest time to wait, in seconds, before retrying after an error. """
+        self.max_attempts = 3
+        """ The number of attempts to make for each request before giving up. """
+        self.chunk_size = chunk_size
+        self._api = api
+        self._executor = executor
+        self._abort = False
+        self._abort_event: Optional[asyncio.Event] = None
+        self._download_full_list_on_or_after = download_full_list_on_or_after
+        self._time_stamp_for_if_modified_since = time_stamp_for_if_modified_since
+        self._schedule = _PollSchedule(up_to_date_interval)
+        self._next_wake_up: Optional[datetime] = None
+        self._last_body: Optional[DataPackageBody] = None
+
+    @property
+    def api(self) -> WebApi:
+        return self._api
+
+    @property
+    def download_full_list_on_or_after(self) -> Optional[datetime]:
+        """
+        The time of the scheduled next full listing. Save this value after processing and pass in constructor for
+        the next run.
+        """
+        return self._download_full_list_on_or_after
+
+    @property
+    def time_stamp_for_if_modified_since(self) -> Optional[datetime]:
+        """
+        This value is used internall to keep track of the the time of the last detected modification.
+        Save this value after processing and pass in constructor for the next run.
+        """
+        return self._time_stamp_for_if_modified_since
+
+    @property
+    def up_to_date_interval(self) -> Optional[float]:
+        """
+        The current time, in seconds, between polls when the list is up to date, or None before the first poll.
+        Save this value after processing and pass in constructor for the next run.
+        """
+        return self._schedule.interval
+
+    @property
+    def next_wake_up(self) -> Optional[datetime]:
+        """
+        The time when the poller will wake up and make the next request, or None if it is not waiting.
+        """
+        return self._next_wake_up
+
+    def abort(self) -> None:
+        """Call this method to stop processing. A poller that is waiting for the next poll stops immediately."""
+        self._abort = True
+        if self._abort_event:
+            self._abort_event.set()
+
+    async def __aiter__(self) -> AsyncIterator[DataPackageListUpdate]:
+        self._abort = False
+        if self._abort_event:
+            self._abort_event.clear()
+
+        await self._run(self._test_access)
+
+        while not self._abort:
+            change_count = 0
+            if not self._time_stamp_for_if_modified_since or (
+                self._download_full_list_on_or_after and _seconds_until(self._download_full_list_on_or_after) < 0
+            ):
+                async for update in self._listing(None):
+                    yield update
+                body = self._get_last_body()
+                self._download_full_list_on_or_after = body.download_full_list_on_or_after
+                self._time_stamp_for_if_modified_since = body.time_stamp_for_if_modified_since
+            else:
+                if_modified_since = self._time_stamp_for_if_modified_since
+                while True:
+                    async for update in self._listing(if_modified_since):
+                        change_count += len(update.items)
+                        yield update
+                    body = self._get_last_body()
+                    if body.state == DataPackageListState.UP_TO_DATE:
+                        break
+                    await self._wait(self.incomplete_delay)
+                    if self._abort:
+                        return
+                    if_modified_since = body.time_stamp_for_if_modified_since
+                self._time_stamp_for_if_modified_since = body.time_stamp_for_if_modified_since
+
+            if self._abort:
+                return
+
+            await self._wait(
+                self._schedule.next_delay(
+                    body.state,
+                    change_count,
+                    self.min_up_to_date_delay,
+                    self.up_to_date_delay,
+                    self.incomplete_delay,
+                    self._download_full_list_on_or_after,
+                )
+            )
+
+    async def _listing(self, if_modified_since: Optional[datetime]) -> AsyncIterator[DataPackageListUpdate]:
+        # A listing is only retried if it failed before any items were returned, since a retry starts the listing
+        # over and the items already returned would be returned again.
+        for attempt in range(1, self.max_attempts + 1):
+            has_items = False
+            try:
+                async for update in self._get_list(if_modified_since):
+                    has_items = True
+                    yield update
+                return
+            except Exception:  # pylint: disable=broad-except
+                if has_items or self._abort or attempt >= self.max_attempts:
+                    raise
+                await self._wait(_error_delay(attempt, self.on_error_delay, self.max_on_error_delay))
+                if self._abort:
+                    raise
+
+    async def _get_list(self, if_modified_since: Optional[datetime]) -> AsyncIterator[DataPackageListUpdate]:
+        self._last_body = None
+        context_manager = self._api.get_data_package_list_chunked(if_modified_since, self.chunk_size)
+        # The response is only used from the executor. A call that is still running there when the iteration is
+        # cancelled is waited for before the response is closed, also from the executor.
+        entering = self._start(context_manager.__enter__)
+        pending: "asyncio.Future[Any]" = entering
+        try:
+            context = await asyncio.shield(entering)
+            body = DataPackageBody(
+                context.time_stamp_for_if_modified_since, context.download_full_list_on_or_after, context.state
+            )
+            items = iter(context.items)
+            while True:
+                pending = self._start(partial(next, items, None))
+                chunk = await asyncio.shield(pending)
+                if chunk is None:
+                    break
+                yield DataPackageListUpdate(
+                    body, [DataPackageListItem(x, y) for x, y in chunk], if_modified_since is None
+                )
+            self._last_body = body
+        finally:
+            await asyncio.wait([pending])
+            if not entering.cancelled() and entering.exception() is None:
+                await self._run(partial(context_manager.__exit__, None, None, None))
+
+    def _get_last_body(self) -> DataPackageBody:
+        if self._last_body is None:
+            raise ValueError("subscription is None")
+        return self._last_body
+
+    def _test_access(self) -> None:
+        params = {"ifModifiedSince": datetime(3000, 1, 1, tzinfo=timezone.utc)}
+        response = self._api.session.get("v1/series/getdatapackagelist", params=params)
+        if response.status_code == 403:
+            raise Exception("Needs access - The account is not set up to use DataPackageList")
+
+    async def _wait(self, seconds: float) -> None:
+        if self._abort_event is None:
+            self._abort_event = asyncio.Event()
+        self._next_wake_up = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+        try:
+            await asyncio.wait_for(self._abort_event.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._next_wake_up = None
+
+    def _start(self, func: Callable[[], _T]) -> "asyncio.Future[_T]":
+        return asyncio.get_running_loop().run_in_executor(self._executor, func)
+
+    async def _run(self, func: Callable[[], _T]) -> _T:
+        return await self._start(func)
@@ -0,0 +1,202 @@
+import asyncio
+from concurrent.futures import Executor
+from datetime import datetime, timedelta
+from functools import partial
+from typing import AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from .session import Session
+from .subscription_list import SubscriptionList
+
+_T = TypeVar("_T")
+
+
+class AsyncSubscriptionList:
+    """
+    An asyncio counterpart of `macrobond_data_api.web.subscription_list.SubscriptionList`.
+    The time between polls is spent in `asyncio.sleep` instead of blocking a thread, so many subscription lists can
+    share one event loop. The HTTP requests are run in an executor and use the connection pool of the session.
+    `set`, `add`, `remove` and `sync` run the methods of `SubscriptionList` in the executor, including the wait until
+    the server has applied the changes.
+
+    This class shouldn't be instantiated directly, but instead should be retrieved from a web client through
+    `async_subscription_list`
+
+    Iterating over the object polls for updates until the task is cancelled or `abort` is called.
+
+    Examples
+    --------
+    ```python
+    from datetime import datetime, timezone
+
+    async def main(api: WebApi) -> None:
+        subscription_list = api.async_subscription_list(datetime.now(timezone.utc))
+        await subscription_list.set(['sek', 'nok'])
+        async for result in subscription_list:
+            for key, date in result.items():
+                print(f'Series "{key}", last updated "{date}"')
+    ```
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        last_modified: datetime,
+        poll_interval: timedelta = None,
+        executor: Optional[Executor] = None,
+    ):
+        self._subscription_list = SubscriptionList(session, last_modified, poll_interval)
+        self._executor = executor
+        self._abort = False
+        self._abort_event: Optional[asyncio.Event] = None
+
+    @property
+    def last_modified(self) -> datetime:
+        """
+        Stores the date for when the subscription list was last modified.
+        """
+        return self._subscription_list.last_modified
+
+    @property
+    def no_more_changes(self) -> bool:
+        """
+        An indicator that there are no changes at the moment.
+        """
+        return self._subscription_list.no_more_changes
+
+    @property
+    def poll_interval(self) -> timedelta:
+        """
+        Specifies the time interval between polls.
+        """
+        return self._subscription_list.poll_interval
+
+    @poll_interval.setter
+    def poll_interval(self, value: timedelta) -> None:
+        self._subscription_list.poll_interval = value
+
+    async def list(self) -> List[str]:
+        """
+        Lists series currently registered in the subscription list.
+
+        Returns
+        -------
+        `List[str]`
+        """
+        return await self._run(self._subscription_list.list)
+
+    async def set(self, keys: Sequence[str]) -> None:
+        """
+        Set what series to include in the subscription list.
+        This will replace all previous series in the list.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            A sequence of series names.
+        """
+        self._check_is_open()
+        await self._run(partial(self._subscription_list.set, keys))
+
+    async def add(self, keys: Sequence[str]) -> None:
+        """
+        Add one or more series to the subscription list.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            A sequence of series names.
+        """
+        self._check_is_open()
+        await self._run(partial(self._subscription_list.add, keys))
+
+    async def remove(self, keys: Sequence[str]) -> None:
+        """
+        Remove one or more series from the subscription list.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            A sequence of series names.
+        """
+        self._check_is_open()
+        await self._run(partial(self._subscription_list.remove, keys))
+
+    async def sync(
+        self, keys: Sequence[str], chunk_size: int = 1000, max_workers: int = 4, timeout: timedelta = None
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Make the subscription list contain exactly the specified series by only sending the difference.
+        See `macrobond_data_api.web.subscription_list.SubscriptionList.sync`.
+
+        Returns
+        -------
+        Tuple[List[str], List[str]]
+            The names of the series that were added and the names of the series that were removed.
+        """
+        self._check_is_open()
+        return await self._run(partial(self._subscription_list.sync, keys, chunk_size, max_workers, timeout))
+
+    async def poll(self) -> Dict[str, datetime]:
+        """
+        Polls for any changes on the series in the subscription list.
+        If there are no updates, the method will return an empty dict after the poll interval time.
+
+        Returns
+        -------
+        Dict[str, datetime]]
+            A dictionary of names of series that have been updated, and the corresponding last update date.
+        """
+        self._check_is_open()
+        interval = self._subscription_list._time_until_next_poll()
+        if interval > 0:
+            await self._wait(interval)
+            if self._abort:
+                return {}
+        return await self._run(self._subscription_list._get_updates)
+
+    async def poll_until_no_more_changes(self) -> AsyncIterator[Dict[str, datetime]]:
+        """
+        Polls for any changes on the series in the subscription list until there are no more changes.
+
+        Returns
+        -------
+        AsyncIterator[Dict[str, datetime]]]
+            An async iterator of dictionaries with names of series that have been updated, and the corresponding last
+            update date.
+        """
+        while not self._abort:
+            changes = await self.poll()
+            if len(changes) > 0:
+                yield changes
+            if self.no_more_changes:
+                break
+
+    def abort(self) -> None:
+        """Stop polling. A poll that is waiting for the next poll interval returns immediately."""
+        self._abort = True
+        if self._abort_event:
+            self._abort_event.set()
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, datetime]]:
+        self._abort = False
+        if self._abort_event:
+            self._abort_event.clear()
+        while not self._abort:
+            changes = await self.poll()
+            if len(changes) > 0:
+                yield changes
+
+    async def _wait(self, seconds: float) -> None:
+        if self._abort_event is None:
+            self._abort_event = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._abort_event.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    def _check_is_open(self) -> None:
+        if not self._subscription_list._session._is_open:
+            raise ValueError("WebApi is not open")
+
+    async def _run(self, func: Callable[[], _T]) -> _T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
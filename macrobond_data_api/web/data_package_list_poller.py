@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
-import time
+from threading import Event
 from typing import List, Optional, cast, TYPE_CHECKING, Callable
 
 from .web_api import WebApi
 from .web_types.data_package_list_state import DataPackageListState
+from ._poll_schedule import _PollSchedule, _error_delay, _seconds_until
 
 if TYPE_CHECKING:  # pragma: no cover
     from .web_types import DataPackageBody, DataPackageListItem
@@ -22,6 +23,14 @@ class DataPackageListPoller(ABC):
     Derive from this class and override `on_full_listing_start`, `on_full_listing_items`, `on_full_listing_stop`,
     `on_incremental_start`, `on_incremental_items` and `on_incremental_stop`.
 
+    The time between polls adapts to how often the list changes. It is halved, down to `min_up_to_date_delay`,
+    after a poll that found changes and doubled, up to `up_to_date_delay`, after a poll that did not.
+    By default this is between 1 and 15 minutes. Earlier versions always waited 15 minutes; set
+    `min_up_to_date_delay` to `up_to_date_delay` to keep that rate.
+    The interval starts from `up_to_date_interval` if it is saved from a previous run, otherwise from
+    `up_to_date_delay`.
+    Errors are retried with exponential backoff starting at `on_error_delay`.
+
     Parameters
     ----------
     api : WebApi
@@ -30,6 +39,8 @@ class DataPackageListPoller(ABC):
         The saved value of `download_full_list_on_or_after` from the previous run. `None` on first run.
     time_stamp_for_if_modified_since: datetime
         The saved value of `time_stamp_for_if_modified_since` from the previous run. `None`on first run.
+    up_to_date_interval: float
+        The saved value of `up_to_date_interval` from the previous run. `None` on first run.
     """
 
     def __init__(
@@ -37,19 +48,31 @@ class DataPackageListPoller(ABC):
         api: WebApi,
         download_full_list_on_or_after: Optional[datetime] = None,
         time_stamp_for_if_modified_since: Optional[datetime] = None,
-        _sleep: Callable[[int], None] = time.sleep,
+        up_to_date_interval: Optional[float] = None,
+        _sleep: Optional[Callable[[float], None]] = None,
     ) -> None:
         self.up_to_date_delay = 15 * 60
-        """ The time to wait, in seconds, between polls. """
+        """ The longest time to wait, in seconds, between polls. """
+        self.min_up_to_date_delay = 60
+        """
+        The shortest time to wait, in seconds, between polls when the list is changing frequently. The default is
+        one minute.
+        """
         self.incomplete_delay = 15
         """ The time to wait, in seconds, between continuing partial updates. """
         self.on_error_delay = 30
-        """ The time to wait, in seconds, before retrying after an error. """
+        """ The time to wait, in seconds, before retrying after the first error. It is doubled for each retry. """
+        self.max_on_error_delay = 10 * 60
+        """ The longest time to wait, in seconds, before retrying after an error. """
         self._api = api
         self._sleep = _sleep
         self._abort = False
+        self._abort_event = Event()
         self._download_full_list_on_or_after = download_full_list_on_or_after
         self._time_stamp_for_if_modified_since = time_stamp_for_if_modified_since
+        self._schedule = _PollSchedule(up_to_date_interval)
+        self._change_count = 0
+        self._next_wake_up: Optional[datetime] = None
 
     @property
     def api(self) -> WebApi:
@@ -71,14 +94,30 @@ class DataPackageListPoller(ABC):
         """
         return self._time_stamp_for_if_modified_since
 
+    @property
+    def up_to_date_interval(self) -> Optional[float]:
+        """
+        The current time, in seconds, between polls when the list is up to date, or None before the first poll.
+        Save this value after processing and pass in constructor for the next run.
+        """
+        return self._schedule.interval
+
+    @property
+    def next_wake_up(self) -> Optional[datetime]:
+        """
+        The time when the poller will wake up and make the next request, or None if it is not waiting.
+        """
+        return self._next_wake_up
+
     def start(self) -> None:
         """Start processing. It will continue to run until `abort` is called."""
         self._test_access()
         self._abort = False
+        self._abort_event.clear()
         while not self._abort:
+            self._change_count = 0
             if not self._time_stamp_for_if_modified_since or (
-                self._download_full_list_on_or_after
-                and datetime.now(timezone.utc) > self._download_full_list_on_or_after
+                self._download_full_list_on_or_after and _seconds_until(self._download_full_list_on_or_after) < 0
             ):
                 sub = self._run_full_listing()
                 if sub:
@@ -92,7 +131,36 @@ class DataPackageListPoller(ABC):
             if self._abort:
                 return
 
-            self._sleep(self.up_to_date_delay)
+            if sub:
+                delay = self._schedule.next_delay(
+                    sub.state,
+                    self._change_count,
+                    self.min_up_to_date_delay,
+                    self.up_to_date_delay,
+                    self.incomplete_delay,
+                    self._download_full_list_on_or_after,
+                )
+            else:
+                delay = self.up_to_date_delay
+
+            self._wait(delay)
+
+    def _wait(self, seconds: float) -> None:
+        self._next_wake_up = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+        try:
+            if self._sleep:
+                self._sleep(seconds)
+            else:
+                self._abort_event.wait(seconds)
+        finally:
+            self._next_wake_up = None
+
+    def _wait_after_error(self, attempt: int) -> None:
+        self._wait(_error_delay(attempt, self.on_error_delay, self.max_on_error_delay))
+
+    def _on_incremental_items(self, subscription: "DataPackageBody", items: List["DataPackageListItem"]) -> None:
+        self._change_count += len(items)
+        self.on_incremental_items(subscription, items)
 
     def _test_access(self) -> None:
         params = {"ifModifiedSince": datetime(3000, 1, 1, tzinfo=timezone.utc)}
@@ -104,11 +172,12 @@ class DataPackageListPoller(ABC):
         is_stated = False
 
         def _body_callback(body: "DataPackageBody") -> None:
-            is_stated = True  # pylint: disable=unused-variable
+            nonlocal is_stated
+            is_stated = True
             self.on_full_listing_start(body)
 
         try:
-            for attempt in range(1, max_attempts):
+            for attempt in range(1, max_attempts + 1):
                 try:
                     sub = self._api.get_data_package_list_iterative(
                         _body_callback,
@@ -123,9 +192,11 @@ class DataPackageListPoller(ABC):
                 except Exception as ex:  # pylint: disable=broad-except
                     if self._abort:
                         raise _AbortException() from ex
-                    if attempt > max_attempts:
+                    if attempt >= max_attempts:
                         raise ex
-                    self._sleep(self.on_error_delay)
+                    self._wait_after_error(attempt)
+                    if self._abort:
+                        raise _AbortException() from ex
         except _AbortException as ex:
             if is_stated:
                 self.on_full_listing_stop(True, cast(Exception, ex.__cause__))
@@ -138,24 +209,27 @@ class DataPackageListPoller(ABC):
         is_stated = False
 
         def _body_callback(body: "DataPackageBody") -> None:
-            is_stated = True  # pylint: disable=unused-variable
+            nonlocal is_stated
+            is_stated = True
             self.on_incremental_start(body)
 
         try:
-            for attempt in range(1, max_attempts):
+            for attempt in range(1, max_attempts + 1):
                 try:
                     sub = self._api.get_data_package_list_iterative(
                         _body_callback,
-                        self.on_incremental_items,
+                        self._on_incremental_items,
                         if_modified_since,
                     )
                     break
                 except Exception as ex:  # pylint: disable=broad-except
                     if self._abort:
                         raise _AbortException() from ex
-                    if attempt > max_attempts:
+                    if attempt >= max_attempts:
                         raise
-                    self._sleep(self.on_error_delay)
+                    self._wait_after_error(attempt)
+                    if self._abort:
+                        raise _AbortException() from ex
 
             if not sub:
                 raise ValueError("subscription is None")
@@ -164,7 +238,9 @@ class DataPackageListPoller(ABC):
                 self.on_incremental_stop(False, None)
                 return sub
 
-            self._sleep(self.incomplete_delay)
+            self._wait(self.incomplete_delay)
+            if self._abort:
+                raise _AbortException()
 
             return self._run_listing_incomplete(sub.time_stamp_for_if_modified_since, is_stated, max_attempts)
         except _AbortException as ex:
@@ -180,30 +256,35 @@ class DataPackageListPoller(ABC):
     ) -> Optional["DataPackageBody"]:
         try:
             while True:
-                for attempt in range(1, max_attempts):
+                for attempt in range(1, max_attempts + 1):
                     try:
                         sub = self._api.get_data_package_list_iterative(
                             lambda _: None,
-                            self.on_incremental_items,
+                            self._on_incremental_items,
                             if_modified_since,
                         )
-
-                        if not sub:
-                            raise ValueError("subscription is None")
-
-                        if sub.state == DataPackageListState.UP_TO_DATE:
-                            self.on_incremental_stop(False, None)
-                            return sub
-
-                        self._sleep(self.incomplete_delay)
-
-                        if_modified_since = sub.time_stamp_for_if_modified_since
+                        break
                     except Exception as ex2:  # pylint: disable=broad-except
                         if self._abort:
                             raise _AbortException() from ex2
-                        if attempt > max_attempts:
+                        if attempt >= max_attempts:
                             raise
-                        self._sleep(self.on_error_delay)
+                        self._wait_after_error(attempt)
+                        if self._abort:
+                            raise _AbortException() from ex2
+
+                if not sub:
+                    raise ValueError("subscription is None")
+
+                if sub.state == DataPackageListState.UP_TO_DATE:
+                    self.on_incremental_stop(False, None)
+                    return sub
+
+                self._wait(self.incomplete_delay)
+                if self._abort:
+                    raise _AbortException()
+
+                if_modified_since = sub.time_stamp_for_if_modified_since
         except _AbortException as ex:
             if is_stated:
                 self.on_incremental_stop(True, cast(Exception, ex.__cause__))
@@ -257,5 +338,6 @@ class DataPackageListPoller(ABC):
         """
 
     def abort(self) -> None:
-        """Call this method to stop processing."""
+        """Call this method to stop processing. A poller that is waiting for the next poll stops immediately."""
         self._abort = True
+        self._abort_event.set()
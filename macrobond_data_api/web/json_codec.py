@@ -0,0 +1,148 @@
+from abc import ABC, abstractmethod
+from json import dumps as json_dumps, loads as json_loads
+from math import isfinite
+from numbers import Integral, Real
+from typing import TYPE_CHECKING, Any, Dict, Type, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from requests import Response
+
+__pdoc__ = {
+    "StdlibJsonCodec.__init__": False,
+    "OrjsonCodec.__init__": False,
+    "MsgspecJsonCodec.__init__": False,
+}
+
+
+class JsonCodec(ABC):
+    """
+    Encodes the request bodies and decodes the responses of a `macrobond_data_api.web.session.Session`.
+    Select one with the json_codec parameter of `macrobond_data_api.web.session.Session` or
+    `macrobond_data_api.web.web_client.WebClient`.
+    """
+
+    name: str = ""
+    """The name used to select the codec."""
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Decode a JSON document."""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as a UTF-8 JSON document.
+        A ValueError is raised if it contains NaN or infinity, since they are not valid JSON.
+        """
+
+    def decode_response(self, response: "Response") -> Any:
+        """Decode the body of a response."""
+        return self.loads(response.content)
+
+
+class StdlibJsonCodec(JsonCodec):
+    """The json module of the standard library. This is the default."""
+
+    name = "json"
+
+    def loads(self, data: bytes) -> Any:
+        return json_loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json_dumps(obj, allow_nan=False).encode("utf-8")
+
+    def decode_response(self, response: "Response") -> Any:
+        return response.json()
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    [orjson](https://github.com/ijl/orjson), which must be installed separately.
+    numpy arrays and numbers can be encoded.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)  # pylint: disable=no-member
+
+    def dumps(self, obj: Any) -> bytes:
+        _check_finite(obj)
+        return self._orjson.dumps(obj, option=self._orjson.OPT_SERIALIZE_NUMPY)  # pylint: disable=no-member
+
+
+class MsgspecJsonCodec(JsonCodec):
+    """
+    [msgspec](https://github.com/jcrist/msgspec), which must be installed separately.
+    numpy arrays and numbers can be encoded.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec  # pylint: disable=import-outside-toplevel,import-error
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder(enc_hook=_to_builtin)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        _check_finite(obj)
+        return self._encoder.encode(obj)
+
+
+# orjson and msgspec encode NaN and infinity as null, while the json module raises a ValueError with allow_nan=False
+def _check_finite(obj: Any) -> None:
+    if isinstance(obj, float):
+        if not isfinite(obj):
+            raise ValueError(f"Out of range float values are not JSON compliant: {obj!r}")
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _check_finite(value)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _check_finite(value)
+    else:
+        kind = getattr(getattr(obj, "dtype", None), "kind", None)
+        if kind in ("f", "c"):
+            import numpy  # pylint: disable=import-outside-toplevel
+
+            if not numpy.isfinite(obj).all():
+                raise ValueError("Out of range float values are not JSON compliant")
+        elif kind == "O":
+            for value in obj.flat:
+                _check_finite(value)
+
+
+# Converts the numpy arrays and numbers that msgspec cannot encode
+def _to_builtin(obj: Any) -> Any:
+    if hasattr(obj, "dtype") and hasattr(obj, "tolist"):
+        return obj.tolist()
+    if isinstance(obj, Integral):
+        return int(obj)
+    if isinstance(obj, Real):
+        return float(obj)
+    raise NotImplementedError(f"Encoding objects of type {type(obj).__name__} is unsupported")
+
+
+_CODECS: Dict[str, Type[JsonCodec]] = {x.name: x for x in (StdlibJsonCodec, OrjsonCodec, MsgspecJsonCodec)}
+
+
+def get_json_codec(codec: Union[str, JsonCodec]) -> JsonCodec:
+    """
+    Get a codec by name, "json", "orjson" or "msgspec". A `JsonCodec` is returned as it is.
+    An ImportError is raised if the package of the codec is not installed.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    codec_type = _CODECS.get(codec)
+    if codec_type is None:
+        raise ValueError(f"Unknown JSON codec {codec!r}, use one of {', '.join(_CODECS)}")
+    return codec_type()
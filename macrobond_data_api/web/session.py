@@ -1,7 +1,10 @@
-from typing import Callable, Dict, Optional, Any, TYPE_CHECKING, Sequence, Type, cast
+import io
+from threading import Lock
+from typing import Callable, Dict, Optional, Any, TYPE_CHECKING, Protocol, Sequence, Type, Union, cast
 
 from authlib.integrations.requests_client import OAuth2Session
 from authlib.integrations.base_client.errors import InvalidTokenError
+from requests.exceptions import InvalidJSONError
 from macrobond_data_api.common.types import Metadata
 
 from .web_types import (
@@ -18,6 +21,7 @@ from .scope import Scope
 from ._metadata_directory import _MetadataTypeDirectory
 from ._metadata import _Metadata
 from .configuration import Configuration
+from .json_codec import JsonCodec, StdlibJsonCodec, get_json_codec
 
 _socks_import_error: Optional[ImportError] = None
 try:
@@ -33,14 +37,48 @@ __pdoc__ = {
 }
 
 
-class _ResponseAsFileObject:
-    def __init__(self, response: "Response", chunk_size: int = 65536) -> None:
-        self.data = response.iter_content(chunk_size=chunk_size)
+class _ResponseAsFileObject(io.RawIOBase):
+    """A raw stream over the body of a response, decompressed as with `requests.Response.iter_content`."""
 
-    def read(self, n: int) -> bytes:
-        if n == 0:
-            return b""
-        return next(self.data, b"")
+    def __init__(self, response: "Response") -> None:
+        super().__init__()
+        raw: Any = response.raw
+        self._is_urllib3 = hasattr(raw, "stream")
+        if getattr(response, "_content_consumed", False):
+            raw = io.BytesIO(response.content)
+            self._is_urllib3 = False
+        self._raw = raw
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        with memoryview(buffer) as view:
+            size = len(view)
+            data = self._read(size)
+            # urllib3 1.x can return nothing before the end when the compressed data has not produced any output yet
+            while not data and self._is_urllib3 and not self._raw.closed:
+                data = self._read(size)
+            length = len(data)
+            view[:length] = data
+        return length
+
+    def _read(self, size: int) -> bytes:
+        if self._is_urllib3:
+            return self._raw.read(size, decode_content=True)
+        return self._raw.read(size)
+
+
+class _MetadataCreator(Protocol):
+    # The part of a Session that is used to create entities and series from a response
+    def _create_metadata(self, data: Optional[Dict[str, Any]]) -> Metadata: ...
+
+
+class _DictMetadataSession:
+    # Stands in for a Session where the data is decoded in another process.
+    # The metadata is kept as a dict and wrapped with Session._create_metadata when the result is returned.
+    def _create_metadata(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return data or {}
 
 
 class Session:
@@ -88,6 +126,11 @@ class Session:
     def auth2_session(self) -> OAuth2Session:
         return self.__auth2_session
 
+    @property
+    def json_codec(self) -> JsonCodec:
+        """The codec used to encode request bodies and decode responses."""
+        return self.__json_codec
+
     def __init__(
         self,
         username: str,
@@ -97,6 +140,7 @@ class Session:
         authorization_url: str = None,
         proxy: str = None,
         test_auth2_session: Any = None,
+        json_codec: Union[str, JsonCodec] = "json",
     ) -> None:
         if api_url is None:
             api_url = Configuration._default_api_url
@@ -111,6 +155,9 @@ class Session:
             self.__proxies = {"https": proxy, "http": proxy}
 
         self.__token_endpoint: Optional[str] = None
+        self.__fetch_token_lock = Lock()
+
+        self.__json_codec = get_json_codec(json_codec)
 
         if not self._is_https_url(authorization_url):
             raise ValueError("authorization_url is not https")
@@ -155,10 +202,11 @@ class Session:
         if not self._is_open:
             raise ValueError("Session is not open")
 
-        if self.token_endpoint is None:
-            self.__token_endpoint = self.discovery(self.authorization_url)
+        with self.__fetch_token_lock:
+            if self.token_endpoint is None:
+                self.__token_endpoint = self.discovery(self.authorization_url)
 
-        self.auth2_session.fetch_token(self.token_endpoint, proxies=self.__proxies)
+            self.auth2_session.fetch_token(self.token_endpoint, proxies=self.__proxies)
 
     def get(self, url: str, params: Dict[str, Any] = None, stream: bool = False) -> "Response":
         return self._request("GET", url, params, None, stream)
@@ -215,8 +263,12 @@ class Session:
 
         raise HttpException(response)
 
-    def _response_to_file_object(self, response: "Response") -> _ResponseAsFileObject:
-        return _ResponseAsFileObject(response)
+    def decode_json(self, response: "Response") -> Any:
+        """Decode the body of a response with `Session.json_codec`."""
+        return self.__json_codec.decode_response(response)
+
+    def _response_to_file_object(self, response: "Response", buffer_size: int = 65536) -> io.BufferedReader:
+        return io.BufferedReader(_ResponseAsFileObject(response), buffer_size)
 
     def _request(
         self, method: str, url: str, params: Optional[Dict[str, Any]], json: object, stream: bool
@@ -224,15 +276,26 @@ class Session:
         if not self._is_open:
             raise ValueError("Session is not open")
 
+        headers = {"Accept": "application/json"}
+        body: Dict[str, Any] = {"json": json}
+        if json is not None and not isinstance(self.__json_codec, StdlibJsonCodec):
+            # requests encodes the json parameter with the json module
+            try:
+                body = {"data": self.__json_codec.dumps(json)}
+            except ValueError as ex:
+                # requests raises this when the json module rejects the body, for example because it contains NaN
+                raise InvalidJSONError(ex) from ex
+            headers["Content-Type"] = "application/json"
+
         def http() -> "Response":
             return self.auth2_session.request(
                 method,
                 self.api_url + url,
                 params=params,
-                json=json,
+                **body,
                 stream=stream,
                 proxies=self.__proxies,
-                headers={"Accept": "application/json"},
+                headers=headers,
             )
 
         return self._if_status_code_401_fetch_token_and_retry(http)
@@ -1,10 +1,18 @@
 import time
 from datetime import datetime, timezone, timedelta
-from typing import Sequence, List, Dict, Iterator
+from typing import TYPE_CHECKING, Sequence, List, Dict, Iterator, Tuple
 
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import Series
 from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
 
 from .session import Session
+from ._web_api_series import _create_series
+from ._parallel import parallel_as_completed, parallel_map
+from ._split_in_to_chunks import split_in_to_chunks
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .web_types import EntityRequest
 
 
 class SubscriptionList:
@@ -69,6 +77,9 @@ class SubscriptionList:
 
         self._next_poll = datetime.now(timezone.utc)
 
+        # The modification time of the version of each series last returned by poll_series, by lower case name
+        self._modified: Dict[str, datetime] = {}
+
     def list(self) -> List[str]:
         """
         Lists series currently registered in the subscription list.
@@ -98,6 +109,8 @@ class SubscriptionList:
             raise ValueError("WebApi is not open")
 
         self._call("v1/subscriptionlist/set", keys)
+        kept = {x.lower() for x in keys}
+        self._forget([x for x in self._modified if x not in kept])
 
     def add(self, keys: Sequence[str]) -> None:
         """
@@ -132,11 +145,80 @@ class SubscriptionList:
         key_set = set(keys)
         self._session.post_or_raise("v1/subscriptionlist/remove", json=keys)
         timeout = datetime.now(timezone.utc) + timedelta(minutes=1)
-        while (
-            datetime.now(timezone.utc) < timeout
-            and set(self._session.post_or_raise("v1/subscriptionlist/checkifnotincluded", json=keys).json()) != key_set
-        ):
+        while datetime.now(timezone.utc) < timeout and set(self._check_if_not_included(keys)) != key_set:
             time.sleep(1)
+        self._forget(keys)
+
+    def sync(
+        self, keys: Sequence[str], chunk_size: int = 1000, max_workers: int = 4, timeout: timedelta = None
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Make the subscription list contain exactly the specified series.
+        Unlike `set`, only the difference is sent to the server. The current list is fetched once, the series to add
+        and remove are sent in chunks in parallel, and then only the series that are not yet confirmed are checked
+        until the server has applied all changes or the timeout has passed. Series names are compared case
+        insensitively.
+
+        .. Important:: You should not make several calls in parallel that modifies the list.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            A sequence of series names.
+        chunk_size : int
+            The maximum number of series names in each request.
+        max_workers : int
+            The maximum number of requests in flight at the same time.
+        timeout : timedelta
+            How long to wait for the server to confirm the changes. The default is one minute.
+
+        Returns
+        -------
+        Tuple[List[str], List[str]]
+            The names of the series that were added and the names of the series that were removed.
+        """
+        if not self._session._is_open:
+            raise ValueError("WebApi is not open")
+        if not isinstance(keys, Sequence) or isinstance(keys, str):
+            raise TypeError("keys is not a sequence")
+
+        current = {x.lower(): x for x in self.list()}
+        desired = {x.lower(): x for x in keys}
+        to_add = [name for lower, name in desired.items() if lower not in current]
+        to_remove = [name for lower, name in current.items() if lower not in desired]
+
+        requests = [("v1/subscriptionlist/add", x) for x in split_in_to_chunks(to_add, chunk_size)]
+        requests += [("v1/subscriptionlist/remove", x) for x in split_in_to_chunks(to_remove, chunk_size)]
+        for _ in parallel_map(lambda x: self._session.post_or_raise(x[0], json=x[1]), requests, max_workers):
+            pass
+
+        self._wait_until_applied(
+            to_add, to_remove, chunk_size, max_workers, timeout if timeout is not None else timedelta(minutes=1)
+        )
+        self._forget(to_remove)
+        return to_add, to_remove
+
+    def _wait_until_applied(
+        self, to_add: List[str], to_remove: List[str], chunk_size: int, max_workers: int, timeout: timedelta
+    ) -> None:
+        deadline = datetime.now(timezone.utc) + timeout
+        delay = 0.25
+        while to_add or to_remove:
+            not_included = {
+                x.lower()
+                for result in parallel_map(
+                    self._check_if_not_included, split_in_to_chunks(to_add + to_remove, chunk_size), max_workers
+                )
+                for x in result
+            }
+            to_add = [x for x in to_add if x.lower() in not_included]
+            to_remove = [x for x in to_remove if x.lower() not in not_included]
+
+            remaining = (deadline - datetime.now(timezone.utc)).total_seconds()
+            if (not to_add and not to_remove) or remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 8)
 
     def poll(self) -> Dict[str, datetime]:
         """
@@ -152,10 +234,16 @@ class SubscriptionList:
         if not self._session._is_open:
             raise ValueError("WebApi is not open")
 
-        interval = self._next_poll - datetime.now(timezone.utc)
-        if interval > timedelta():
-            time.sleep(interval.total_seconds())
+        interval = self._time_until_next_poll()
+        if interval > 0:
+            time.sleep(interval)
+
+        return self._get_updates()
 
+    def _time_until_next_poll(self) -> float:
+        return (self._next_poll - datetime.now(timezone.utc)).total_seconds()
+
+    def _get_updates(self) -> Dict[str, datetime]:
         data = self._session.get_or_raise(
             "v1/subscriptionlist/getupdates", params={"ifModifiedSince": self.last_modified.isoformat()}
         ).json()
@@ -183,13 +271,83 @@ class SubscriptionList:
             if self.no_more_changes:
                 break
 
+    def poll_series(self, chunk_size: int = 200, max_workers: int = 4) -> Iterator[Series]:
+        """
+        Polls for changes on the series in the subscription list and downloads the changed series.
+        Like `poll`, this waits for the poll interval, but then keeps polling until there are no more changes and
+        merges the changes so that each series is only downloaded once per poll. The series are downloaded in chunks
+        in parallel and each series is returned as soon as its chunk has been downloaded.
+
+        Series that have already been returned are only downloaded again if they have been modified since then.
+        If a chunk cannot be downloaded, its series are returned with the error and `StatusCode.OTHER`, and the other
+        chunks continue.
+
+        Parameters
+        ----------
+        chunk_size : int
+            The maximum number of series in each request.
+        max_workers : int
+            The maximum number of requests in flight at the same time.
+
+        Returns
+        -------
+        Iterator[Series]
+            The series that have been updated.
+
+        Examples
+        --------
+        ```python
+        with WebClient() as api:
+            subscription_list = api.subscription_list(datetime.now(timezone.utc))
+            subscription_list.set(['sek', 'nok'])
+            while True:
+                for series in subscription_list.poll_series():
+                    print(f'Series "{series.name}", last updated "{series.last_modified}"')
+        ```
+        """
+        changes = self.poll()
+        while not self.no_more_changes:
+            for name, modified in self.poll().items():
+                if name not in changes or changes[name] < modified:
+                    changes[name] = modified
+
+        if len(changes) == 0:
+            return
+
+        for names, future in parallel_as_completed(
+            self._fetch_series, split_in_to_chunks(list(changes), chunk_size), max_workers
+        ):
+            exception = future.exception()
+            if exception is not None:
+                for name in names:
+                    yield Series(name, str(exception), StatusCode.OTHER, None, None, None, None)
+                continue
+            for series in future.result():
+                if not series.is_error or series.status_code == StatusCode.NOT_MODIFIED:
+                    self._modified[series.name.lower()] = changes[series.name]
+                if series.status_code != StatusCode.NOT_MODIFIED:
+                    yield series
+
+    def _fetch_series(self, names: Sequence[str]) -> List[Series]:
+        requests: List["EntityRequest"] = []
+        for name in names:
+            modified = self._modified.get(name.lower())
+            requests.append({"name": name, "ifModifiedSince": modified.isoformat() if modified else None})
+        response = self._session.series.post_fetch_series(*requests)
+        return [_create_series(x, y, self._session) for x, y in zip(response, names)]
+
+    # Drops the modification times of series that are no longer in the list so that _modified does not grow forever
+    def _forget(self, names: Sequence[str]) -> None:
+        for name in names:
+            self._modified.pop(name.lower(), None)
+
     def _call(self, endpoint: str, keys: Sequence[str]) -> None:
         if not isinstance(keys, Sequence):
             raise TypeError("keys is not a sequence")
         self._session.post_or_raise(endpoint, json=keys)
         timeout = datetime.now(timezone.utc) + timedelta(minutes=1)
-        while (
-            datetime.now(timezone.utc) < timeout
-            and self._session.post_or_raise("v1/subscriptionlist/checkifnotincluded", json=keys).json()
-        ):
+        while datetime.now(timezone.utc) < timeout and self._check_if_not_included(keys):
             time.sleep(1)
+
+    def _check_if_not_included(self, keys: Sequence[str]) -> List[str]:
+        return self._session.post_or_raise("v1/subscriptionlist/checkifnotincluded", json=keys).json()
@@ -0,0 +1,240 @@
+import os
+import pickle
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from hashlib import sha256
+from json import dumps as json_dumps
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Tuple
+
+from macrobond_data_api.common._pickle_directory import _dump_pickle
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import UnifiedSeries, UnifiedSeriesList
+from macrobond_data_api.common.types._time_key import _time_key
+from macrobond_data_api.common.unified_series_engine import _is_relative_point
+
+from ._split_in_to_chunks import split_in_to_chunks
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .session import Session
+    from .web_types import EntityRequest, UnifiedSeriesRequest
+
+__pdoc__ = {
+    "UnifiedSeriesCache.__init__": False,
+}
+
+_FILE_EXTENSION = ".pickle"
+
+_Entry = Tuple[UnifiedSeriesList, Dict[str, datetime]]
+
+
+class UnifiedSeriesCache:
+    """
+    A cache of the results of `macrobond_data_api.web.web_api.WebApi.get_unified_series`, in memory and optionally
+    in a directory with one file per request.
+
+    Set it as `macrobond_data_api.web.web_api.WebApi.unified_series_cache` to use it. The results are keyed by a hash
+    of the request. Requests with a relative start or end point also include the current date in the key, so they are
+    never reused across days. Results with errors are not cached.
+
+    A result is removed when any of its series has been modified after the LastModifiedTimeStamp in the metadata of
+    the result. Pass the modification times from a data package list or a subscription list to `invalidate`.
+    Series may also have been modified while a directory was not in use, so a result that is read from the directory
+    is only used after the server has confirmed that none of its series have been modified since it was stored.
+
+    At most max_entries results are kept in memory and in the directory. The least recently used results are
+    removed first.
+
+    Examples
+    --------
+    ```python
+    with WebClient() as api:
+        api.unified_series_cache = UnifiedSeriesCache()
+        subscription_list = api.subscription_list(last_modified)
+        subscription_list.set(["usgdp", "uscpi"])
+        while True:
+            api.unified_series_cache.invalidate(subscription_list.poll())
+            result = api.get_unified_series("usgdp", "uscpi")
+    ```
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_entries: int = 1000) -> None:
+        self._directory = directory
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._modified: Dict[str, datetime] = {}
+        self._lock = Lock()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @property
+    def directory(self) -> Optional[str]:
+        """The directory where the results are stored or None if they are only kept in memory."""
+        return self._directory
+
+    def get(
+        self, request: "UnifiedSeriesRequest", as_matrix: bool = False, session: Optional["Session"] = None
+    ) -> Optional[UnifiedSeriesList]:
+        """
+        Get the cached result of a request or None if it is not cached or has been invalidated.
+        Results decoded with as_matrix are cached separately.
+        A result that is not in memory but in the directory is checked with the server using session, and is not
+        returned if session is None.
+        """
+        key = self._key(request, as_matrix=as_matrix)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            entry = self._read(key)
+            if entry is None or session is None:
+                return None
+            if _is_modified(session, entry[1]):
+                self._remove(key)
+                return None
+        if self._is_stale(entry[1]):
+            self._remove(key)
+            return None
+        self._put_in_memory(key, entry)
+        return entry[0]
+
+    def put(self, request: "UnifiedSeriesRequest", result: UnifiedSeriesList, as_matrix: bool = False) -> None:
+        """
+        Store the result of a request. Results with errors or without LastModifiedTimeStamp in the metadata are not
+        stored.
+        """
+        if result.get_errors():
+            return
+        modified: Dict[str, datetime] = {}
+        for series in result:
+            time = series.metadata.get("LastModifiedTimeStamp")
+            if not isinstance(time, datetime):
+                return
+            modified[series.name.lower()] = time
+        key = self._key(request, as_matrix=as_matrix)
+        self._put_in_memory(key, (result, modified))
+        if self._directory is not None:
+            self._write(key, (result, modified))
+            self._remove_old_files()
+
+    def invalidate(self, modified: Mapping[str, datetime]) -> None:
+        """
+        Remove the results with series that have been modified after they were cached.
+
+        Parameters
+        ----------
+        modified : Mapping[str, datetime]
+            The time when each series was last modified, for example the result of
+            `macrobond_data_api.web.subscription_list.SubscriptionList.poll` or
+            `{x.name: x.modified for x in update.items}` for a data package list update.
+        """
+        with self._lock:
+            for name, time in modified.items():
+                previous = self._modified.get(name.lower())
+                if previous is None or previous < _time_key(time):
+                    self._modified[name.lower()] = _time_key(time)
+            stale = [key for key, entry in self._entries.items() if self._is_stale(entry[1])]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all results."""
+        with self._lock:
+            self._entries.clear()
+        if self._directory is not None:
+            for file_name in os.listdir(self._directory):
+                if file_name.endswith(_FILE_EXTENSION):
+                    os.remove(os.path.join(self._directory, file_name))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(request: "UnifiedSeriesRequest", today: Optional[date] = None, as_matrix: bool = False) -> str:
+        canonical = json_dumps(request, sort_keys=True, separators=(",", ":"))
+        if as_matrix:
+            canonical += "matrix"
+        if _is_relative_point(request.get("startPoint")) or _is_relative_point(request.get("endPoint")):
+            canonical += (today or datetime.now(timezone.utc).date()).isoformat()
+        return sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _is_stale(self, modified: Dict[str, datetime]) -> bool:
+        for name, time in modified.items():
+            latest = self._modified.get(name)
+            if latest is not None and _time_key(time) < latest:
+                return True
+        return False
+
+    def _put_in_memory(self, key: str, entry: _Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self._directory is not None:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory or "", key + _FILE_EXTENSION)
+
+    def _read(self, key: str) -> Optional[_Entry]:
+        if self._directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                result, modified = pickle.load(f)
+            # The modification time of the file is the time it was last used
+            os.utime(self._path(key))
+        except FileNotFoundError:
+            return None
+        if result._matrix is not None:
+            result = result._with_matrix(result._matrix)
+        return result, modified
+
+    def _write(self, key: str, entry: _Entry) -> None:
+        result, modified = entry
+        matrix = result._matrix
+        # The columns of a matrix are stored once in the matrix and made views again when read
+        series = [
+            UnifiedSeries(
+                x.name, x.error_message, dict(x.metadata.items()), [] if matrix is not None else list(x.values)
+            )
+            for x in result
+        ]
+        _dump_pickle((UnifiedSeriesList(series, list(result.dates), matrix), modified), self._path(key))
+
+    # Removes the least recently used files when there are more than max_entries in the directory
+    def _remove_old_files(self) -> None:
+        directory = self._directory or ""
+        used: List[Tuple[float, str]] = []
+        for file_name in os.listdir(directory):
+            if file_name.endswith(_FILE_EXTENSION):
+                path = os.path.join(directory, file_name)
+                try:
+                    used.append((os.path.getmtime(path), path))
+                except FileNotFoundError:
+                    pass
+        used.sort()
+        for _, path in used[: max(len(used) - self._max_entries, 0)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+# Asks the server whether any of the series has been modified after the time stored with a result
+def _is_modified(session: "Session", modified: Dict[str, datetime]) -> bool:
+    requests: List["EntityRequest"] = [{"name": x, "ifModifiedSince": y.isoformat()} for x, y in modified.items()]
+    for chunk in split_in_to_chunks(requests, 200):
+        for response in session.series.fetch_series_last_modified_time_stamp(*chunk):
+            if response.get("errorCode") != StatusCode.NOT_MODIFIED:
+                return True
+    return False
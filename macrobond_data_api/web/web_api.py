@@ -1,3 +1,5 @@
+from typing import Optional
+
 from macrobond_data_api.common import Api
 
 from ._web_only_api import (
@@ -6,6 +8,7 @@ from ._web_only_api import (
     get_data_package_list_iterative,
     get_data_package_list_chunked,
     subscription_list,
+    async_subscription_list,
 )
 from ._web_api_metadata import metadata_list_values, metadata_get_attribute_information, metadata_get_value_information
 
@@ -18,6 +21,9 @@ from ._web_api_revision import (
     get_vintage_series,
     get_observation_history,
     get_many_series_with_revisions,
+    get_vintage_series_many,
+    get_nth_releases,
+    get_observation_history_many,
 )
 
 from ._web_api_series import (
@@ -33,6 +39,7 @@ from ._web_api_in_house_series import delete_serie, upload_series
 
 from ._web_api_search import entity_search_multi_filter
 from .session import Session
+from .unified_series_cache import UnifiedSeriesCache
 
 
 __pdoc__ = {
@@ -44,6 +51,11 @@ class WebApi(Api):
     def __init__(self, session: Session) -> None:
         super().__init__()
         self._session = session
+        self.unified_series_cache: Optional[UnifiedSeriesCache] = None
+        """
+        If set, the results of `get_unified_series` are cached in this
+        `macrobond_data_api.web.unified_series_cache.UnifiedSeriesCache`.
+        """
 
     @property
     def session(self) -> Session:
@@ -75,6 +87,10 @@ class WebApi(Api):
     get_data_package_list_chunked = get_data_package_list_chunked
     entity_search_multi_filter_long = entity_search_multi_filter_long
     subscription_list = subscription_list
+    async_subscription_list = async_subscription_list
+    get_vintage_series_many = get_vintage_series_many
+    get_nth_releases = get_nth_releases
+    get_observation_history_many = get_observation_history_many
 
     # Search
 
@@ -6,6 +6,7 @@ from .series_tree_methods import SeriesTreeMethods
 
 from .http_exception import HttpException
 from .problem_details_exception import ProblemDetailsException
+from .unified_series_split_warning import UnifiedSeriesSplitWarning
 
 from .entity_info_for_display_response import (
     EntityInfoForDisplayItem,
@@ -59,4 +60,12 @@ from .series_request import SeriesRequest
 
 from .in_house_series_methods import InHouseSeriesMethods
 
-from .data_package_list_context import DataPackageListContext, DataPackageListContextManager
+from .data_package_list_context import (
+    DataPackageListContext,
+    DataPackageListContextManager,
+    DataPackageListReadAheadMetrics,
+)
+
+from .data_package_list_chunk import DataPackageListChunk
+
+from .data_package_list_update import DataPackageListUpdate
@@ -0,0 +1,125 @@
+from array import array
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Iterator, List, Optional, Sequence, Tuple, overload
+
+__pdoc__ = {
+    "DataPackageListChunk.__init__": False,
+}
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class DataPackageListChunk(Sequence[Tuple[str, datetime]]):
+    """
+    A compact chunk of items in the data package list.
+    The names are kept in a single string table and the modification times in an int64 array of
+    microseconds since the Unix epoch, which uses a fraction of the memory of a list of tuples.
+    Tuples of name and `datetime` are created on demand when the chunk is indexed or iterated.
+    """
+
+    __slots__ = ("_names", "_name_ends", "_modified", "_tzinfo")
+
+    def __init__(self, names: str, name_ends: "array[int]", modified: "array[int]", tz: Optional[tzinfo]) -> None:
+        self._names = names
+        self._name_ends = name_ends
+        self._modified = modified
+        self._tzinfo = tz
+
+    @property
+    def modified_epoch_microseconds(self) -> "array[int]":
+        """
+        The time when each entity was last modified as an int64 array of microseconds since the Unix epoch.
+        Timestamps without time zone are treated as UTC.
+        """
+        return self._modified
+
+    @property
+    def tzinfo(self) -> Optional[tzinfo]:
+        """The time zone of the modification times or None if they do not have a time zone."""
+        return self._tzinfo
+
+    def name(self, index: int) -> str:
+        """The name of the entity at index."""
+        if index < 0:
+            index += len(self._name_ends)
+        start = self._name_ends[index - 1] if index > 0 else 0
+        return self._names[start : self._name_ends[index]]
+
+    def modified(self, index: int) -> datetime:
+        """The time when the entity at index was last modified."""
+        if self._tzinfo is None:
+            return _EPOCH + self._modified[index] * _MICROSECOND
+        return (_EPOCH_UTC + self._modified[index] * _MICROSECOND).astimezone(self._tzinfo)
+
+    def names(self) -> Iterator[str]:
+        """Iterate over the names of the entities."""
+        start = 0
+        for end in self._name_ends:
+            yield self._names[start:end]
+            start = end
+
+    def to_list(self) -> List[Tuple[str, datetime]]:
+        """Return the items as a list of tuples with the name and timestamp when this entity was last modified."""
+        return list(self)
+
+    @overload
+    def __getitem__(self, i: int) -> Tuple[str, datetime]:
+        pass
+
+    @overload
+    def __getitem__(self, s: slice) -> List[Tuple[str, datetime]]:
+        pass
+
+    def __getitem__(self, key):  # type: ignore
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        if key < -len(self) or key >= len(self):
+            raise IndexError("DataPackageListChunk index out of range")
+        return self.name(key), self.modified(key)
+
+    def __iter__(self) -> Iterator[Tuple[str, datetime]]:
+        for i, name in enumerate(self.names()):
+            yield name, self.modified(i)
+
+    def __len__(self) -> int:
+        return len(self._name_ends)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DataPackageListChunk):
+            return self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"DataPackageListChunk(len={len(self)})"
+
+
+class _DataPackageListChunkBuilder:
+    __slots__ = ("_names", "_name_ends", "_length", "_modified", "_tzinfo")
+
+    def __init__(self) -> None:
+        self._names: List[str] = []
+        self._name_ends: "array[int]" = array("q")
+        self._length = 0
+        self._modified: "array[int]" = array("q")
+        self._tzinfo: Optional[tzinfo] = None
+
+    def append(self, name: str, modified: datetime) -> None:
+        if len(self._modified) == 0:
+            self._tzinfo = modified.tzinfo
+        elif (modified.tzinfo is None) != (self._tzinfo is None):
+            raise Exception("bad format: modified is mixing timestamps with and without time zone")
+
+        self._length += len(name)
+        self._names.append(name)
+        self._name_ends.append(self._length)
+        self._modified.append((modified - (_EPOCH if modified.tzinfo is None else _EPOCH_UTC)) // _MICROSECOND)
+
+    def __len__(self) -> int:
+        return len(self._modified)
+
+    def build(self) -> DataPackageListChunk:
+        return DataPackageListChunk("".join(self._names), self._name_ends, self._modified, self._tzinfo)
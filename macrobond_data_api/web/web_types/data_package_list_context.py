@@ -1,11 +1,14 @@
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Optional, Tuple, Iterable, Iterator, List
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Iterable, Iterator, List, Sequence, Union
 
 import ijson
 
 from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
 
 from .data_package_list_state import DataPackageListState
+from .data_package_list_chunk import _DataPackageListChunkBuilder
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..web_api import WebApi
@@ -14,29 +17,39 @@ if TYPE_CHECKING:  # pragma: no cover
 __pdoc__ = {
     "DataPackageListContext.__init__": False,
     "DataPackageListContextManager.__init__": False,
+    "DataPackageListReadAheadMetrics.__init__": False,
 }
 
 
-class _DataPackageListContextIterator(Iterator[List[Tuple[str, datetime]]], Iterable[List[Tuple[str, datetime]]]):
+class _DataPackageListContextIterator(
+    Iterator[Sequence[Tuple[str, datetime]]], Iterable[Sequence[Tuple[str, datetime]]]
+):
     _is_uesd = False
     _reached_the_end_of_array = False
 
-    def __init__(self, ijson_parse: Any, chunk_size: int) -> None:
+    def __init__(self, ijson_parse: Any, chunk_size: int, compact: bool = False) -> None:
         self._ijson_parse = ijson_parse
         self.chunk_size = chunk_size
+        self.compact = compact
 
-    def __iter__(self) -> Iterator[List[Tuple[str, datetime]]]:
+    def __iter__(self) -> Iterator[Sequence[Tuple[str, datetime]]]:
         if self._is_uesd:
             raise Exception("iterator is already used")
         self._is_uesd = True
         return self
 
-    def __next__(self) -> List[Tuple[str, datetime]]:
+    def __next__(self) -> Sequence[Tuple[str, datetime]]:
         if self._reached_the_end_of_array:
             raise StopIteration()
+        items: Union[List[Tuple[str, datetime]], _DataPackageListChunkBuilder] = (
+            _DataPackageListChunkBuilder() if self.compact else []
+        )
+        self._read_chunk(items)
+        return items.build() if isinstance(items, _DataPackageListChunkBuilder) else items
+
+    def _read_chunk(self, items: Union[List[Tuple[str, datetime]], _DataPackageListChunkBuilder]) -> None:
         name = ""
         modified: Optional[datetime] = None
-        items: List[Tuple[str, datetime]] = []
         while True:
             prefix, event, value = next(self._ijson_parse)
             if event == "end_map":
@@ -44,15 +57,18 @@ class _DataPackageListContextIterator(Iterator[List[Tuple[str, datetime]]], Iter
                     raise Exception("bad format: name was not found")
                 if modified is None:
                     raise Exception("bad format: modified was not found")
-                items.append((name, modified))
+                if isinstance(items, list):
+                    items.append((name, modified))
+                else:
+                    items.append(name, modified)
                 name = ""
                 modified = None
                 if len(items) == self.chunk_size:
-                    return items
+                    return
             elif event == "end_array":
                 self._reached_the_end_of_array = True
                 if len(items) != 0:
-                    return items
+                    return
                 raise StopIteration()
             elif prefix == "entities.item.name":
                 if event != "string":
@@ -64,6 +80,144 @@ class _DataPackageListContextIterator(Iterator[List[Tuple[str, datetime]]], Iter
                 modified = _parse_iso8601(value)
 
 
+class DataPackageListReadAheadMetrics:
+    """
+    Metrics of the read-ahead buffer used when the data package list is read and parsed on a background thread.
+    Use them to size the buffer: many producer waits mean that the consumer is the bottleneck and a larger buffer
+    keeps the connection drained, many consumer waits mean that the network is the bottleneck.
+    """
+
+    __slots__ = ("_capacity", "_queue", "_max_buffered_chunks", "_total_chunks", "_producer_waits", "_consumer_waits")
+
+    def __init__(self, capacity: int, queue: "Queue[Any]") -> None:
+        self._capacity = capacity
+        self._queue = queue
+        self._max_buffered_chunks = 0
+        self._total_chunks = 0
+        self._producer_waits = 0
+        self._consumer_waits = 0
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of chunks in the buffer."""
+        return self._capacity
+
+    @property
+    def buffered_chunks(self) -> int:
+        """The number of parsed chunks currently waiting in the buffer."""
+        return self._queue.qsize()
+
+    @property
+    def max_buffered_chunks(self) -> int:
+        """The highest number of chunks that have been waiting in the buffer at the same time."""
+        return self._max_buffered_chunks
+
+    @property
+    def total_chunks(self) -> int:
+        """The number of chunks parsed by the background thread so far."""
+        return self._total_chunks
+
+    @property
+    def producer_waits(self) -> int:
+        """The number of times the background thread had to wait because the buffer was full."""
+        return self._producer_waits
+
+    @property
+    def consumer_waits(self) -> int:
+        """The number of times the consumer had to wait because the buffer was empty."""
+        return self._consumer_waits
+
+    def __repr__(self) -> str:
+        return (
+            f"DataPackageListReadAheadMetrics(capacity={self.capacity}, buffered_chunks={self.buffered_chunks}, "
+            f"max_buffered_chunks={self.max_buffered_chunks}, total_chunks={self.total_chunks}, "
+            f"producer_waits={self.producer_waits}, consumer_waits={self.consumer_waits})"
+        )
+
+
+class _ReadAheadEnd:
+    __slots__ = ("exception",)
+
+    def __init__(self, exception: Optional[BaseException]) -> None:
+        self.exception = exception
+
+
+class _ReadAheadIterator(Iterator[Sequence[Tuple[str, datetime]]], Iterable[Sequence[Tuple[str, datetime]]]):
+    _is_uesd = False
+    _reached_the_end = False
+
+    def __init__(self, iterator: _DataPackageListContextIterator, capacity: int) -> None:
+        self._iterator = iterator
+        self._queue: "Queue[Union[Sequence[Tuple[str, datetime]], _ReadAheadEnd]]" = Queue(capacity)
+        self._stop = Event()
+        self.metrics = DataPackageListReadAheadMetrics(capacity, self._queue)
+        self._thread = Thread(target=self._run, name="DataPackageListReadAhead", daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Union[Sequence[Tuple[str, datetime]], _ReadAheadEnd]) -> bool:
+        try:
+            self._queue.put_nowait(item)
+        except Full:
+            self.metrics._producer_waits += 1
+            while True:
+                if self._stop.is_set():
+                    return False
+                try:
+                    self._queue.put(item, timeout=0.1)
+                    break
+                except Full:
+                    pass
+        self.metrics._max_buffered_chunks = max(self.metrics._max_buffered_chunks, self._queue.qsize())
+        return True
+
+    def _run(self) -> None:
+        try:
+            for chunk in self._iterator:
+                if self._stop.is_set():
+                    return
+                self.metrics._total_chunks += 1
+                if not self._put(chunk):
+                    return
+            self._put(_ReadAheadEnd(None))
+        except BaseException as ex:  # pylint: disable=broad-except
+            if not self._stop.is_set():
+                self._put(_ReadAheadEnd(ex))
+
+    def __iter__(self) -> Iterator[Sequence[Tuple[str, datetime]]]:
+        if self._is_uesd:
+            raise Exception("iterator is already used")
+        self._is_uesd = True
+        return self
+
+    def __next__(self) -> Sequence[Tuple[str, datetime]]:
+        if self._reached_the_end:
+            raise StopIteration()
+        try:
+            item = self._queue.get_nowait()
+        except Empty:
+            if self._stop.is_set():
+                raise StopIteration() from None
+            self.metrics._consumer_waits += 1
+            item = self._queue.get()
+        if isinstance(item, _ReadAheadEnd):
+            self._reached_the_end = True
+            if item.exception is not None:
+                raise item.exception
+            raise StopIteration()
+        return item
+
+    def stop(self) -> None:
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                break
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._thread.join(timeout)
+
+
 class DataPackageListContext:
     @property
     def time_stamp_for_if_modified_since(self) -> datetime:
@@ -89,16 +243,27 @@ class DataPackageListContext:
         return self._state
 
     @property
-    def items(self) -> Iterable[List[Tuple[str, datetime]]]:
-        """An iterable contining Lists of tuples with the name and Timestamp when this entity was last modified"""
+    def items(self) -> Iterable[Sequence[Tuple[str, datetime]]]:
+        """
+        An iterable contining Lists of tuples with the name and Timestamp when this entity was last modified.
+        If compact was requested, each chunk is instead a
+        `macrobond_data_api.web.web_types.data_package_list_chunk.DataPackageListChunk`.
+        """
         return self._items
 
+    @property
+    def read_ahead_metrics(self) -> Optional[DataPackageListReadAheadMetrics]:
+        """
+        Metrics of the read-ahead buffer or None if read-ahead was not requested.
+        """
+        return self._items.metrics if isinstance(self._items, _ReadAheadIterator) else None
+
     def __init__(
         self,
         time_stamp_for_if_modified_since: datetime,
         download_full_list_on_or_after: Optional[datetime],
         state: DataPackageListState,
-        items: _DataPackageListContextIterator,
+        items: Union[_DataPackageListContextIterator, _ReadAheadIterator],
     ) -> None:
         self._time_stamp_for_if_modified_since = time_stamp_for_if_modified_since
         self._download_full_list_on_or_after = download_full_list_on_or_after
@@ -133,12 +298,22 @@ def _parse_body(
 
 
 class DataPackageListContextManager:
-    def __init__(self, if_modified_since: Optional[datetime], chunk_size: int, webApi: "WebApi") -> None:
+    def __init__(
+        self,
+        if_modified_since: Optional[datetime],
+        chunk_size: int,
+        webApi: "WebApi",
+        compact: bool = False,
+        read_ahead: int = 0,
+    ) -> None:
         self._if_modified_since = if_modified_since
         self.chunk_size = chunk_size
+        self.compact = compact
+        self.read_ahead = read_ahead
         self._webApi: Optional["WebApi"] = webApi
         self._iterator_started = False
         self._response: Optional["Response"] = None
+        self._read_ahead_iterator: Optional[_ReadAheadIterator] = None
 
     def __enter__(self) -> DataPackageListContext:
         params = {}
@@ -168,11 +343,15 @@ class DataPackageListContextManager:
             if not self._if_modified_since and download_full_list_on_or_after is None:
                 raise Exception("bad format: downloadFullListOnOrAfter was not found")
 
+            items = _DataPackageListContextIterator(ijson_parse, self.chunk_size, self.compact)
+            if self.read_ahead > 0:
+                self._read_ahead_iterator = _ReadAheadIterator(items, self.read_ahead)
+
             return DataPackageListContext(
                 time_stamp_for_if_modified_since,
                 download_full_list_on_or_after,
                 state,
-                _DataPackageListContextIterator(ijson_parse, self.chunk_size),
+                self._read_ahead_iterator or items,
             )
 
         except Exception as e:
@@ -181,6 +360,11 @@ class DataPackageListContextManager:
 
     def __exit__(self, exception_type: Any, exception_value: Any, traceback: Any) -> None:
         self._webApi = None
+        if self._read_ahead_iterator:
+            self._read_ahead_iterator.stop()
         if self._response:
             self._response.close()
             self._response = None
+        if self._read_ahead_iterator:
+            self._read_ahead_iterator.join(5)
+            self._read_ahead_iterator = None
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import List
+
+from .data_package_body import DataPackageBody
+from .data_pacakge_list_item import DataPackageListItem
+
+__pdoc__ = {
+    "DataPackageListUpdate.__init__": False,
+}
+
+
+@dataclass(init=False)
+class DataPackageListUpdate:
+    """A chunk of items from a listing of the data package list."""
+
+    __slots__ = ("body", "items", "is_full_listing")
+
+    body: DataPackageBody
+    items: List[DataPackageListItem]
+    is_full_listing: bool
+
+    def __init__(self, body: DataPackageBody, items: List[DataPackageListItem], is_full_listing: bool) -> None:
+        self.body = body
+        """The body of the listing that the items belong to."""
+
+        self.items = items
+        """The items in this chunk."""
+
+        self.is_full_listing = is_full_listing
+        """True if the items are part of a full listing and False if they are part of an incremental listing."""
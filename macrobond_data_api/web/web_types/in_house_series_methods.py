@@ -69,7 +69,7 @@ class InHouseSeriesMethods:
             403 Forbidden. Not authorized.
         """
         response = self.__session.get_or_raise("v1/seriestree/getseriesstoragelocations")
-        return cast(List["SeriesStorageLocationResponse"], response.json())
+        return cast(List["SeriesStorageLocationResponse"], self.__session.decode_json(response))
 
     # Get /v1/seriestree/getusedinhousecategories
     def get_used_inhouse_categories(self) -> List[str]:
@@ -87,4 +87,4 @@ class InHouseSeriesMethods:
             403 Forbidden. Not authorized.
         """
         response = self.__session.get_or_raise("v1/seriestree/getusedinhousecategories")
-        return cast(List[str], response.json())
+        return cast(List[str], self.__session.decode_json(response))
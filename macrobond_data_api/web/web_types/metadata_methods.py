@@ -30,7 +30,7 @@ class MetadataMethods:
 
         """
         response = self.__session.get_or_raise("v1/metadata/getattributeinformation", params={"n": attribute_names})
-        return cast(List["MetadataAttributeInformationResponse"], response.json())
+        return cast(List["MetadataAttributeInformationResponse"], self.__session.decode_json(response))
 
     # Get /v1/metadata/getvalueinformation
     def get_value_information(self, *metadata_value: Tuple[str, str]) -> "MetadataValueInformationResponse":
@@ -55,7 +55,7 @@ class MetadataMethods:
             "v1/metadata/getvalueinformation",
             params={"v": list(map(lambda x: x[0] + "," + x[1], metadata_value))},
         )
-        return cast("MetadataValueInformationResponse", response.json())
+        return cast("MetadataValueInformationResponse", self.__session.decode_json(response))
 
     # Get /v1/metadata/listattributevalues
     def list_attribute_values(self, attribute_name: str) -> "MetadataValueInformationResponse":
@@ -77,4 +77,4 @@ class MetadataMethods:
             404 The attribute was not found.
         """
         response = self.__session.get_or_raise("v1/metadata/listattributevalues", params={"n": attribute_name})
-        return cast("MetadataValueInformationResponse", response.json())
+        return cast("MetadataValueInformationResponse", self.__session.decode_json(response))
@@ -65,7 +65,7 @@ class SearchMethods:
 
         response = self.__session.get_or_raise("v1/search/entities", params=params)
 
-        return cast("SearchResponse", response.json())
+        return cast("SearchResponse", self.__session.decode_json(response))
 
     # post /entities
     def post_entities(self, request: "SearchRequest") -> "SearchResponse":
@@ -86,7 +86,7 @@ class SearchMethods:
             404 At least one attribute was not found.
         """
         response = self.__session.post_or_raise("v1/search/entities", json=request)
-        return cast("SearchResponse", response.json())
+        return cast("SearchResponse", self.__session.decode_json(response))
 
     def filter_lists(self, entity_type: str) -> List["ItemListingResponse"]:
         """
@@ -104,7 +104,7 @@ class SearchMethods:
             403 Forbidden. Not authorized.
         """
         response = self.__session.get_or_raise("v1/search/filterlists", params={"entityType": entity_type})
-        return cast(List["ItemListingResponse"], response.json())
+        return cast(List["ItemListingResponse"], self.__session.decode_json(response))
 
     def entities_for_display(self, request: "SearchForDisplayRequest") -> "SearchForDisplayResponse":
         """
@@ -125,4 +125,4 @@ class SearchMethods:
             404 At least one attribute was not found.
         """
         response = self.__session.post_or_raise("v1/search/entitiesfordisplay", json=request)
-        return cast("SearchForDisplayResponse", response.json())
+        return cast("SearchForDisplayResponse", self.__session.decode_json(response))
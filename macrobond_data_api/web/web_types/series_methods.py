@@ -40,7 +40,7 @@ class SeriesMethods:
         403 Forbidden. Not authorized.
         """
         response = self.__session.get_or_raise("v1/series/fetchentities", params={"n": entitie_names})
-        return cast(List["EntityResponse"], response.json())
+        return cast(List["EntityResponse"], self.__session.decode_json(response))
 
     # Get /v1/series/fetchseries
     def get_fetch_series(self, *series_names: str) -> List["SeriesResponse"]:
@@ -60,7 +60,7 @@ class SeriesMethods:
             403 Forbidden. Not authorized.
         """
         response = self.__session.get_or_raise("v1/series/fetchseries", params={"n": series_names})
-        return cast(List["SeriesResponse"], response.json())
+        return cast(List["SeriesResponse"], self.__session.decode_json(response))
 
     # Post /v1/series/fetchseries
     def post_fetch_series(self, *series: "EntityRequest") -> List["SeriesResponse"]:
@@ -82,7 +82,7 @@ class SeriesMethods:
             403 Forbidden. Not authorized.
         """
         response = self.__session.post_or_raise("v1/series/fetchseries", json=series)
-        return cast(List["SeriesResponse"], response.json())
+        return cast(List["SeriesResponse"], self.__session.decode_json(response))
 
     # Post /fetchseries
     def fetch_series_last_modified_time_stamp(self, *requests: "EntityRequest") -> List["SeriesResponse"]:
@@ -104,7 +104,7 @@ class SeriesMethods:
             403 Forbidden. Not authorized.
         """
         response = self.__session.post_or_raise("v1/series/fetchseries", json=requests)
-        return cast(List["SeriesResponse"], response.json())
+        return cast(List["SeriesResponse"], self.__session.decode_json(response))
 
     # Get /v1/series/getrevisioninfo
     def get_revision_info(self, *series_names: str) -> List["SeriesWithRevisionsInfoResponse"]:
@@ -122,7 +122,7 @@ class SeriesMethods:
             403 Forbidden. Not authorized.
         """
         response = self.__session.get_or_raise("v1/series/getrevisioninfo", params={"n": series_names})
-        return cast(List["SeriesWithRevisionsInfoResponse"], response.json())
+        return cast(List["SeriesWithRevisionsInfoResponse"], self.__session.decode_json(response))
 
     # Get /v1/series/fetchvintageseries
     def fetch_vintage_series(
@@ -147,7 +147,7 @@ class SeriesMethods:
             params["getTimesOfChange"] = "true" if get_times_of_change else "false"
 
         response = self.__session.get_or_raise("v1/series/fetchvintageseries", params=params)
-        return cast(List["VintageSeriesResponse"], response.json())
+        return cast(List["VintageSeriesResponse"], self.__session.decode_json(response))
 
     # Get /v1/series/fetchallvintageseries
     def get_fetch_all_vintage_series(
@@ -196,7 +196,7 @@ class SeriesMethods:
             "v1/series/fetchallvintageseries",
             params=params,
         )
-        return cast(List["VintageSeriesResponse"], response.json())
+        return cast(List["VintageSeriesResponse"], self.__session.decode_json(response))
 
     # post /v1/series/fetchallvintageseries
     def post_fetch_all_vintage_series(
@@ -230,7 +230,7 @@ class SeriesMethods:
             params["getTimesOfChange"] = "true" if get_times_of_change else "false"
 
         response = self.__session.get_or_raise("v1/series/fetchnthreleaseseries", params=params)
-        return cast(List["SeriesWithTimesOfChangeResponse"], response.json())
+        return cast(List["SeriesWithTimesOfChangeResponse"], self.__session.decode_json(response))
 
     # Get /v1/series/fetchobservationhistory
     def fetch_observation_history(
@@ -260,7 +260,7 @@ class SeriesMethods:
                 "t": [x.isoformat() for x in date_of_the_observation],
             },
         )
-        return cast(List["SeriesObservationHistoryResponse"], response.json())
+        return cast(List["SeriesObservationHistoryResponse"], self.__session.decode_json(response))
 
     # Get /v1/series/getdatapackagelist
     def get_data_package_list(self, if_modified_since: datetime = None) -> "FeedEntitiesResponse":
@@ -286,7 +286,7 @@ class SeriesMethods:
             params["ifModifiedSince"] = if_modified_since.isoformat()
 
         response = self.__session.get_or_raise("v1/series/getdatapackagelist", params=params)
-        return cast("FeedEntitiesResponse", response.json())
+        return cast("FeedEntitiesResponse", self.__session.decode_json(response))
 
     # Get /v1/series/entityinfofordisplay
     def entity_info_for_display(self, *entitie_names: str) -> "EntityInfoForDisplayResponse":
@@ -305,7 +305,7 @@ class SeriesMethods:
             404 The series could not be found.
         """
         response = self.__session.get_or_raise("v1/series/entityinfofordisplay", params={"n": entitie_names})
-        return cast("EntityInfoForDisplayResponse", response.json())
+        return cast("EntityInfoForDisplayResponse", self.__session.decode_json(response))
 
     # Post /v1/series/fetchunifiedseries
     def fetch_unified_series(self, request: "UnifiedSeriesRequest") -> "UnifiedSeriesResponse":
@@ -327,4 +327,8 @@ class SeriesMethods:
             403 Forbidden. Not authorized.
         """
         response = self.__session.post_or_raise("v1/series/fetchunifiedseries", json=request)
-        return cast("UnifiedSeriesResponse", response.json())
+        return cast("UnifiedSeriesResponse", self.__session.decode_json(response))
+
+    # Post /v1/series/fetchunifiedseries
+    def post_fetch_unified_series(self, request: "UnifiedSeriesRequest", stream: bool = False) -> "Response":
+        return self.__session.post_or_raise("v1/series/fetchunifiedseries", json=request, stream=stream)
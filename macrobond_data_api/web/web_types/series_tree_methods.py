@@ -43,7 +43,7 @@ class SeriesTreeMethods:
                     "SeriesTreeNodeBranch",
                 ]
             ],
-            response.json(),
+            self.__session.decode_json(response),
         )
 
     def get_leaf_series(self, path: str, *dp: str) -> "SeriesTreeListingResponse":
@@ -63,7 +63,7 @@ class SeriesTreeMethods:
             404 The path was not found.
         """
         response = self.__session.get_or_raise("v1/seriestree/getleafseries", params={"path": path, "dp": dp})
-        return cast("SeriesTreeListingResponse", response.json())
+        return cast("SeriesTreeListingResponse", self.__session.decode_json(response))
 
     def find_locations(self, series_name: str) -> List["SeriesTreeLocationPart"]:
         """
@@ -79,4 +79,4 @@ class SeriesTreeMethods:
             403 Forbidden. Not authorized.
         """
         response = self.__session.get_or_raise("v1/seriestree/findlocations", params={"seriesName": series_name})
-        return cast(List["SeriesTreeLocationPart"], response.json())
+        return cast(List["SeriesTreeLocationPart"], self.__session.decode_json(response))
@@ -0,0 +1,5 @@
+class UnifiedSeriesSplitWarning(UserWarning):
+    """
+    Issued when a large request to `macrobond_data_api.web.web_api.WebApi.get_unified_series` is split into several
+    requests and the merged result may differ from the result of a single request.
+    """
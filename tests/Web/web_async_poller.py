@@ -0,0 +1,220 @@
+import asyncio
+from datetime import datetime, timezone
+from threading import Event, get_ident
+from typing import Any, Iterator, List, Optional, Tuple
+from unittest.mock import Mock
+
+import pytest
+
+from macrobond_data_api.web import AsyncDataPackageListPoller, AsyncSubscriptionList
+from macrobond_data_api.web.web_types import DataPackageListState, DataPackageListUpdate
+
+_DATE = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+class _Context:
+    def __init__(self, state: DataPackageListState, items: List[List[Tuple[str, datetime]]]) -> None:
+        self.time_stamp_for_if_modified_since = _DATE
+        self.download_full_list_on_or_after = datetime(3000, 1, 1, tzinfo=timezone.utc)
+        self.state = state
+        self.items = items
+
+
+class _ContextManager:
+    def __init__(self, context: Optional[_Context]) -> None:
+        self.context = context
+        self.is_closed = False
+        self.exit_thread: Optional[int] = None
+
+    def __enter__(self) -> _Context:
+        if self.context is None:
+            raise Exception("error")
+        return self.context
+
+    def __exit__(self, *args: Any) -> None:
+        self.is_closed = True
+        self.exit_thread = get_ident()
+
+
+def _new_api(*contexts: Optional[_Context]) -> Any:
+    api = Mock()
+    api.session.get.return_value.status_code = 200
+    api.get_data_package_list_chunked.side_effect = [_ContextManager(x) for x in contexts]
+    return api
+
+
+def _collect(poller: AsyncDataPackageListPoller, count: int) -> List[DataPackageListUpdate]:
+    async def run() -> List[DataPackageListUpdate]:
+        updates: List[DataPackageListUpdate] = []
+        async for update in poller:
+            updates.append(update)
+            if len(updates) == count:
+                poller.abort()
+        return updates
+
+    return asyncio.run(asyncio.wait_for(run(), 5))
+
+
+def test_full_listing() -> None:
+    api = _new_api(_Context(DataPackageListState.FULL_LISTING, [[("sek", _DATE)], [("nok", _DATE)]]))
+    poller = AsyncDataPackageListPoller(api, chunk_size=1)
+
+    updates = _collect(poller, 2)
+
+    assert [x.items[0].name for x in updates] == ["sek", "nok"]
+    assert all(x.is_full_listing for x in updates)
+    assert poller.time_stamp_for_if_modified_since == _DATE
+    api.get_data_package_list_chunked.assert_called_once_with(None, 1)
+
+
+def test_incomplete_is_continued_before_state_is_saved() -> None:
+    api = _new_api(
+        _Context(DataPackageListState.INCOMPLETE, [[("sek", _DATE)]]),
+        _Context(DataPackageListState.UP_TO_DATE, [[("nok", _DATE)]]),
+    )
+    poller = AsyncDataPackageListPoller(api, time_stamp_for_if_modified_since=datetime(1999, 1, 1))
+    poller.incomplete_delay = 0
+
+    saved: List[Optional[datetime]] = []
+
+    async def run() -> List[DataPackageListUpdate]:
+        updates: List[DataPackageListUpdate] = []
+        async for update in poller:
+            saved.append(poller.time_stamp_for_if_modified_since)
+            updates.append(update)
+            if len(updates) == 2:
+                poller.abort()
+        return updates
+
+    updates = asyncio.run(asyncio.wait_for(run(), 5))
+
+    assert [x.body.state for x in updates] == [DataPackageListState.INCOMPLETE, DataPackageListState.UP_TO_DATE]
+    assert not any(x.is_full_listing for x in updates)
+    assert saved == [datetime(1999, 1, 1), datetime(1999, 1, 1)]
+    assert poller.time_stamp_for_if_modified_since == _DATE
+
+
+def test_retries_and_raises_after_max_attempts() -> None:
+    api = _new_api(None, None)
+    poller = AsyncDataPackageListPoller(api)
+    poller.on_error_delay = 0
+    poller.max_attempts = 2
+
+    with pytest.raises(Exception, match="error"):
+        _collect(poller, 1)
+
+    assert api.get_data_package_list_chunked.call_count == 2
+
+
+def test_does_not_retry_after_items_were_returned() -> None:
+    def items() -> Iterator[List[Tuple[str, datetime]]]:
+        yield [("sek", _DATE)]
+        raise Exception("error")
+
+    context = _Context(DataPackageListState.FULL_LISTING, [])
+    context.items = items()  # type: ignore[assignment]
+    api = _new_api(context, _Context(DataPackageListState.FULL_LISTING, [[("sek", _DATE)]]))
+    poller = AsyncDataPackageListPoller(api)
+    poller.on_error_delay = 0
+
+    updates: List[DataPackageListUpdate] = []
+
+    async def run() -> None:
+        async for update in poller:
+            updates.append(update)
+
+    with pytest.raises(Exception, match="error"):
+        asyncio.run(asyncio.wait_for(run(), 5))
+
+    assert [x.items[0].name for x in updates] == ["sek"]
+    assert api.get_data_package_list_chunked.call_count == 1
+
+
+def test_cancel_waits_for_read_and_closes_in_executor() -> None:
+    reading = Event()
+    release = Event()
+    read_done: List[bool] = []
+
+    def items() -> Iterator[List[Tuple[str, datetime]]]:
+        reading.set()
+        release.wait(5)
+        read_done.append(True)
+        yield [("sek", _DATE)]
+
+    context = _Context(DataPackageListState.FULL_LISTING, [])
+    context.items = items()  # type: ignore[assignment]
+    context_manager = _ContextManager(context)
+    api = _new_api()
+    api.get_data_package_list_chunked.side_effect = [context_manager]
+    poller = AsyncDataPackageListPoller(api)
+    loop_thread: List[int] = []
+
+    async def run() -> None:
+        loop_thread.append(get_ident())
+        task = asyncio.ensure_future(_drain(poller))
+        while not reading.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        assert not context_manager.is_closed
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(task, 5)
+
+    asyncio.run(run())
+
+    assert read_done == [True]
+    assert context_manager.is_closed
+    assert context_manager.exit_thread != loop_thread[0]
+
+
+def test_abort_interrupts_wait() -> None:
+    api = _new_api(_Context(DataPackageListState.FULL_LISTING, []))
+    poller = AsyncDataPackageListPoller(api)
+
+    async def run() -> None:
+        task = asyncio.ensure_future(_drain(poller))
+        while poller.next_wake_up is None:
+            await asyncio.sleep(0.01)
+        poller.abort()
+        await asyncio.wait_for(task, 5)
+
+    asyncio.run(run())
+
+    assert poller.next_wake_up is None
+
+
+async def _drain(poller: AsyncDataPackageListPoller) -> None:
+    async for _ in poller:
+        pass
+
+
+def test_subscription_list_poll() -> None:
+    session = Mock()
+    session._is_open = True
+    session.get_or_raise.return_value.json.return_value = {
+        "noMoreChanges": True,
+        "timeStampForIfModifiedSince": "2000-01-02T00:00:00Z",
+        "entities": [{"name": "sek", "modified": "2000-01-01T00:00:00Z"}],
+    }
+    subscription_list = AsyncSubscriptionList(session, _DATE)
+
+    result = asyncio.run(subscription_list.poll())
+
+    assert result == {"sek": _DATE}
+    assert subscription_list.last_modified == datetime(2000, 1, 2, tzinfo=timezone.utc)
+    assert subscription_list.no_more_changes
+
+
+def test_subscription_list_set_uses_sync_method() -> None:
+    session = Mock()
+    session._is_open = True
+    session.post_or_raise.return_value.json.return_value = []
+    subscription_list = AsyncSubscriptionList(session, _DATE)
+
+    asyncio.run(subscription_list.set(["sek"]))
+
+    assert [x.args for x in session.post_or_raise.call_args_list] == [
+        ("v1/subscriptionlist/set",),
+        ("v1/subscriptionlist/checkifnotincluded",),
+    ]
@@ -0,0 +1,204 @@
+from datetime import datetime, timezone
+from threading import Thread
+import time
+from typing import Any, Callable, List, Optional
+from unittest.mock import Mock
+
+from macrobond_data_api.web import DataPackageListPoller, WebApi
+from macrobond_data_api.web.web_types import DataPackageBody, DataPackageListItem, DataPackageListState
+
+
+class _TestPoller(DataPackageListPoller):
+    __test__ = False
+
+    def __init__(self, api: Any, on_sleep: Optional[Callable[["_TestPoller", float], None]] = None, **kwargs: Any):
+        super().__init__(api, _sleep=(lambda seconds: on_sleep(self, seconds)) if on_sleep else None, **kwargs)
+        self.delays: List[float] = []
+        self.events: List[str] = []
+
+    def on_full_listing_start(self, subscription: DataPackageBody) -> None:
+        self.events.append("full_start")
+
+    def on_full_listing_items(self, subscription: DataPackageBody, items: List[DataPackageListItem]) -> None:
+        self.events.append("full_items")
+
+    def on_full_listing_stop(self, is_aborted: bool, exception: Optional[Exception]) -> None:
+        self.events.append("full_stop" + (" error" if exception else ""))
+
+    def on_incremental_start(self, subscription: DataPackageBody) -> None:
+        self.events.append("incremental_start")
+
+    def on_incremental_items(self, subscription: DataPackageBody, items: List[DataPackageListItem]) -> None:
+        self.events.append("incremental_items")
+
+    def on_incremental_stop(self, is_aborted: bool, exception: Optional[Exception]) -> None:
+        self.events.append("incremental_stop" + (" aborted" if is_aborted else ""))
+
+
+def _new_api(get_data_package_list_iterative: Callable[..., Optional[DataPackageBody]]) -> WebApi:
+    api = Mock()
+    api.session.get.return_value.status_code = 200
+    api.get_data_package_list_iterative.side_effect = get_data_package_list_iterative
+    return api
+
+
+def _body(state: DataPackageListState) -> DataPackageBody:
+    return DataPackageBody(datetime(2000, 1, 1, tzinfo=timezone.utc), datetime(3000, 1, 1, tzinfo=timezone.utc), state)
+
+
+def test_retries_with_backoff_until_max_attempts() -> None:
+    calls = 0
+
+    def get_data_package_list_iterative(*args: Any) -> Optional[DataPackageBody]:
+        nonlocal calls
+        calls += 1
+        raise Exception("error")
+
+    def on_sleep(poller: _TestPoller, seconds: float) -> None:
+        poller.delays.append(seconds)
+        if len(poller.delays) == 3:
+            poller.abort()
+
+    poller = _TestPoller(_new_api(get_data_package_list_iterative), on_sleep)
+    poller.start()
+
+    assert calls == 3
+    assert poller.delays == [30, 60, 15 * 60]
+
+
+def test_adapts_to_change_rate() -> None:
+    changes = [1, 1, 1, 0, 0]
+
+    def get_data_package_list_iterative(
+        body_callback: Callable[[DataPackageBody], None],
+        items_callback: Callable[[DataPackageBody, List[DataPackageListItem]], None],
+        if_modified_since: Optional[datetime],
+    ) -> Optional[DataPackageBody]:
+        body = _body(
+            DataPackageListState.FULL_LISTING if if_modified_since is None else DataPackageListState.UP_TO_DATE
+        )
+        body_callback(body)
+        if if_modified_since is not None and changes.pop(0):
+            items_callback(body, [DataPackageListItem("sek", datetime(2000, 1, 1, tzinfo=timezone.utc))])
+        return body
+
+    def on_sleep(poller: _TestPoller, seconds: float) -> None:
+        assert poller.next_wake_up is not None
+        poller.delays.append(seconds)
+        if not changes:
+            poller.abort()
+
+    poller = _TestPoller(_new_api(get_data_package_list_iterative), on_sleep)
+    poller.min_up_to_date_delay = 100
+    poller.up_to_date_delay = 800
+    poller.start()
+
+    assert poller.delays == [800, 400, 200, 100, 200, 400]
+    assert poller.events[:2] == ["full_start", "full_stop"]
+    assert poller.next_wake_up is None
+
+
+def test_starts_from_saved_interval_and_counts_first_poll() -> None:
+    changes = [1, 0]
+
+    def get_data_package_list_iterative(
+        body_callback: Callable[[DataPackageBody], None],
+        items_callback: Callable[[DataPackageBody, List[DataPackageListItem]], None],
+        _: Any,
+    ) -> Optional[DataPackageBody]:
+        body = _body(DataPackageListState.UP_TO_DATE)
+        body_callback(body)
+        if changes.pop(0):
+            items_callback(body, [DataPackageListItem("sek", datetime(2000, 1, 1, tzinfo=timezone.utc))])
+        return body
+
+    def on_sleep(poller: _TestPoller, seconds: float) -> None:
+        poller.delays.append(seconds)
+        if not changes:
+            poller.abort()
+
+    poller = _TestPoller(
+        _new_api(get_data_package_list_iterative),
+        on_sleep,
+        time_stamp_for_if_modified_since=datetime(2000, 1, 1, tzinfo=timezone.utc),
+        up_to_date_interval=120,
+    )
+    poller.start()
+
+    assert poller.delays == [60, 120]
+    assert poller.up_to_date_interval == 120
+
+
+def test_first_poll_with_changes_halves_max_delay() -> None:
+    def get_data_package_list_iterative(
+        body_callback: Callable[[DataPackageBody], None],
+        items_callback: Callable[[DataPackageBody, List[DataPackageListItem]], None],
+        _: Any,
+    ) -> Optional[DataPackageBody]:
+        body = _body(DataPackageListState.UP_TO_DATE)
+        body_callback(body)
+        items_callback(body, [DataPackageListItem("sek", datetime(2000, 1, 1, tzinfo=timezone.utc))])
+        return body
+
+    def on_sleep(poller: _TestPoller, seconds: float) -> None:
+        poller.delays.append(seconds)
+        poller.abort()
+
+    poller = _TestPoller(
+        _new_api(get_data_package_list_iterative),
+        on_sleep,
+        time_stamp_for_if_modified_since=datetime(2000, 1, 1, tzinfo=timezone.utc),
+    )
+    assert poller.up_to_date_interval is None
+    poller.start()
+
+    assert poller.delays == [15 * 60 / 2]
+
+
+def test_incomplete_uses_incomplete_delay() -> None:
+    states = [DataPackageListState.INCOMPLETE, DataPackageListState.UP_TO_DATE]
+
+    def get_data_package_list_iterative(
+        body_callback: Callable[[DataPackageBody], None], _: Any, __: Any
+    ) -> Optional[DataPackageBody]:
+        body = _body(states.pop(0))
+        body_callback(body)
+        return body
+
+    def on_sleep(poller: _TestPoller, seconds: float) -> None:
+        poller.delays.append(seconds)
+        if not states:
+            poller.abort()
+
+    poller = _TestPoller(
+        _new_api(get_data_package_list_iterative),
+        on_sleep,
+        time_stamp_for_if_modified_since=datetime(2000, 1, 1, tzinfo=timezone.utc),
+    )
+    poller.start()
+
+    assert poller.delays == [15, 15 * 60]
+    assert poller.events == ["incremental_start", "incremental_stop"]
+
+
+def test_abort_interrupts_wait() -> None:
+    def get_data_package_list_iterative(
+        body_callback: Callable[[DataPackageBody], None], _: Any, __: Any
+    ) -> Optional[DataPackageBody]:
+        body = _body(DataPackageListState.FULL_LISTING)
+        body_callback(body)
+        return body
+
+    poller = _TestPoller(_new_api(get_data_package_list_iterative))
+    thread = Thread(target=poller.start)
+    thread.start()
+
+    timeout = time.monotonic() + 5
+    while poller.next_wake_up is None and time.monotonic() < timeout:
+        time.sleep(0.01)
+    assert poller.next_wake_up is not None
+
+    poller.abort()
+    thread.join(5)
+
+    assert not thread.is_alive()
@@ -0,0 +1,116 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+from json import dumps as json_dumps
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from requests import Response
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import RevisionHistoryRequest
+from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.session import Session
+
+
+def _series(name: str) -> Dict[str, Any]:
+    if name.startswith("missing"):
+        return {"errorText": "Not found", "errorCode": 404}
+    if name.startswith("unchanged"):
+        return {"errorText": "Not modified", "errorCode": 304}
+    return {
+        "values": [1, None, len(name) + 0.5],
+        "dates": ["2000-01-01T00:00:00", "2000-02-01T00:00:00", "2000-03-01T00:00:00Z"],
+        "metadata": {} if name.startswith("empty") else {"PrimName": name},
+    }
+
+
+def _series_with_vintages(name: str) -> Dict[str, Any]:
+    return {
+        "metadata": {"PrimName": name},
+        "vintages": [
+            {"vintageTimeStamp": "2000-01-01T00:00:00Z", "dates": ["2000-01-01"], "values": [1]},
+            {"vintageTimeStamp": "2000-02-01T00:00:00Z", "dates": ["2000-01-01", "2000-02-01"], "values": [1, 2.5]},
+        ],
+    }
+
+
+class TestAuth2Session:
+    __test__ = False
+
+    def request(self, method: str, url: str, *args: Any, json: Any, **kwargs: Any) -> Response:
+        response = Response()
+        if url.endswith("v1/metadata/getattributeinformation"):
+            content: Any = [{"name": kwargs["params"]["n"][0], "valueType": 8}]
+        elif any(x["name"].startswith("fail") for x in json):
+            response.status_code = 500
+            response.raw = BytesIO(b"")
+            return response
+        elif url.endswith("v1/series/fetchseries"):
+            content = [_series(x["name"]) for x in json]
+        else:
+            content = [_series_with_vintages(x["name"]) for x in json]
+        response.status_code = 200
+        response.raw = BytesIO(bytes(json_dumps(content), "utf-8"))
+        return response
+
+
+def _api() -> WebApi:
+    return WebApi(Session("", "", test_auth2_session=TestAuth2Session()))
+
+
+@pytest.fixture(name="executor", params=["thread", "process"])
+def fixture_executor(request: Any) -> Iterator[Executor]:
+    with ThreadPoolExecutor(2) if request.param == "thread" else ProcessPoolExecutor(2) as executor:
+        yield executor
+
+
+def _as_tuple(series: Any) -> Any:
+    return (series.name, series.error_message, series.status_code, dict(series.metadata or {}), series.values)
+
+
+def test_get_many_series(executor: Executor) -> None:
+    names = [f"s{x}" for x in range(450)] + ["missing", "unchanged"]
+
+    expected = list(_api().get_many_series(names))
+    actual = list(_api().get_many_series(names, max_workers=2, decode_executor=executor))
+
+    assert [_as_tuple(x) for x in actual] == [_as_tuple(x) for x in expected]
+    assert [x.dates for x in actual] == [x.dates for x in expected]
+    assert actual[0].metadata["PrimName"] == "s0"
+    assert len(actual) == len(names) - 1
+
+
+def test_get_many_series_wraps_all_metadata(executor: Executor) -> None:
+    names = ["s1", "empty", "missing"]
+
+    expected = list(_api().get_many_series(names))
+    actual = list(_api().get_many_series(names, max_workers=2, decode_executor=executor))
+
+    assert [type(x.metadata) for x in actual] == [type(x.metadata) for x in expected]
+    assert [dict(x.metadata) for x in actual] == [dict(x.metadata) for x in expected]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_get_many_series_with_revisions(executor: Executor, compact: bool) -> None:
+    requests = [RevisionHistoryRequest(f"s{x}") for x in range(250)]
+
+    expected = list(_api().get_many_series_with_revisions(requests, compact=compact))
+    actual = list(
+        _api().get_many_series_with_revisions(requests, max_workers=2, compact=compact, decode_executor=executor)
+    )
+
+    assert [x.name for x in actual] == [x.name for x in requests]
+    for x, y in zip(expected, actual):
+        assert dict(y.metadata or {}) == dict(x.metadata or {})
+        assert [(z.vintage_time_stamp, z.dates, z.values) for z in y.vintages] == [
+            (z.vintage_time_stamp, z.dates, z.values) for z in x.vintages
+        ]
+
+
+def test_get_many_series_with_revisions_isolates_chunk_errors() -> None:
+    requests = [RevisionHistoryRequest(f"s{x}") for x in range(200)] + [RevisionHistoryRequest("fail")]
+
+    with ThreadPoolExecutor(2) as executor:
+        result = list(_api().get_many_series_with_revisions(requests, decode_executor=executor))
+
+    assert [x.status_code for x in result] == [StatusCode.OK] * 200 + [StatusCode.OTHER]
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from io import BytesIO
 from json import dumps as json_dumps
 from typing import Any
@@ -9,7 +9,7 @@ from requests import Response
 
 from macrobond_data_api.web import WebApi
 from macrobond_data_api.web.session import Session
-from macrobond_data_api.web.web_types import DataPackageListState
+from macrobond_data_api.web.web_types import DataPackageListChunk, DataPackageListState
 
 
 class TestAuth2Session:
@@ -86,3 +86,108 @@ def test_2(state: DataPackageListState) -> None:
         hitponts -= 1
 
     assert hitponts == 0
+
+
+@pytest.mark.parametrize(
+    "state",
+    [DataPackageListState.FULL_LISTING, DataPackageListState.INCOMPLETE, DataPackageListState.UP_TO_DATE],
+)
+def test_compact(state: DataPackageListState) -> None:
+    hitponts = 1
+    json = get_json(state)
+
+    api = WebApi(Session("", "", test_auth2_session=TestAuth2Session(bytes(json, "utf-8"))))
+
+    with api.get_data_package_list_chunked(compact=True) as context:
+        assert context.state == state
+
+        chunks = list(context.items)
+        assert len(chunks) == 1
+
+        chunk = chunks[0]
+        assert isinstance(chunk, DataPackageListChunk)
+        assert len(chunk) == 2
+        assert list(chunk.names()) == ["sek", "dkk"]
+        assert chunk[1] == ("dkk", datetime(2000, 2, 4, 4, 5, 6))
+        assert chunk[-1] == ("dkk", datetime(2000, 2, 4, 4, 5, 6))
+        assert list(chunk.modified_epoch_microseconds) == [
+            int((datetime(2000, 2, 3, 4, 5, 6) - datetime(1970, 1, 1)).total_seconds()) * 1000000,
+            int((datetime(2000, 2, 4, 4, 5, 6) - datetime(1970, 1, 1)).total_seconds()) * 1000000,
+        ]
+        assert chunk.to_list() == [("sek", datetime(2000, 2, 3, 4, 5, 6)), ("dkk", datetime(2000, 2, 4, 4, 5, 6))]
+
+        hitponts -= 1
+
+    assert hitponts == 0
+
+
+def test_compact_time_zone() -> None:
+    json = json_dumps(
+        {
+            "timeStampForIfModifiedSince": "2000-02-02T04:05:06Z",
+            "state": DataPackageListState.UP_TO_DATE,
+            "entities": [
+                {"name": "sek", "modified": "2000-02-03T04:05:06.123Z"},
+                {"name": "dkk", "modified": "2000-02-04T04:05:06+01:00"},
+            ],
+        }
+    )
+
+    api = WebApi(Session("", "", test_auth2_session=TestAuth2Session(bytes(json, "utf-8"))))
+
+    with api.get_data_package_list_chunked(
+        datetime(2000, 1, 1, tzinfo=timezone.utc), chunk_size=1, compact=True
+    ) as context:
+        assert [list(x) for x in context.items] == [
+            [("sek", datetime(2000, 2, 3, 4, 5, 6, 123000, tzinfo=timezone.utc))],
+            [("dkk", datetime(2000, 2, 4, 3, 5, 6, tzinfo=timezone.utc))],
+        ]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_read_ahead(compact: bool) -> None:
+    json = get_json(DataPackageListState.FULL_LISTING)
+
+    api = WebApi(Session("", "", test_auth2_session=TestAuth2Session(bytes(json, "utf-8"))))
+
+    with api.get_data_package_list_chunked(chunk_size=1, compact=compact, read_ahead=4) as context:
+        metrics = context.read_ahead_metrics
+        assert metrics is not None
+        assert metrics.capacity == 4
+
+        assert [list(x) for x in context.items] == [
+            [("sek", datetime(2000, 2, 3, 4, 5, 6))],
+            [("dkk", datetime(2000, 2, 4, 4, 5, 6))],
+        ]
+
+        assert metrics.total_chunks == 2
+        assert metrics.buffered_chunks == 0
+        assert 1 <= metrics.max_buffered_chunks <= 3
+
+
+def test_read_ahead_error() -> None:
+    json = json_dumps(
+        {
+            "downloadFullListOnOrAfter": "2000-02-01T04:05:06",
+            "timeStampForIfModifiedSince": "2000-02-02T04:05:06",
+            "state": DataPackageListState.FULL_LISTING,
+            "entities": [{"name": "sek", "modified": "2000-02-03T04:05:06"}, {"name": "dkk"}],
+        }
+    )
+
+    api = WebApi(Session("", "", test_auth2_session=TestAuth2Session(bytes(json, "utf-8"))))
+
+    with api.get_data_package_list_chunked(chunk_size=1, read_ahead=1) as context:
+        items = iter(context.items)
+        assert next(items) == [("sek", datetime(2000, 2, 3, 4, 5, 6))]
+        with pytest.raises(Exception, match="bad format: modified was not found"):
+            next(items)
+
+
+def test_no_read_ahead_metrics() -> None:
+    json = get_json(DataPackageListState.FULL_LISTING)
+
+    api = WebApi(Session("", "", test_auth2_session=TestAuth2Session(bytes(json, "utf-8"))))
+
+    with api.get_data_package_list_chunked() as context:
+        assert context.read_ahead_metrics is None
@@ -0,0 +1,117 @@
+from io import BytesIO
+from json import dumps as json_dumps
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import pytest
+from requests import Response
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import RevisionHistoryRequest
+from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.session import Session
+from macrobond_data_api.web._web_api_revision import _create_compact_vintage_values, _create_vintage_values
+
+if TYPE_CHECKING:
+    from macrobond_data_api.web.web_types import VintageValuesResponse
+
+
+class TestAuth2Session:
+    __test__ = False
+
+    def request(self, *args: Any, json: List[Dict[str, Any]], **kwargs: Any) -> Response:
+        response = Response()
+        if any(x["name"].startswith("fail") for x in json):
+            response.status_code = 500
+            response.raw = BytesIO(b"")
+            return response
+
+        response.status_code = 200
+        response.raw = BytesIO(
+            bytes(
+                json_dumps(
+                    [
+                        {
+                            "vintages": [
+                                {"vintageTimeStamp": "2000-01-01T00:00:00Z", "dates": ["2000-01-01"], "values": [1]}
+                            ]
+                        }
+                        for _ in json
+                    ]
+                ),
+                "utf-8",
+            )
+        )
+        return response
+
+
+def _get_many_series_with_revisions(
+    names: List[str], max_workers: int, compact: bool = False
+) -> Dict[Optional[str], Any]:
+    api = WebApi(Session("", "", test_auth2_session=TestAuth2Session()))
+    return {
+        x.name: x
+        for x in api.get_many_series_with_revisions(
+            [RevisionHistoryRequest(x) for x in names], max_workers=max_workers, compact=compact
+        )
+    }
+
+
+def test_sequential() -> None:
+    names = [f"s{x}" for x in range(450)]
+
+    result = _get_many_series_with_revisions(names, 1)
+
+    assert list(result) == names
+    assert all(x.status_code == StatusCode.OK and len(x.vintages) == 1 for x in result.values())
+
+
+def test_parallel() -> None:
+    names = [f"s{x}" for x in range(1000)]
+
+    result = _get_many_series_with_revisions(names, 4, compact=True)
+
+    assert set(result) == set(names)
+    assert all(x.vintages[0].values == [1.0] for x in result.values())
+
+
+def test_parallel_isolates_chunk_errors() -> None:
+    names = [f"s{x}" for x in range(200)] + ["fail"] + [f"s{x}" for x in range(200, 400)]
+
+    result = _get_many_series_with_revisions(names, 2)
+
+    assert set(result) == set(names)
+    failed = [x for x, y in result.items() if y.status_code == StatusCode.OTHER]
+    assert failed == names[200:400]
+    assert result["fail"].error_text
+
+
+def test_compact_vintage_values() -> None:
+    vintages: List["VintageValuesResponse"] = [
+        {"vintageTimeStamp": "2000-01-01T00:00:00Z", "dates": ("2000-01-01", "2000-02-01"), "values": (1.0, None)},
+        {
+            "vintageTimeStamp": "2000-03-01T00:00:00Z",
+            "dates": ("2000-01-01", "2000-02-01", "2000-03-01"),
+            "values": (1.0, 2.0, 3.0),
+        },
+        {"vintageTimeStamp": None, "dates": ("2000-02-01", "2000-04-01"), "values": (4.0, 5.0)},
+    ]
+
+    compact = _create_compact_vintage_values(vintages)
+
+    assert len(compact.dates) == 4
+    assert compact == [_create_vintage_values(x) for x in vintages]
+    assert compact[2].dates[0] is compact[0].dates[1]
+    assert compact[-1].values == [4.0, 5.0]
+    assert list(compact.date_indices(2)) == [1, 3]
+
+
+def test_compact_vintage_values_to_vintage_matrix() -> None:
+    numpy = pytest.importorskip("numpy")
+    vintages: List["VintageValuesResponse"] = [
+        {"vintageTimeStamp": None, "dates": ("2000-01-01",), "values": (1.0,)},
+        {"vintageTimeStamp": None, "dates": ("2000-01-01", "2000-02-01"), "values": (2.0, None)},
+    ]
+
+    matrix = _create_compact_vintage_values(vintages).to_vintage_matrix()
+
+    numpy.testing.assert_array_equal(matrix.values, [[1.0, 2.0], [numpy.nan, numpy.nan]])
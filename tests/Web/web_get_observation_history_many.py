@@ -0,0 +1,53 @@
+from datetime import datetime
+from io import BytesIO
+from json import dumps as json_dumps
+from typing import Any, Dict
+
+from requests import Request, Response
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.session import Session
+
+
+class TestAuth2Session:
+    __test__ = False
+
+    def request(self, *args: Any, params: Dict[str, Any], **kwargs: Any) -> Response:
+        response = Response()
+        if params["n"] == "missing":
+            response.status_code = 404
+            response.request = Request("GET", "https://localhost/").prepare()
+            response.headers["Content-Type"] = "application/json"
+            response.raw = BytesIO(b'{"status": 404, "detail": "Series not found: missing"}')
+            return response
+
+        response.status_code = 200
+        response.raw = BytesIO(
+            bytes(
+                json_dumps(
+                    [
+                        {"observationDate": x, "values": [1, 2], "timeStamps": [None, "2000-02-01T00:00:00Z"]}
+                        for x in params["t"]
+                    ]
+                ),
+                "utf-8",
+            )
+        )
+        return response
+
+
+def test_get_observation_history_many() -> None:
+    api = WebApi(Session("", "", test_auth2_session=TestAuth2Session()))
+    requests = [(f"s{x}", [datetime(2000, 1, 1), datetime(2000, 2, 1)]) for x in range(20)] + [
+        ("missing", [datetime(2000, 1, 1)])
+    ]
+
+    result = {x.name: x for x in api.get_observation_history_many(requests, max_workers=4)}
+
+    assert set(result) == {x[0] for x in requests}
+    assert [x.observation_date for x in result["s0"].history] == [datetime(2000, 1, 1), datetime(2000, 2, 1)]
+    assert result["s0"].history[0].values == [1.0, 2.0]
+    assert not result["s0"].is_error
+    assert result["missing"].status_code == StatusCode.NOT_FOUND
+    assert result["missing"].error_text == "Series not found: missing"
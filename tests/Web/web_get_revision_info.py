@@ -0,0 +1,60 @@
+from io import BytesIO
+from json import dumps as json_dumps
+from threading import Lock
+from typing import Any, Dict, List
+
+from requests import Response
+
+from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.session import Session
+
+
+class TestAuth2Session:
+    __test__ = False
+
+    def __init__(self) -> None:
+        self.requests: List[List[str]] = []
+        self._lock = Lock()
+
+    def request(self, *args: Any, params: Dict[str, Any], **kwargs: Any) -> Response:
+        names = list(params["n"])
+        with self._lock:
+            self.requests.append(names)
+        response = Response()
+        response.status_code = 200
+        response.raw = BytesIO(bytes(json_dumps([self._info(x) for x in names]), "utf-8"))
+        return response
+
+    def _info(self, name: str) -> Dict[str, Any]:
+        if name == "missing":
+            return {"errorText": "Not found"}
+        return {
+            "storesRevisions": True,
+            "hasRevisions": True,
+            "timeStampOfFirstRevision": "2000-01-01T00:00:00Z",
+            "timeStampOfLastRevision": "2000-02-01T00:00:00Z",
+            "vintageTimeStamps": ["2000-01-01T00:00:00Z", "2000-02-01T00:00:00Z"],
+        }
+
+
+def test_get_revision_info_in_chunks() -> None:
+    auth2_session = TestAuth2Session()
+    api = WebApi(Session("", "", test_auth2_session=auth2_session))
+    names = [f"s{i}" for i in range(25)] + ["missing"]
+
+    result = api.get_revision_info(*names, raise_error=False, chunk_size=10, max_workers=3)
+
+    assert [x.name for x in result] == names
+    assert sorted(len(x) for x in auth2_session.requests) == [6, 10, 10]
+    assert result[0].stores_revisions and len(result[0].vintage_time_stamps) == 2
+    assert result[-1].error_message == "Not found"
+
+
+def test_get_revision_info_one_chunk() -> None:
+    auth2_session = TestAuth2Session()
+    api = WebApi(Session("", "", test_auth2_session=auth2_session))
+
+    result = api.get_revision_info("usgdp", "uscpi")
+
+    assert [x.name for x in result] == ["usgdp", "uscpi"]
+    assert auth2_session.requests == [["usgdp", "uscpi"]]
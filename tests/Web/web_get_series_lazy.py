@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+from io import BytesIO
+from json import dumps as json_dumps
+from typing import Any, Dict, List
+
+import pytest
+from requests import Response
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import LazySeries, Series
+from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.session import Session
+
+_SERIES: Dict[str, Dict[str, Any]] = {
+    "usgdp": {
+        "values": [1, None, 2.5],
+        "dates": ["2000-01-01T00:00:00", "2000-02-01T00:00:00", "2000-03-01T00:00:00"],
+        "metadata": {"PrimName": "usgdp", "LazySeriesTestNumber": 1.5},
+    },
+    "uscpi": {
+        "values": [],
+        "dates": [],
+        "metadata": {"PrimName": "uscpi"},
+    },
+    "missing": {"errorText": "Not found", "errorCode": 404},
+    "precise": {
+        "values": [4],
+        "dates": ["2000-01-01T12:30:56.1234567Z"],
+        "metadata": {"PrimName": "precise"},
+    },
+    "dateonly": {
+        "values": [6],
+        "dates": ["2000-01-01"],
+        "metadata": {"PrimName": "dateonly"},
+    },
+}
+
+
+class TestAuth2Session:
+    __test__ = False
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> Response:
+        if url.endswith("v1/metadata/getattributeinformation"):
+            content: Any = [{"name": kwargs["params"]["n"][0], "valueType": 8}]
+        else:
+            content = [_SERIES[x] for x in kwargs["params"]["n"]]
+        response = Response()
+        response.status_code = 200
+        response.raw = BytesIO(bytes(json_dumps(content), "utf-8"))
+        return response
+
+
+def _api(json_codec: str) -> WebApi:
+    return WebApi(Session("", "", test_auth2_session=TestAuth2Session(), json_codec=json_codec))
+
+
+def _as_tuple(series: Series) -> Any:
+    return (
+        series.name,
+        series.error_message,
+        series.status_code,
+        dict(series.metadata.items()),
+        list(series.values),
+        list(series.dates),
+    )
+
+
+@pytest.mark.parametrize("json_codec", ["json", "msgspec"])
+def test_get_series_lazy_same_as_eager(json_codec: str) -> None:
+    if json_codec != "json":
+        pytest.importorskip(json_codec)
+    names = list(_SERIES)
+
+    expected = _api("json").get_series(names, raise_error=False)
+    actual = _api(json_codec).get_series(names, raise_error=False, lazy=True)
+
+    assert [type(x) for x in actual] == [LazySeries, LazySeries, Series, LazySeries, LazySeries]
+    assert [_as_tuple(x) for x in actual] == [_as_tuple(x) for x in expected]
+    assert actual[2].status_code == StatusCode.NOT_FOUND
+    assert isinstance(actual[0].values[0], float)
+    assert actual[3].dates == [datetime(2000, 1, 1, 12, 30, 56, 123456, tzinfo=timezone.utc)]
+    assert actual[4].dates == [datetime(2000, 1, 1)]
+
+
+def test_lazy_series_loads_once() -> None:
+    calls: List[str] = []
+
+    def load(name: str, value: Any) -> Any:
+        calls.append(name)
+        return value
+
+    series = LazySeries(
+        "usgdp",
+        lambda: load("values", [1.0]),
+        lambda: load("dates", [datetime(2000, 1, 1)]),
+        lambda: load("metadata", {"PrimName": "usgdp"}),
+    )
+
+    assert not calls
+    assert series.primary_name == "usgdp"
+    assert series.metadata == {"PrimName": "usgdp"}
+    assert calls == ["metadata"]
+
+    assert series.values == [1.0]
+    assert series.values == [1.0]
+    assert series.dates == [datetime(2000, 1, 1)]
+    assert calls == ["metadata", "values", "dates"]
+    assert not series.is_error
+
+
+def test_lazy_series_setter_skips_load() -> None:
+    series = LazySeries("usgdp", lambda: pytest.fail("values"), lambda: [], lambda: {})
+
+    series.values = [2.0]
+
+    assert series.values == [2.0]
@@ -0,0 +1,90 @@
+from datetime import datetime
+from io import BytesIO
+from json import dumps as json_dumps
+from typing import Any, Dict, List
+
+import pytest
+from requests import Response
+
+from macrobond_data_api.common.enums import SeriesFrequency
+from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.session import Session
+
+numpy = pytest.importorskip("numpy")
+
+_SERIES: Dict[str, Dict[str, float]] = {
+    "a": {"2000-01-03": 1, "2000-01-04": 2, "2000-01-05": 3},
+    "b": {"2000-01-03": 10, "2000-01-05": 30},
+    "c": {"2000-01-04": 200, "2000-01-06": 400},
+}
+
+
+class TestAuth2Session:
+    __test__ = False
+
+    def request(self, *args: Any, json: Dict[str, Any], **kwargs: Any) -> Response:
+        names = [x["name"] for x in json["seriesEntries"]]
+        dates = sorted(set.union(*[set(_SERIES[x]) for x in names if x in _SERIES]))
+        content = {
+            "dates": [x + "T00:00:00" for x in dates],
+            "series": [
+                (
+                    {"values": [_SERIES[x].get(y) for y in dates], "metadata": {}}
+                    if x in _SERIES
+                    else {"errorText": "Not found"}
+                )
+                for x in names
+            ],
+        }
+        response = Response()
+        response.status_code = 200
+        response.raw = BytesIO(bytes(json_dumps(content), "utf-8"))
+        return response
+
+
+def _api() -> WebApi:
+    return WebApi(Session("", "", test_auth2_session=TestAuth2Session()))
+
+
+def test_as_matrix() -> None:
+    api = _api()
+
+    result = api.get_unified_series(
+        "a", "missing", "b", frequency=SeriesFrequency.DAILY, as_matrix=True, raise_error=False
+    )
+
+    matrix = result.to_numpy()
+    assert matrix.dtype == numpy.float64
+    assert matrix.flags.f_contiguous
+    numpy.testing.assert_array_equal(matrix, [[1, numpy.nan, 10], [2, numpy.nan, numpy.nan], [3, numpy.nan, 30]])
+    assert result[1].is_error
+    assert numpy.shares_memory(result[0].values, matrix)
+    numpy.testing.assert_array_equal(result[2].values, [10, numpy.nan, 30])
+
+    dates = result.dates_to_numpy()
+    assert dates.dtype == numpy.dtype("datetime64[us]")
+    assert list(dates) == [numpy.datetime64(datetime(2000, 1, x)) for x in (3, 4, 5)]
+
+
+def test_as_matrix_same_as_lists() -> None:
+    api = _api()
+
+    lists = api.get_unified_series("a", "b", frequency=SeriesFrequency.DAILY)
+    matrix = api.get_unified_series("a", "b", frequency=SeriesFrequency.DAILY, as_matrix=True)
+
+    numpy.testing.assert_array_equal(lists.to_numpy(), matrix.to_numpy())
+    assert lists.to_pd_data_frame().equals(matrix.to_pd_data_frame())
+
+
+def test_as_matrix_split() -> None:
+    api = _api()
+
+    result = api.get_unified_series("a", "b", "c", frequency=SeriesFrequency.DAILY, as_matrix=True, chunk_size=2)
+
+    assert result.dates == [datetime(2000, 1, x) for x in (3, 4, 5, 6)]
+    numpy.testing.assert_array_equal(
+        result.to_numpy(),
+        [[1, 10, numpy.nan], [2, numpy.nan, 200], [3, 30, numpy.nan], [numpy.nan, numpy.nan, 400]],
+    )
+    values: List[Any] = [x.values for x in result]
+    assert all(numpy.shares_memory(x, result.to_numpy()) for x in values)
@@ -0,0 +1,143 @@
+import warnings
+from datetime import datetime
+from io import BytesIO
+from json import dumps as json_dumps
+from threading import Lock
+from typing import Any, Dict, List
+
+import pytest
+from requests import Response
+
+from macrobond_data_api.common.enums import CalendarMergeMode, SeriesFrequency, SeriesMissingValueMethod
+from macrobond_data_api.common.types import SeriesEntry, StartOrEndPoint
+from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.session import Session
+from macrobond_data_api.web.web_types import UnifiedSeriesSplitWarning
+
+_SERIES: Dict[str, Dict[str, float]] = {
+    "a": {"2000-01-03": 1, "2000-01-04": 2, "2000-01-05": 3},
+    "b": {"2000-01-03": 10, "2000-01-05": 30},
+    "c": {"2000-01-04": 200, "2000-01-05": 300},
+    "d": {"2000-01-05": 3000, "2000-01-06": 4000},
+    "e": {"2000-01-03": 5, "2000-01-04": 6, "2000-01-05": 7},
+}
+
+
+class TestAuth2Session:
+    __test__ = False
+
+    def __init__(self) -> None:
+        self.requests: List[List[str]] = []
+        self._lock = Lock()
+
+    def request(self, *args: Any, json: Dict[str, Any], **kwargs: Any) -> Response:
+        names = [x["name"] for x in json["seriesEntries"]]
+        with self._lock:
+            self.requests.append(names)
+        calendars = [set(_SERIES[x]) for x in names]
+        if json["calendarMergeMode"] == CalendarMergeMode.AVAILABLE_IN_ALL:
+            dates = sorted(set.intersection(*calendars))
+        else:
+            dates = sorted(set.union(*calendars))
+        content = {
+            "dates": [x + "T00:00:00" for x in dates],
+            "series": [{"values": [_SERIES[x].get(y) for y in dates], "metadata": {}} for x in names],
+        }
+        response = Response()
+        response.status_code = 200
+        response.raw = BytesIO(bytes(json_dumps(content), "utf-8"))
+        return response
+
+
+def _api() -> WebApi:
+    return WebApi(Session("", "", test_auth2_session=TestAuth2Session()))
+
+
+def _requests(api: WebApi) -> List[List[str]]:
+    return api.session.auth2_session.requests
+
+
+def _dates(*days: int) -> List[datetime]:
+    return [datetime(2000, 1, x) for x in days]
+
+
+def test_not_split() -> None:
+    api = _api()
+
+    result = api.get_unified_series("a", "b", frequency=SeriesFrequency.DAILY)
+
+    assert _requests(api) == [["a", "b"]]
+    assert result.dates == _dates(3, 4, 5)
+
+
+def test_split_available_in_any() -> None:
+    api = _api()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = api.get_unified_series("a", "b", "c", "d", frequency=SeriesFrequency.DAILY, chunk_size=2)
+
+    assert sorted(_requests(api)) == [["a", "b"], ["c", "d"]]
+    assert result.dates == _dates(3, 4, 5, 6)
+    assert [x.name for x in result] == ["a", "b", "c", "d"]
+    assert result[0].values == [1, 2, 3, None]
+    assert result[1].values == [10, None, 30, None]
+    assert result[3].values == [None, None, 3000, 4000]
+
+
+def test_split_available_in_all() -> None:
+    api = _api()
+
+    with pytest.warns(UnifiedSeriesSplitWarning, match="outside the common date range"):
+        result = api.get_unified_series(
+            "a",
+            "b",
+            "c",
+            frequency=SeriesFrequency.DAILY,
+            calendar_merge_mode=CalendarMergeMode.AVAILABLE_IN_ALL,
+            chunk_size=2,
+            max_workers=1,
+        )
+
+    assert _requests(api) == [["a", "b"], ["c"]]
+    assert result.dates == _dates(3, 5)
+    assert [x.values for x in result] == [[1, 3], [10, 30], [None, 300]]
+
+
+def test_split_available_in_all_common_range() -> None:
+    result = _api().get_unified_series(
+        "a", "e", "b", frequency=SeriesFrequency.DAILY, calendar_merge_mode=CalendarMergeMode.AVAILABLE_IN_ALL
+    )
+    split_result = _api().get_unified_series(
+        "a",
+        "e",
+        "b",
+        frequency=SeriesFrequency.DAILY,
+        calendar_merge_mode=CalendarMergeMode.AVAILABLE_IN_ALL,
+        chunk_size=2,
+    )
+
+    assert split_result.dates == result.dates == _dates(3, 5)
+    assert [x.values for x in split_result] == [x.values for x in result]
+
+
+def test_split_warns_when_semantics_change() -> None:
+    api = _api()
+
+    with pytest.warns(UnifiedSeriesSplitWarning, match="frequency.*missing values"):
+        api.get_unified_series(
+            "a", SeriesEntry("d", missing_value_method=SeriesMissingValueMethod.PREVIOUS_VALUE), chunk_size=1
+        )
+
+
+def test_split_warns_for_unsigned_observation_point() -> None:
+    api = _api()
+
+    with pytest.warns(UnifiedSeriesSplitWarning, match="relative start or end point"):
+        api.get_unified_series(
+            "a",
+            "d",
+            frequency=SeriesFrequency.DAILY,
+            end_point=StartOrEndPoint.relative_to_observations(2),
+            chunk_size=1,
+        )
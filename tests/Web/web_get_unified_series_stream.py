@@ -0,0 +1,87 @@
+from datetime import datetime
+from io import BytesIO
+from json import dumps as json_dumps
+from typing import Any, Dict
+
+import pytest
+from requests import Response
+
+from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.session import Session
+
+
+_VALUE_TYPES = {"LastModifiedTimeStamp": 7, "StreamTestInt": 3}
+
+
+class TestAuth2Session:
+    __test__ = False
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+
+    def request(self, method: str, url: str, *args: Any, json: Dict[str, Any], **kwargs: Any) -> Response:
+        if url.endswith("v1/metadata/getattributeinformation"):
+            name = kwargs["params"]["n"][0]
+            content = json_dumps([{"name": name, "valueType": _VALUE_TYPES.get(name, 8)}])
+        else:
+            assert kwargs["stream"]
+            content = self.content
+        response = Response()
+        response.status_code = 200
+        response.raw = BytesIO(bytes(content, "utf-8"))
+        return response
+
+
+def _api(content: Dict[str, Any]) -> WebApi:
+    return WebApi(Session("", "", test_auth2_session=TestAuth2Session(json_dumps(content))))
+
+
+def test_stream() -> None:
+    api = _api(
+        {
+            "dates": ["2000-01-01T00:00:00", "2000-02-01T00:00:00"],
+            "series": [
+                {
+                    "values": [1, 2.5],
+                    "metadata": {
+                        "LastModifiedTimeStamp": "2000-03-01T00:00:00Z",
+                        "StreamTestInt": 1,
+                        "StreamTestList": ["us", "ca"],
+                        "StreamTestNested": {"a": [{"b": 0.5}]},
+                    },
+                },
+                {"errorText": "Not found"},
+                {"values": [None, 3], "metadata": {}},
+            ],
+        }
+    )
+
+    result = api.get_unified_series("a", "missing", "b", raise_error=False)
+
+    assert result.dates == [datetime(2000, 1, 1), datetime(2000, 2, 1)]
+    assert [x.name for x in result] == ["a", "missing", "b"]
+    assert result[0].values == [1.0, 2.5]
+    assert all(isinstance(x, float) for x in result[0].values)
+    assert result[1].error_message == "Not found"
+    assert result[2].values == [None, 3.0]
+
+    metadata = result[0].metadata
+    assert metadata["StreamTestInt"] == 1
+    assert metadata["StreamTestList"] == ["us", "ca"]
+    assert metadata["StreamTestNested"] == {"a": [{"b": 0.5}]}
+    assert metadata["LastModifiedTimeStamp"].year == 2000
+
+
+def test_stream_as_matrix_series_before_dates() -> None:
+    numpy = pytest.importorskip("numpy")
+    api = _api(
+        {
+            "series": [{"values": [1, None], "metadata": {}}, {"values": [3, 4], "metadata": {}}],
+            "dates": ["2000-01-01T00:00:00", "2000-02-01T00:00:00"],
+        }
+    )
+
+    result = api.get_unified_series("a", "b", as_matrix=True)
+
+    numpy.testing.assert_array_equal(result.to_numpy(), [[1, 3], [numpy.nan, 4]])
+    assert numpy.shares_memory(result[0].values, result.to_numpy())
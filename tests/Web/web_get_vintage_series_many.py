@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+from io import BytesIO
+from json import dumps as json_dumps
+from typing import Any, Dict, List
+
+import pytest
+from requests import Response
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import GetEntitiesError
+from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.session import Session
+
+numpy = pytest.importorskip("numpy")
+
+
+class TestAuth2Session:
+    __test__ = False
+
+    def request(self, *args: Any, json: List[Dict[str, Any]], **kwargs: Any) -> Response:
+        response = Response()
+        response.status_code = 200
+        response.raw = BytesIO(bytes(json_dumps([self._series(x["name"]) for x in json]), "utf-8"))
+        return response
+
+    def _series(self, name: str) -> Dict[str, Any]:
+        if name == "missing":
+            return {"errorText": "Not found", "errorCode": 404}
+        return {
+            "vintages": [
+                {"vintageTimeStamp": "2000-02-01T00:00:00Z", "dates": ["2000-01-01"], "values": [1]},
+                {"vintageTimeStamp": "2000-03-01T00:00:00Z", "dates": ["2000-01-01", "2000-02-01"], "values": [2, 3]},
+            ]
+        }
+
+
+def _api() -> WebApi:
+    return WebApi(Session("", "", test_auth2_session=TestAuth2Session()))
+
+
+def test_get_vintage_series_many() -> None:
+    times = [datetime(2000, 1, 1), datetime(2000, 2, 15), datetime(2000, 3, 1, tzinfo=timezone.utc)]
+
+    result = list(_api().get_vintage_series_many(times, ["usgdp", "missing"], raise_error=False))
+
+    assert [x.name for x in result] == ["usgdp", "missing"]
+    matrix = result[0].matrix
+    assert matrix is not None
+    assert matrix.dates == [datetime(2000, 1, 1), datetime(2000, 2, 1)]
+    assert matrix.vintage_time_stamps == times
+    numpy.testing.assert_array_equal(matrix.values, [[numpy.nan, 1.0, 2.0], [numpy.nan, numpy.nan, 3.0]])
+    assert result[1].is_error and result[1].status_code == StatusCode.NOT_FOUND
+
+
+def test_get_vintage_series_many_raise_error() -> None:
+    with pytest.raises(GetEntitiesError):
+        list(_api().get_vintage_series_many([datetime(2000, 1, 1)], ["missing"], raise_error=True))
+
+
+def test_get_nth_releases() -> None:
+    result = list(_api().get_nth_releases(range(3), ["usgdp"], include_times_of_change=True))[0]
+
+    assert result.dates == [datetime(2000, 1, 1), datetime(2000, 2, 1)]
+    numpy.testing.assert_array_equal(result.releases[0], [1.0, 3.0])
+    numpy.testing.assert_array_equal(result.releases[1], [2.0, numpy.nan])
+    numpy.testing.assert_array_equal(result.releases[2], [numpy.nan, numpy.nan])
+    assert result.times_of_change is not None
+    assert result.times_of_change[0] == [
+        datetime(2000, 2, 1, tzinfo=timezone.utc),
+        datetime(2000, 3, 1, tzinfo=timezone.utc),
+    ]
+    assert result.times_of_change[1] == [datetime(2000, 3, 1, tzinfo=timezone.utc), None]
@@ -0,0 +1,100 @@
+from io import BytesIO
+from json import dumps as json_dumps, loads as json_loads
+from typing import Any, Dict, List
+
+import pytest
+from requests import Response
+from requests.exceptions import InvalidJSONError
+
+from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.json_codec import StdlibJsonCodec, get_json_codec
+from macrobond_data_api.web.session import Session
+
+
+class TestAuth2Session:
+    __test__ = False
+
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> Response:
+        self.calls.append(kwargs)
+        response = Response()
+        response.status_code = 200
+        response.raw = BytesIO(bytes(json_dumps([{"name": "usgdp", "entityInfo": {"x": 1.5}}]), "utf-8"))
+        return response
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codec(name: str) -> None:
+    pytest.importorskip(name)
+    auth2_session = TestAuth2Session()
+    session = Session("", "", test_auth2_session=auth2_session, json_codec=name)
+
+    assert session.json_codec.name == name
+    assert session.series.fetch_entities("usgdp") == [{"name": "usgdp", "entityInfo": {"x": 1.5}}]
+
+    session.in_house_series.upload_series({"forecastFlags": [False], "values": [1.5, None]})
+    call = auth2_session.calls[-1]
+    if isinstance(session.json_codec, StdlibJsonCodec):
+        assert call["json"] == {"forecastFlags": [False], "values": [1.5, None]}
+        assert "data" not in call
+    else:
+        assert "json" not in call
+        assert json_loads(call["data"]) == {"forecastFlags": [False], "values": [1.5, None]}
+        assert call["headers"]["Content-Type"] == "application/json"
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec"])
+def test_codec_upload_series_with_numpy(name: str) -> None:
+    pytest.importorskip(name)
+    numpy = pytest.importorskip("numpy")
+    auth2_session = TestAuth2Session()
+    session = Session("", "", test_auth2_session=auth2_session, json_codec=name)
+
+    session.in_house_series.upload_series(
+        {
+            "forecastFlags": numpy.array([False, True]),
+            "values": numpy.array([1.5, 2.0], dtype=numpy.float32),
+            "dates": [numpy.float64(3.5), numpy.int64(4)],
+        }
+    )
+
+    assert json_loads(auth2_session.calls[-1]["data"]) == {
+        "forecastFlags": [False, True],
+        "values": [1.5, 2.0],
+        "dates": [3.5, 4],
+    }
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codec_rejects_nan(name: str) -> None:
+    pytest.importorskip(name)
+    numpy = pytest.importorskip("numpy")
+    codec = get_json_codec(name)
+
+    invalid: List[Any] = [[1.5, float("nan")], [float("inf")], [numpy.float64("nan")]]
+    if name != "json":
+        invalid.append(numpy.array([1.5, numpy.nan]))
+    for values in invalid:
+        with pytest.raises(ValueError):
+            codec.dumps({"values": values})
+    assert json_loads(codec.dumps({"values": [1.5, None]})) == {"values": [1.5, None]}
+
+    if name != "json":
+        session = Session("", "", test_auth2_session=TestAuth2Session(), json_codec=name)
+        # The same error as requests raises when the json module rejects the body
+        with pytest.raises(InvalidJSONError):
+            session.in_house_series.upload_series({"values": [float("nan")]})
+
+
+def test_web_api_uses_codec() -> None:
+    pytest.importorskip("orjson")
+    api = WebApi(Session("", "", test_auth2_session=TestAuth2Session(), json_codec="orjson"))
+
+    assert api.session.series.fetch_entities("usgdp") == [{"name": "usgdp", "entityInfo": {"x": 1.5}}]
+
+
+def test_unknown_codec() -> None:
+    with pytest.raises(ValueError):
+        get_json_codec("simplejson")
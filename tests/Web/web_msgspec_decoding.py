@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+from io import BytesIO
+from json import dumps as json_dumps, loads as json_loads
+from typing import Any, Dict, List
+
+import pytest
+from requests import Response
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import Entity, Series
+from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.session import Session
+
+pytest.importorskip("msgspec")
+
+_SERIES: Dict[str, Dict[str, Any]] = {
+    "usgdp": {
+        "values": [1, None, 2.5, -1e300],
+        "dates": ["2000-01-01T00:00:00", "2000-02-01T00:00:00", "2000-03-01T00:00:00", "2000-04-01T00:00:00"],
+        "metadata": {"PrimName": "usgdp", "Region": ["us"], "MsgspecTestNumber": 1.5},
+    },
+    "uscpi": {
+        "values": [],
+        "dates": [],
+        "metadata": {"PrimName": "uscpi"},
+    },
+    "missing": {"errorText": "Not found", "errorCode": 404},
+    "unchanged": {"errorText": "Not modified", "errorCode": 304},
+    "utc": {
+        "values": [3],
+        "dates": ["2000-01-01T12:30:00.123Z"],
+        "metadata": {"PrimName": "utc"},
+        "unknownField": {"a": 1},
+    },
+    "precise": {
+        "values": [4, 5],
+        "dates": ["2000-01-01T12:30:56.1234567Z", "2000-01-01T12:30:56.9999999Z"],
+        "metadata": {"PrimName": "precise"},
+    },
+    "dateonly": {
+        "values": [6],
+        "dates": ["2000-01-01"],
+        "metadata": {"PrimName": "dateonly"},
+    },
+}
+
+
+class TestAuth2Session:
+    __test__ = False
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> Response:
+        if url.endswith("v1/metadata/getattributeinformation"):
+            content: Any = [{"name": kwargs["params"]["n"][0], "valueType": 8}]
+        elif method == "GET":
+            content = [_SERIES[x] for x in kwargs["params"]["n"]]
+        else:
+            data = kwargs.get("data")
+            body = kwargs["json"] if data is None else json_loads(data)
+            content = [_SERIES[x["name"]] for x in body]
+        response = Response()
+        response.status_code = 200
+        response.raw = BytesIO(bytes(json_dumps(content), "utf-8"))
+        return response
+
+
+def _api(json_codec: str) -> WebApi:
+    return WebApi(Session("", "", test_auth2_session=TestAuth2Session(), json_codec=json_codec))
+
+
+def _as_tuple(entity: Entity) -> Any:
+    metadata = dict(entity.metadata.items()) if entity.metadata is not None else None
+    if isinstance(entity, Series):
+        return (entity.name, entity.error_message, entity.status_code, metadata, entity.values, entity.dates)
+    return (entity.name, entity.error_message, entity.status_code, metadata)
+
+
+def _assert_same(expected: List[Any], actual: List[Any]) -> None:
+    assert [_as_tuple(x) for x in actual] == [_as_tuple(x) for x in expected]
+    for x, y in zip(expected, actual):
+        if isinstance(x, Series) and x.values:
+            assert [type(z) for z in x.values] == [type(z) for z in y.values]
+
+
+def test_get_series_same_as_json() -> None:
+    names = list(_SERIES)
+
+    expected = _api("json").get_series(names, raise_error=False)
+    actual = _api("msgspec").get_series(names, raise_error=False)
+
+    _assert_same(list(expected), list(actual))
+    assert actual[4].dates == [datetime(2000, 1, 1, 12, 30, 0, 123000, tzinfo=timezone.utc)]
+    assert actual[5].dates == [
+        datetime(2000, 1, 1, 12, 30, 56, 123456, tzinfo=timezone.utc),
+        datetime(2000, 1, 1, 12, 30, 56, 999999, tzinfo=timezone.utc),
+    ]
+    assert actual[6].dates == [datetime(2000, 1, 1)]
+    assert actual[2].status_code == StatusCode.NOT_FOUND
+
+
+def test_get_entities_same_as_json() -> None:
+    names = list(_SERIES)
+
+    expected = _api("json").get_entities(names, raise_error=False)
+    actual = _api("msgspec").get_entities(names, raise_error=False)
+
+    _assert_same(list(expected), list(actual))
+
+
+def test_get_many_series_same_as_json() -> None:
+    names = list(_SERIES)
+
+    expected = list(_api("json").get_many_series(names, include_not_modified=True))
+    actual = list(_api("msgspec").get_many_series(names, include_not_modified=True))
+
+    _assert_same(expected, actual)
+    assert len(list(_api("msgspec").get_many_series(names))) == len(names) - 1
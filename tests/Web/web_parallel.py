@@ -0,0 +1,43 @@
+import threading
+from typing import List
+
+import pytest
+
+from macrobond_data_api.web._parallel import parallel_as_completed, parallel_map
+
+
+def test_parallel_map_keeps_order() -> None:
+    assert list(parallel_map(lambda x: x * 2, range(10), 3)) == [x * 2 for x in range(10)]
+
+
+def test_parallel_map_raises() -> None:
+    def func(x: int) -> int:
+        if x == 2:
+            raise ValueError("error")
+        return x
+
+    with pytest.raises(ValueError, match="error"):
+        list(parallel_map(func, range(5), 2))
+
+
+def test_parallel_as_completed_bounds_in_flight() -> None:
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def func(x: int) -> int:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        with lock:
+            in_flight -= 1
+        return x
+
+    results: List[int] = []
+    for item, future in parallel_as_completed(func, range(20), 4):
+        assert future.result() == item
+        results.append(item)
+
+    assert sorted(results) == list(range(20))
+    assert max_in_flight <= 4
@@ -0,0 +1,75 @@
+import gzip
+from io import BytesIO
+from json import dumps as json_dumps
+
+import ijson
+import pytest
+from requests import Response
+from urllib3 import HTTPResponse
+
+from macrobond_data_api.web.session import Session
+
+_CONTENT = [{"name": f"series{i}", "values": list(range(i % 50))} for i in range(2000)]
+_BODY = bytes(json_dumps(_CONTENT), "utf-8")
+
+
+def _response(body: bytes, gzipped: bool) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.raw = HTTPResponse(
+        BytesIO(gzip.compress(body) if gzipped else body),
+        headers={"Content-Encoding": "gzip"} if gzipped else {},
+        preload_content=False,
+    )
+    return response
+
+
+def _session() -> Session:
+    return Session("", "", test_auth2_session=object())
+
+
+@pytest.mark.parametrize("gzipped", [False, True])
+@pytest.mark.parametrize("buffer_size", [1, 1000, 65536])
+def test_read(gzipped: bool, buffer_size: int) -> None:
+    file_object = _session()._response_to_file_object(_response(_BODY, gzipped), buffer_size)
+
+    assert file_object.read(0) == b""
+    assert file_object.read(10) == _BODY[:10]
+    assert file_object.read() == _BODY[10:]
+    assert file_object.read(10) == b""
+
+
+def test_readinto() -> None:
+    file_object = _session()._response_to_file_object(_response(_BODY, True))
+
+    buffer = bytearray(100000)
+    parts = []
+    while True:
+        length = file_object.readinto(buffer)
+        if length == 0:
+            break
+        parts.append(bytes(buffer[:length]))
+
+    assert b"".join(parts) == _BODY
+
+
+def test_bytes_io_and_consumed_content() -> None:
+    response = Response()
+    response.raw = BytesIO(_BODY)
+    assert _session()._response_to_file_object(response).read() == _BODY
+
+    response = _response(_BODY, True)
+    assert response.content == _BODY
+    assert _session()._response_to_file_object(response).read() == _BODY
+
+
+@pytest.mark.parametrize("backend", ["yajl2_c", "yajl2", "yajl2_cffi", "python"])
+def test_ijson_backends(backend: str) -> None:
+    try:
+        ijson_backend = ijson.get_backend(backend)
+    except ImportError:
+        pytest.skip(f"ijson backend {backend} is not available")
+
+    file_object = _session()._response_to_file_object(_response(_BODY, True))
+
+    assert list(ijson_backend.items(file_object, "item")) == _CONTENT
@@ -1,6 +1,10 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List
+from unittest.mock import Mock
 
+from macrobond_data_api.common.enums import StatusCode
 from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.subscription_list import SubscriptionList
 
 
 def test_subscription_list(web: WebApi) -> None:
@@ -16,3 +20,189 @@ def test_subscription_list(web: WebApi) -> None:
     assert set(subscription_list.list()) == {"sek", "dkk"}
 
     assert subscription_list.poll() == {}
+
+
+class _FakeSubscriptionList:
+    def __init__(self, keys: List[str], delayed: List[str]) -> None:
+        self.keys = set(keys)
+        self.pending: List[Callable[[], None]] = []
+        self.delayed = delayed
+
+    def post(self, endpoint: str, json: List[str]) -> Any:
+        response = Mock()
+        if endpoint == "v1/subscriptionlist/add":
+            self._apply(json, lambda x: self.keys.update(x.lower() for x in json))
+        elif endpoint == "v1/subscriptionlist/set":
+            self._apply(json, lambda x: setattr(self, "keys", {x.lower() for x in json}))
+        elif endpoint == "v1/subscriptionlist/remove":
+            self._apply(json, lambda x: self.keys.difference_update(x.lower() for x in json))
+        elif endpoint == "v1/subscriptionlist/checkifnotincluded":
+            response.json.return_value = [x for x in json if x.lower() not in self.keys]
+            if any(x in self.delayed for x in json):
+                for apply in self.pending:
+                    apply()
+                self.pending = []
+        return response
+
+    def _apply(self, keys: List[str], apply: Callable[[List[str]], None]) -> None:
+        if any(x in self.delayed for x in keys):
+            self.pending.append(lambda: apply(keys))
+        else:
+            apply(keys)
+
+
+def _new_session(current: List[str], delayed: List[str]) -> Any:
+    server = _FakeSubscriptionList([x.lower() for x in current], delayed)
+    session = Mock()
+    session._is_open = True
+    session.get_or_raise.return_value.json.return_value = current
+    session.post_or_raise.side_effect = server.post
+    return session
+
+
+def test_sync_sends_only_difference() -> None:
+    session = _new_session(["sek", "NOK", "dkk"], [])
+    subscription_list = SubscriptionList(session, datetime.now(timezone.utc))
+
+    added, removed = subscription_list.sync(["nok", "usd", "eur", "dkk"], chunk_size=1)
+
+    assert sorted(added) == ["eur", "usd"]
+    assert removed == ["sek"]
+    posts = [(x.args[0], x.kwargs["json"]) for x in session.post_or_raise.call_args_list]
+    assert sorted(x for x in posts if x[0] != "v1/subscriptionlist/checkifnotincluded") == [
+        ("v1/subscriptionlist/add", ["eur"]),
+        ("v1/subscriptionlist/add", ["usd"]),
+        ("v1/subscriptionlist/remove", ["sek"]),
+    ]
+
+
+def test_sync_checks_only_pending_keys() -> None:
+    session = _new_session([], ["eur"])
+    subscription_list = SubscriptionList(session, datetime.now(timezone.utc))
+
+    subscription_list.sync(["usd", "eur"], chunk_size=1, max_workers=1)
+
+    checks = [
+        x.kwargs["json"]
+        for x in session.post_or_raise.call_args_list
+        if x.args[0] == "v1/subscriptionlist/checkifnotincluded"
+    ]
+    assert checks == [["usd"], ["eur"], ["eur"]]
+
+
+def test_sync_no_changes() -> None:
+    session = _new_session(["sek"], [])
+    subscription_list = SubscriptionList(session, datetime.now(timezone.utc))
+
+    assert subscription_list.sync(["sek"]) == ([], [])
+    session.post_or_raise.assert_not_called()
+
+
+def test_poll_series_merges_changes() -> None:
+    session = Mock()
+    session._is_open = True
+    session.get_or_raise.return_value.json.side_effect = [
+        {
+            "noMoreChanges": False,
+            "timeStampForIfModifiedSince": "2000-01-02T00:00:00Z",
+            "entities": [
+                {"name": "sek", "modified": "2000-01-01T00:00:00Z"},
+                {"name": "nok", "modified": "2000-01-01T00:00:00Z"},
+            ],
+        },
+        {
+            "noMoreChanges": True,
+            "timeStampForIfModifiedSince": "2000-01-03T00:00:00Z",
+            "entities": [{"name": "sek", "modified": "2000-01-02T00:00:00Z"}],
+        },
+    ]
+    session.series.post_fetch_series.side_effect = lambda *requests: [
+        {"dates": ["2000-01-01T00:00:00Z"], "values": [1], "metadata": {}} for _ in requests
+    ]
+    subscription_list = SubscriptionList(session, datetime.now(timezone.utc))
+
+    series = list(subscription_list.poll_series(chunk_size=1))
+
+    assert sorted(x.name for x in series) == ["nok", "sek"]
+    assert session.series.post_fetch_series.call_count == 2
+    assert subscription_list.last_modified == datetime(2000, 1, 3, tzinfo=timezone.utc)
+
+
+def _updates(*entities: Any) -> Any:
+    return {
+        "noMoreChanges": True,
+        "timeStampForIfModifiedSince": "2000-01-03T00:00:00Z",
+        "entities": [{"name": x, "modified": y} for x, y in entities],
+    }
+
+
+def test_poll_series_sends_last_known_modified() -> None:
+    session = Mock()
+    session._is_open = True
+    session.get_or_raise.return_value.json.side_effect = [
+        _updates(("sek", "2000-01-01T00:00:00Z")),
+        _updates(("sek", "2000-01-02T00:00:00Z"), ("nok", "2000-01-02T00:00:00Z")),
+    ]
+    session.series.post_fetch_series.side_effect = lambda *requests: [
+        (
+            {"errorText": "Not modified", "errorCode": 304}
+            if x["name"] == "nok"
+            else {"dates": ["2000-01-01T00:00:00Z"], "values": [1], "metadata": {}}
+        )
+        for x in requests
+    ]
+    subscription_list = SubscriptionList(session, datetime.now(timezone.utc))
+    subscription_list.poll_interval = timedelta(0)
+
+    first = list(subscription_list.poll_series())
+    second = list(subscription_list.poll_series())
+
+    assert [x.name for x in first] == ["sek"]
+    assert [x.name for x in second] == ["sek"]
+    requests = [list(x.args) for x in session.series.post_fetch_series.call_args_list]
+    assert requests == [
+        [{"name": "sek", "ifModifiedSince": None}],
+        [
+            {"name": "sek", "ifModifiedSince": "2000-01-01T00:00:00+00:00"},
+            {"name": "nok", "ifModifiedSince": None},
+        ],
+    ]
+
+
+def test_poll_series_reports_failed_chunk() -> None:
+    session = Mock()
+    session._is_open = True
+    session.get_or_raise.return_value.json.return_value = _updates(
+        ("sek", "2000-01-01T00:00:00Z"), ("nok", "2000-01-01T00:00:00Z")
+    )
+
+    def post_fetch_series(*requests: Any) -> Any:
+        if requests[0]["name"] == "sek":
+            raise Exception("error")
+        return [{"dates": [], "values": [], "metadata": {}}]
+
+    session.series.post_fetch_series.side_effect = post_fetch_series
+    subscription_list = SubscriptionList(session, datetime.now(timezone.utc))
+
+    series = sorted(subscription_list.poll_series(chunk_size=1), key=lambda x: x.name)
+
+    assert [(x.name, x.error_message, x.status_code) for x in series] == [
+        ("nok", "", StatusCode.OK),
+        ("sek", "error", StatusCode.OTHER),
+    ]
+
+
+def test_modified_is_pruned_when_series_leave_the_list() -> None:
+    session = _new_session(["sek", "nok", "dkk", "usd"], [])
+    subscription_list = SubscriptionList(session, datetime.now(timezone.utc))
+    modified = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    subscription_list._modified = {x: modified for x in ["sek", "nok", "dkk", "usd"]}
+
+    subscription_list.remove(["NOK"])
+    assert sorted(subscription_list._modified) == ["dkk", "sek", "usd"]
+
+    subscription_list.sync(["sek", "DKK"])
+    assert sorted(subscription_list._modified) == ["dkk", "sek"]
+
+    subscription_list.set(["Sek", "eur"])
+    assert sorted(subscription_list._modified) == ["sek"]
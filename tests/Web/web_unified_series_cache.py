@@ -0,0 +1,179 @@
+import os
+from datetime import date, datetime, timezone
+from io import BytesIO
+from json import dumps as json_dumps
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from requests import Response
+
+from macrobond_data_api.common.enums import SeriesFrequency
+from macrobond_data_api.common.types import StartOrEndPoint
+from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
+from macrobond_data_api.web import UnifiedSeriesCache, WebApi
+from macrobond_data_api.web.session import Session
+from macrobond_data_api.web.web_types import UnifiedSeriesRequest
+
+
+class TestAuth2Session:
+    __test__ = False
+
+    def __init__(self) -> None:
+        self.unified_requests: List[Dict[str, Any]] = []
+        self.series_requests: List[Dict[str, Any]] = []
+        self.last_modified = "2000-01-01T00:00:00Z"
+
+    def request(self, method: str, url: str, *args: Any, json: Any, **kwargs: Any) -> Response:
+        if url.endswith("v1/metadata/getattributeinformation"):
+            content: Any = [{"name": "LastModifiedTimeStamp", "valueType": 7}]
+        elif url.endswith("v1/series/fetchseries"):
+            self.series_requests.extend(json)
+            last_modified = _parse_iso8601(self.last_modified)
+            content = [
+                (
+                    {"errorText": "Not modified", "errorCode": 304}
+                    if _parse_iso8601(x["ifModifiedSince"]) >= last_modified
+                    else {"dates": [], "values": [], "metadata": {"LastModifiedTimeStamp": self.last_modified}}
+                )
+                for x in json
+            ]
+        else:
+            self.unified_requests.append(json)
+            content = {
+                "dates": ["2000-01-01T00:00:00", "2000-02-01T00:00:00"],
+                "series": [
+                    {"values": [1, 2], "metadata": {"LastModifiedTimeStamp": self.last_modified}}
+                    for _ in json["seriesEntries"]
+                ],
+            }
+        response = Response()
+        response.status_code = 200
+        response.raw = BytesIO(bytes(json_dumps(content), "utf-8"))
+        return response
+
+
+def _api(cache: UnifiedSeriesCache) -> WebApi:
+    auth2_session = TestAuth2Session()
+    api = WebApi(Session("", "", test_auth2_session=auth2_session))
+    api.unified_series_cache = cache
+    return api
+
+
+def _requests(api: WebApi) -> List[Dict[str, Any]]:
+    return api.session.auth2_session.unified_requests
+
+
+def test_cache_hit_and_invalidate() -> None:
+    api = _api(UnifiedSeriesCache())
+
+    first = api.get_unified_series("usgdp", "uscpi")
+    second = api.get_unified_series("usgdp", "uscpi")
+    api.get_unified_series("uscpi", "usgdp")
+
+    assert second is first
+    assert len(_requests(api)) == 2
+
+    cache = api.unified_series_cache
+    assert cache is not None
+    cache.invalidate({"USGDP": datetime(2000, 1, 1, tzinfo=timezone.utc)})
+    assert api.get_unified_series("usgdp", "uscpi") is first
+
+    cache.invalidate({"usgdp": datetime(2000, 1, 2, tzinfo=timezone.utc)})
+    assert len(cache) == 0
+    assert api.get_unified_series("usgdp", "uscpi") is not first
+    assert len(_requests(api)) == 3
+
+
+def test_disk_cache(tmp_path: Path) -> None:
+    api = _api(UnifiedSeriesCache(str(tmp_path)))
+    first = api.get_unified_series("usgdp", start_point=StartOrEndPoint("2000", None))
+
+    api = _api(UnifiedSeriesCache(str(tmp_path)))
+    second = api.get_unified_series("usgdp", start_point=StartOrEndPoint("2000", None))
+
+    assert not _requests(api)
+    assert [x["name"] for x in api.session.auth2_session.series_requests] == ["usgdp"]
+    assert second.dates == first.dates
+    assert second[0].values == [1, 2]
+    assert second[0].metadata["LastModifiedTimeStamp"] == datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def test_disk_cache_is_checked_with_the_server(tmp_path: Path) -> None:
+    api = _api(UnifiedSeriesCache(str(tmp_path)))
+    api.get_unified_series("usgdp", "uscpi")
+
+    api = _api(UnifiedSeriesCache(str(tmp_path)))
+    api.session.auth2_session.last_modified = "2000-01-02T00:00:00Z"
+    result = api.get_unified_series("usgdp", "uscpi")
+
+    assert len(_requests(api)) == 1
+    assert result[0].metadata["LastModifiedTimeStamp"] == datetime(2000, 1, 2, tzinfo=timezone.utc)
+    assert api.get_unified_series("usgdp", "uscpi") is result
+    assert len(_requests(api)) == 1
+
+
+def test_disk_cache_without_session(tmp_path: Path) -> None:
+    api = _api(UnifiedSeriesCache(str(tmp_path)))
+    api.get_unified_series("usgdp")
+    request: UnifiedSeriesRequest = _requests(api)[0]  # type: ignore[assignment]
+
+    assert UnifiedSeriesCache(str(tmp_path)).get(request) is None
+    assert UnifiedSeriesCache(str(tmp_path)).get(request, session=api.session) is not None
+
+
+def test_disk_cache_removes_least_recently_used(tmp_path: Path) -> None:
+    api = _api(UnifiedSeriesCache(str(tmp_path), max_entries=2))
+    api.get_unified_series("a")
+    for path in tmp_path.iterdir():
+        os.utime(path, (1, 1))
+    api.get_unified_series("b")
+    api.get_unified_series("c")
+
+    assert len(list(tmp_path.iterdir())) == 2
+    api = _api(UnifiedSeriesCache(str(tmp_path), max_entries=2))
+    api.get_unified_series("b")
+    api.get_unified_series("c")
+    assert not _requests(api)
+    api.get_unified_series("a")
+    assert len(_requests(api)) == 1
+
+
+def test_key() -> None:
+    request: UnifiedSeriesRequest = {"frequency": SeriesFrequency.MONTHLY, "seriesEntries": [], "startPoint": "2000"}
+    relative: UnifiedSeriesRequest = {"frequency": SeriesFrequency.MONTHLY, "seriesEntries": [], "startPoint": "-10y"}
+    reordered: UnifiedSeriesRequest = {"startPoint": "2000", "seriesEntries": [], "frequency": SeriesFrequency.MONTHLY}
+
+    key = UnifiedSeriesCache._key
+
+    assert key(request) == key(reordered)
+    assert key(request, date(2000, 1, 1)) == key(request, date(2000, 1, 2))
+    assert key(relative, date(2000, 1, 1)) != key(relative, date(2000, 1, 2))
+    assert key(request) != key(request, as_matrix=True)
+
+
+def test_key_of_unsigned_observation_point() -> None:
+    for point in (StartOrEndPoint.relative_to_observations(5), StartOrEndPoint.relative_to_observations(0)):
+        request: UnifiedSeriesRequest = {
+            "frequency": SeriesFrequency.MONTHLY,
+            "seriesEntries": [],
+            "endPoint": point.time,
+        }
+
+        key = UnifiedSeriesCache._key
+
+        assert key(request, date(2000, 1, 1)) != key(request, date(2000, 1, 2))
+
+
+def test_disk_cache_as_matrix(tmp_path: Path) -> None:
+    numpy = pytest.importorskip("numpy")
+    api = _api(UnifiedSeriesCache(str(tmp_path)))
+    api.get_unified_series("usgdp", "uscpi", as_matrix=True)
+
+    api = _api(UnifiedSeriesCache(str(tmp_path)))
+    assert api.get_unified_series("usgdp", "uscpi")._matrix is None
+    result = api.get_unified_series("usgdp", "uscpi", as_matrix=True)
+
+    assert len(_requests(api)) == 1
+    numpy.testing.assert_array_equal(result.to_numpy(), [[1, 1], [2, 2]])
+    assert numpy.shares_memory(result[1].values, result.to_numpy())
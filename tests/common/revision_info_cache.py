@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+from macrobond_data_api.common import RevisionInfoCache
+from macrobond_data_api.common.types import RevisionInfo
+
+
+def _time(month: int) -> datetime:
+    return datetime(2000, month, 1, tzinfo=timezone.utc)
+
+
+def _info(name: str, month: int = 2) -> RevisionInfo:
+    if name == "missing":
+        return RevisionInfo(name, "Not found", False, False, None, None, [])
+    return RevisionInfo(name, "", True, True, _time(1), _time(month), [_time(1), _time(month)])
+
+
+def _api() -> Any:
+    api = Mock()
+    api.get_revision_info.side_effect = lambda *names, raise_error: [_info(x) for x in names]
+    return api
+
+
+def test_get_revision_info_downloads_missing(tmp_path: Path) -> None:
+    cache = RevisionInfoCache(str(tmp_path))
+    api = _api()
+
+    result = cache.get_revision_info(api, "usgdp", "missing")
+
+    assert [x.name for x in result] == ["usgdp", "missing"]
+    assert cache.names() == ["usgdp"]
+
+    result = cache.get_revision_info(api, "uscpi", "usgdp")
+
+    assert [x.name for x in result] == ["uscpi", "usgdp"]
+    assert api.get_revision_info.call_args_list[1][0] == ("uscpi",)
+    assert result[1] == _info("usgdp")
+
+
+def test_invalidate(tmp_path: Path) -> None:
+    cache = RevisionInfoCache(str(tmp_path))
+    cache.put(_info("usgdp"))
+    cache.put(_info("uscpi"))
+
+    removed = cache.invalidate({"usgdp": _time(2), "uscpi": _time(3), "other": _time(3)})
+
+    assert removed == ["uscpi"]
+    assert cache.names() == ["usgdp"]
+    assert cache.get("uscpi") is None
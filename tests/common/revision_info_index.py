@@ -0,0 +1,57 @@
+import json
+import pickle
+from datetime import datetime, timezone
+
+from macrobond_data_api.common.types import RevisionInfo, RevisionInfoIndex
+
+
+def _utc(year: int, month: int, day: int, hour: int = 0, minute: int = 0) -> datetime:
+    return datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
+
+
+def _index() -> RevisionInfoIndex:
+    return RevisionInfoIndex.from_time_stamps([_utc(2000, 3, 1), _utc(2000, 1, 1), _utc(2000, 2, 1, 12, 30)])
+
+
+def test_vintage_at() -> None:
+    index = _index()
+
+    assert len(index) == 3
+    assert index.vintage_at(_utc(1999, 12, 31)) is None
+    assert index.vintage_at(_utc(2000, 1, 1)) == _utc(2000, 1, 1)
+    assert index.vintage_at(_utc(2000, 2, 1, 12, 29)) == _utc(2000, 1, 1)
+    assert index.vintage_at(_utc(2000, 2, 1, 12, 30)) == _utc(2000, 2, 1, 12, 30)
+    assert index.vintage_at(_utc(2001, 1, 1)) == _utc(2000, 3, 1)
+    assert index.vintage_index_at(_utc(1999, 1, 1)) == -1
+    assert index.vintage_index_at(_utc(2000, 2, 15)) == 1
+
+
+def test_vintage_at_naive_time_is_utc() -> None:
+    assert _index().vintage_at(datetime(2000, 2, 1, 12, 30)) == _utc(2000, 2, 1, 12, 30)
+
+
+def test_vintages_between() -> None:
+    index = _index()
+
+    assert index.vintages_between(_utc(2000, 1, 1), _utc(2000, 3, 1)) == [_utc(2000, 1, 1), _utc(2000, 2, 1, 12, 30)]
+    assert index.vintages_between(_utc(2000, 1, 2), _utc(2000, 3, 2)) == [_utc(2000, 2, 1, 12, 30), _utc(2000, 3, 1)]
+    assert not index.vintages_between(_utc(2001, 1, 1), _utc(2002, 1, 1))
+
+
+def test_to_dict_from_dict() -> None:
+    index = _index()
+
+    data = json.loads(json.dumps(index.to_dict()))
+
+    assert RevisionInfoIndex.from_dict(data) == index
+    assert pickle.loads(pickle.dumps(index)) == index
+
+
+def test_revision_info_index_is_kept() -> None:
+    info = RevisionInfo("s", "", True, True, _utc(2000, 1, 1), _utc(2000, 3, 1), [_utc(2000, 1, 1), _utc(2000, 3, 1)])
+
+    index = info.index
+
+    assert index is info.index
+    assert index.vintage_at(_utc(2000, 2, 1)) == _utc(2000, 1, 1)
+    assert pickle.loads(pickle.dumps(info)).index == index
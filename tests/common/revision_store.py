@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import Mock
+
+from macrobond_data_api.common import RevisionStore
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import SeriesWithVintages, VintageValues
+
+
+def _time(month: int) -> datetime:
+    return datetime(2000, month, 1, tzinfo=timezone.utc)
+
+
+def _vintage(month: int, values: List[float]) -> VintageValues:
+    return VintageValues(_time(month), [datetime(1999, i + 1, 1) for i in range(len(values))], list(values))
+
+
+def _series(status_code: StatusCode, vintages: List[VintageValues], month: int) -> SeriesWithVintages:
+    metadata = {
+        "LastModifiedTimeStamp": _time(month),
+        "LastRevisionTimeStamp": _time(month),
+        "LastRevisionAdjustmentTimeStamp": _time(1),
+    }
+    return SeriesWithVintages(None, status_code, metadata, vintages, "usgdp")
+
+
+def _api(*responses: SeriesWithVintages) -> Any:
+    api = Mock()
+    api.get_many_series_with_revisions.side_effect = lambda requests, include_not_modified: iter(responses)
+    return api
+
+
+def test_sync_full_then_partial(tmp_path: Path) -> None:
+    store = RevisionStore(str(tmp_path))
+
+    api = _api(_series(StatusCode.OK, [_vintage(1, [1]), _vintage(2, [1, 2]), _vintage(3, [1, 2, 3])], 3))
+    assert store.sync(api, ["usgdp"]) == {"usgdp": StatusCode.OK}
+    assert api.get_many_series_with_revisions.call_args[0][0][0].last_revision is None
+
+    api = _api(_series(StatusCode.PARTIAL_CONTENT, [_vintage(3, [1, 2, 4]), _vintage(4, [1, 2, 4, 5])], 4))
+    assert store.sync(api) == {"usgdp": StatusCode.PARTIAL_CONTENT}
+    request = api.get_many_series_with_revisions.call_args[0][0][0]
+    assert request.if_modified_since == _time(3)
+    assert request.last_revision == _time(3)
+    assert request.last_revision_adjustment == _time(1)
+
+    stored = store.get("usgdp")
+    assert stored is not None
+    assert [x.vintage_time_stamp for x in stored.vintages] == [_time(1), _time(2), _time(3), _time(4)]
+    assert stored.vintages[2].values == [1, 2, 4]
+    assert stored.last_revision == _time(4)
+
+
+def test_not_modified_and_errors_keep_store(tmp_path: Path) -> None:
+    store = RevisionStore(str(tmp_path))
+    store.apply(_series(StatusCode.OK, [_vintage(1, [1])], 1))
+
+    assert store.apply(SeriesWithVintages(None, StatusCode.NOT_MODIFIED, None, [], "usgdp")) == StatusCode.NOT_MODIFIED
+    assert store.apply(SeriesWithVintages("error", StatusCode.OTHER, None, [], "usgdp")) == StatusCode.OTHER
+
+    stored = store.get("usgdp")
+    assert stored is not None and len(stored.vintages) == 1
+    assert store.names() == ["usgdp"]
+
+    store.remove("usgdp")
+    assert store.get("usgdp") is None
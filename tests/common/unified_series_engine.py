@@ -0,0 +1,327 @@
+from datetime import datetime
+from json import loads as json_loads
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from macrobond_data_api.common import UnifiedSeriesEngine
+from macrobond_data_api.common.enums import (
+    CalendarDateMode,
+    CalendarMergeMode,
+    SeriesFrequency,
+    SeriesMissingValueMethod,
+    SeriesPartialPeriodsMethod,
+    SeriesToHigherFrequencyMethod,
+    SeriesToLowerFrequencyMethod,
+    SeriesWeekdays,
+    StatusCode,
+)
+from macrobond_data_api.common.types import GetEntitiesError, Series, SeriesEntry, StartOrEndPoint
+from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
+
+pytest.importorskip("numpy")
+
+
+def _series(name: str, frequency: str, dates: List[datetime], values: List[Optional[float]], **metadata: Any) -> Series:
+    all_metadata: Dict[str, Any] = {"Frequency": frequency, **metadata}
+    return Series(name, None, StatusCode.OK, all_metadata, None, values, dates)
+
+
+def _months(year: int, first: int, count: int) -> List[datetime]:
+    return [datetime(year + (first - 1 + i) // 12, (first - 1 + i) % 12 + 1, 1) for i in range(count)]
+
+
+def _engine() -> UnifiedSeriesEngine:
+    engine = UnifiedSeriesEngine()
+    engine.add(
+        _series("m", "Monthly", _months(2000, 1, 7), [1, 2, 3, 4, 5, 6, 7]),
+        _series("mflow", "Monthly", _months(2000, 1, 7), [1, 2, 3, 4, 5, 6, 7], Class="flow"),
+        _series("q", "Quarterly", [datetime(2000, 1, 1), datetime(2000, 4, 1)], [10, 20]),
+        _series("qflow", "Quarterly", [datetime(2000, 1, 1), datetime(2000, 4, 1)], [30, 60], Class="flow"),
+    )
+    return engine
+
+
+def test_to_higher_frequency() -> None:
+    result = _engine().get_unified_series("m", "q", "qflow")
+
+    assert result.dates == _months(2000, 1, 7)
+    assert result[0].values == [1, 2, 3, 4, 5, 6, 7]
+    assert result[1].values == [10, 10, 10, 20, 20, 20, None]
+    assert result[2].values == [10, 10, 10, 20, 20, 20, None]
+
+
+def test_to_higher_frequency_methods() -> None:
+    result = _engine().get_unified_series(
+        SeriesEntry("q", to_higher_frequency_method=SeriesToHigherFrequencyMethod.PULSE),
+        SeriesEntry("q", to_higher_frequency_method=SeriesToHigherFrequencyMethod.LINEAR_INTERPOLATION),
+        frequency=SeriesFrequency.MONTHLY,
+    )
+
+    assert result[0].values == [10, None, None, 20, None, None]
+    assert result[1].values == [None, None, 10, 40 / 3, 50 / 3, 20]
+
+
+def test_to_lower_frequency() -> None:
+    result = _engine().get_unified_series("m", "mflow", "q", frequency=SeriesFrequency.QUARTERLY)
+
+    assert result.dates == [datetime(2000, 1, 1), datetime(2000, 4, 1)]
+    assert result[0].values == [2, 5]
+    assert result[1].values == [6, 15]
+    assert result[2].values == [10, 20]
+
+
+def test_to_lower_frequency_methods_and_partial_periods() -> None:
+    result = _engine().get_unified_series(
+        SeriesEntry("m", to_lower_frequency_method=SeriesToLowerFrequencyMethod.LAST),
+        SeriesEntry("m", to_lower_frequency_method=SeriesToLowerFrequencyMethod.HIGHEST),
+        SeriesEntry(
+            "mflow",
+            to_lower_frequency_method=SeriesToLowerFrequencyMethod.FLOW,
+            partial_periods_method=SeriesPartialPeriodsMethod.REPEAT_LAST_VALUE,
+        ),
+        frequency=SeriesFrequency.QUARTERLY,
+    )
+
+    assert result.dates == [datetime(2000, 1, 1), datetime(2000, 4, 1), datetime(2000, 7, 1)]
+    assert result[0].values == [3, 6, None]
+    assert result[1].values == [3, 6, None]
+    assert result[2].values == [6, 15, 21]
+
+
+def test_daily_calendar_merge_modes() -> None:
+    engine = UnifiedSeriesEngine()
+    engine.add(
+        _series("a", "Daily", [datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 4)], [1, 2, 4]),
+        _series("b", "Daily", [datetime(2024, 1, 2), datetime(2024, 1, 3), datetime(2024, 1, 6)], [20, 30, 60]),
+    )
+
+    any_result = engine.get_unified_series("a", "b")
+    assert any_result.dates == [datetime(2024, 1, x) for x in (1, 2, 3, 4)]
+    assert any_result[0].values == [1, 2, None, 4]
+    assert any_result[1].values == [None, 20, 30, None]
+
+    all_result = engine.get_unified_series("a", "b", calendar_merge_mode=CalendarMergeMode.AVAILABLE_IN_ALL)
+    assert all_result.dates == [datetime(2024, 1, 2)]
+
+    full_result = engine.get_unified_series(
+        SeriesEntry("a", missing_value_method=SeriesMissingValueMethod.PREVIOUS_VALUE),
+        SeriesEntry("b", missing_value_method=SeriesMissingValueMethod.LINEAR_INTERPOLATION),
+        weekdays=SeriesWeekdays.FULL_WEEK,
+        calendar_merge_mode=CalendarMergeMode.FULL_CALENDAR,
+    )
+    assert full_result.dates == [datetime(2024, 1, x) for x in range(1, 7)]
+    assert full_result[0].values == [1, 2, 2, 4, None, None]
+    assert full_result[1].values == [None, 20, 30, 40, 50, 60]
+
+
+def test_start_and_end_points() -> None:
+    engine = _engine()
+
+    result = engine.get_unified_series(
+        "m", start_point=StartOrEndPoint.point_in_time(2000, 3), end_point=StartOrEndPoint("2000-05", None)
+    )
+    assert result.dates == _months(2000, 3, 3)
+
+    result = engine.get_unified_series(
+        "m", start_point=StartOrEndPoint.relative_to_observations(-2), end_point=StartOrEndPoint("+2", None)
+    )
+    assert result.dates == _months(2000, 7, 3)
+    assert result[0].values == [7, None, None]
+
+    result = engine.get_unified_series("m", start_point=StartOrEndPoint.relative_to_quarters(-1))
+    assert result.dates == _months(2000, 4, 4)
+
+    result = engine.get_unified_series(
+        "m", "q", start_point=StartOrEndPoint.data_in_all_series(), end_point=StartOrEndPoint.data_in_all_series()
+    )
+    assert result.dates == _months(2000, 1, 6)
+
+
+def test_unsigned_observation_points() -> None:
+    engine = _engine()
+
+    result = engine.get_unified_series(
+        "m",
+        start_point=StartOrEndPoint.relative_to_observations(-2),
+        end_point=StartOrEndPoint.relative_to_observations(2),
+    )
+    assert result.dates == _months(2000, 7, 3)
+    assert result[0].values == [7, None, None]
+
+    result = engine.get_unified_series(
+        "m",
+        start_point=StartOrEndPoint.relative_to_observations(-1),
+        end_point=StartOrEndPoint.relative_to_observations(0),
+    )
+    assert result.dates == _months(2000, 6, 2)
+
+    result = engine.get_unified_series("m", start_point=StartOrEndPoint.relative_to_observations(0))
+    assert result.dates == _months(2000, 7, 1)
+
+    result = engine.get_unified_series("m", start_point=StartOrEndPoint.point_in_time(2000))
+    assert result.dates == _months(2000, 1, 7)
+
+
+def _different_lengths() -> UnifiedSeriesEngine:
+    engine = _engine()
+    engine.add(
+        _series("empty", "Monthly", [], []),
+        _series("short", "Monthly", _months(2000, 3, 3), [30, None, 50]),
+        _series("late", "Monthly", _months(2000, 6, 4), [600, 700, 800, 900]),
+    )
+    return engine
+
+
+@pytest.mark.parametrize("mode", [CalendarMergeMode.AVAILABLE_IN_ANY, CalendarMergeMode.FULL_CALENDAR])
+def test_calendar_merge_modes_with_different_lengths(mode: CalendarMergeMode) -> None:
+    result = _different_lengths().get_unified_series("m", "short", "late", calendar_merge_mode=mode)
+
+    assert result.dates == _months(2000, 1, 9)
+    assert result[0].values == [1, 2, 3, 4, 5, 6, 7, None, None]
+    assert result[1].values == [None, None, 30, None, 50, None, None, None, None]
+    assert result[2].values == [None, None, None, None, None, 600, 700, 800, 900]
+
+
+def test_available_in_all_with_different_lengths() -> None:
+    engine = _different_lengths()
+
+    result = engine.get_unified_series("m", "short", calendar_merge_mode=CalendarMergeMode.AVAILABLE_IN_ALL)
+    assert result.dates == _months(2000, 3, 3)
+    assert result[0].values == [3, 4, 5]
+    assert result[1].values == [30, None, 50]
+
+    result = engine.get_unified_series("m", "short", "late", calendar_merge_mode=CalendarMergeMode.AVAILABLE_IN_ALL)
+    assert result.dates == []
+    assert [x.values for x in result] == [[], [], []]
+
+
+@pytest.mark.parametrize("mode", list(CalendarMergeMode))
+def test_empty_series(mode: CalendarMergeMode) -> None:
+    engine = _different_lengths()
+
+    result = engine.get_unified_series("m", "empty", calendar_merge_mode=mode)
+
+    if mode == CalendarMergeMode.AVAILABLE_IN_ALL:
+        assert result.dates == []
+        assert [x.values for x in result] == [[], []]
+    else:
+        assert result.dates == _months(2000, 1, 7)
+        assert result[1].values == [None] * 7
+    assert not result[1].is_error
+
+    result = engine.get_unified_series("empty", frequency=SeriesFrequency.QUARTERLY, calendar_merge_mode=mode)
+    assert result.dates == []
+    assert result[0].values == []
+
+
+@pytest.mark.parametrize(
+    "start_point, end_point",
+    [
+        (StartOrEndPoint.relative_to_months(-1), StartOrEndPoint.relative_to_months(-10)),
+        (StartOrEndPoint.relative_to_observations(-1), StartOrEndPoint.relative_to_observations(-10)),
+        (StartOrEndPoint.point_in_time(2001), StartOrEndPoint.point_in_time(1999)),
+        (StartOrEndPoint.point_in_time(2005), None),
+        (None, StartOrEndPoint.point_in_time(1990)),
+        (None, StartOrEndPoint.relative_to_observations(-20)),
+    ],
+)
+def test_points_without_dates(start_point: Optional[StartOrEndPoint], end_point: Optional[StartOrEndPoint]) -> None:
+    result = _engine().get_unified_series("m", "q", start_point=start_point, end_point=end_point)
+
+    assert result.dates == []
+    assert [x.values for x in result] == [[], []]
+
+
+def test_points_outside_data_range() -> None:
+    engine = _engine()
+
+    result = engine.get_unified_series(
+        "m", start_point=StartOrEndPoint.point_in_time(1999, 11), end_point=StartOrEndPoint.point_in_time(2000, 2)
+    )
+    assert result.dates == _months(2000, 1, 2)
+    assert result[0].values == [1, 2]
+
+    result = engine.get_unified_series("m", start_point=StartOrEndPoint.relative_to_observations(-20))
+    assert result.dates == _months(2000, 1, 7)
+
+    result = engine.get_unified_series("m", end_point=StartOrEndPoint.point_in_time(2000, 9))
+    assert result.dates == _months(2000, 1, 9)
+    assert result[0].values == [1, 2, 3, 4, 5, 6, 7, None, None]
+
+
+# Each file in unified_series_recordings holds a request to the Web API and the server's answer, so the engine can be
+# compared with the server. "series" maps each series name to its object in the response of v1/series/fetchseries,
+# "request" is the body posted to v1/series/fetchunifiedseries and "response" is the body of its response.
+_RECORDINGS = sorted((Path(__file__).parent / "unified_series_recordings").glob("*.json"))
+
+
+def _point(request: Dict[str, Any], name: str) -> Optional[StartOrEndPoint]:
+    if name + "Point" not in request:
+        return None
+    return StartOrEndPoint(request[name + "Point"], CalendarDateMode(request.get(name + "DateMode", 0)))
+
+
+@pytest.mark.parametrize("path", _RECORDINGS, ids=[x.stem for x in _RECORDINGS])
+def test_same_as_recorded_response(path: Path) -> None:
+    recording = json_loads(path.read_text(encoding="utf-8"))
+    engine = UnifiedSeriesEngine()
+    for name, series in recording["series"].items():
+        dates = [_parse_iso8601(x) for x in series["dates"]]
+        engine.add(Series(name, None, StatusCode.OK, series["metadata"], None, series["values"], dates))
+    request = recording["request"]
+    response = recording["response"]
+
+    result = engine.get_unified_series(
+        *[
+            SeriesEntry(
+                x["name"],
+                missing_value_method=SeriesMissingValueMethod(x["missingValueMethod"]),
+                partial_periods_method=SeriesPartialPeriodsMethod(x["partialPeriodsMethod"]),
+                to_lower_frequency_method=SeriesToLowerFrequencyMethod(x["toLowerFrequencyMethod"]),
+                to_higher_frequency_method=SeriesToHigherFrequencyMethod(x["toHigherFrequencyMethod"]),
+            )
+            for x in request["seriesEntries"]
+        ],
+        frequency=SeriesFrequency(request["frequency"]),
+        weekdays=SeriesWeekdays(request["weekdays"]),
+        calendar_merge_mode=CalendarMergeMode(request["calendarMergeMode"]),
+        start_point=_point(request, "start"),
+        end_point=_point(request, "end"),
+    )
+
+    assert result.dates == [_parse_iso8601(x) for x in response["dates"]]
+    for actual, expected in zip(result, response["series"]):
+        assert actual.is_error == bool(expected.get("errorText"))
+        if not actual.is_error:
+            assert actual.values == pytest.approx(expected["values"])
+
+
+def test_missing_series() -> None:
+    engine = _engine()
+
+    result = engine.get_unified_series("m", "missing")
+
+    assert not result[0].is_error
+    assert result[1].is_error
+    with pytest.raises(GetEntitiesError):
+        engine.get_unified_series("m", "missing", raise_error=True)
+
+
+def test_downloads_missing_series() -> None:
+    api = Mock()
+    api.raise_error = False
+    api.get_series.return_value = [_series("m", "Monthly", _months(2000, 1, 2), [1, 2])]
+    engine = UnifiedSeriesEngine(api)
+
+    assert engine.get_unified_series("M")[0].values == [1, 2]
+    assert engine.get_unified_series("m")[0].values == [1, 2]
+    api.get_series.assert_called_once_with(["M"], raise_error=False)
+    assert engine.names() == ["m"]
+
+
+def test_not_supported() -> None:
+    with pytest.raises(ValueError):
+        _engine().get_unified_series("m", currency="usd")
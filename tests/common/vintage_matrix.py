@@ -0,0 +1,129 @@
+from datetime import datetime, timezone
+from typing import Any, List, Optional
+
+import pytest
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import (
+    GetAllVintageSeriesResult,
+    NthReleasesResult,
+    SeriesObservationHistoryResult,
+    VintageMatrixResult,
+    VintageSeries,
+)
+
+numpy = pytest.importorskip("numpy")
+pandas = pytest.importorskip("pandas")
+
+
+def _vintage(time: Optional[datetime], values: List[Optional[float]]) -> VintageSeries:
+    dates = [datetime(2000, i + 1, 1) for i in range(len(values))]
+    return VintageSeries("s", None, StatusCode.OK, {}, None, values, dates, time)
+
+
+def _result() -> GetAllVintageSeriesResult:
+    return GetAllVintageSeriesResult(
+        [
+            _vintage(datetime(2000, 2, 1, tzinfo=timezone.utc), [1.0]),
+            _vintage(datetime(2000, 3, 1, tzinfo=timezone.utc), [1.0, 2.0]),
+            _vintage(datetime(2000, 4, 1, tzinfo=timezone.utc), [1.5, 2.0, None]),
+            _vintage(datetime(2000, 5, 1, tzinfo=timezone.utc), [1.7, 2.5, 3.0]),
+        ],
+        "s",
+    )
+
+
+def test_to_vintage_matrix() -> None:
+    matrix = _result().to_vintage_matrix()
+
+    assert matrix.dates == [datetime(2000, 1, 1), datetime(2000, 2, 1), datetime(2000, 3, 1)]
+    numpy.testing.assert_array_equal(
+        matrix.values,
+        [[1.0, 1.0, 1.5, 1.7], [numpy.nan, 2.0, 2.0, 2.5], [numpy.nan, numpy.nan, numpy.nan, 3.0]],
+    )
+
+
+def test_releases() -> None:
+    matrix = _result().to_vintage_matrix()
+
+    numpy.testing.assert_array_equal(matrix.first_release(), [1.0, 2.0, 3.0])
+    numpy.testing.assert_array_equal(matrix.nth_release(1), [1.5, 2.5, numpy.nan])
+    numpy.testing.assert_array_equal(matrix.nth_release(2), [1.7, numpy.nan, numpy.nan])
+
+
+def test_as_of() -> None:
+    matrix = _result().to_vintage_matrix()
+
+    numpy.testing.assert_array_equal(matrix.as_of(datetime(2000, 3, 15)), [1.0, 2.0, numpy.nan])
+    assert numpy.isnan(matrix.as_of(datetime(2000, 1, 1))).all()
+
+
+def test_to_pd_data_frame_matches_merge() -> None:
+    result = _result()
+
+    expected = pandas.DataFrame({"date": result.series[-1].dates})
+    for x in result.series:
+        arg: Any = {
+            "date": x.dates,
+            x.revision_time_stamp: pandas.Series(data=x.values, name="Value", dtype="float64"),
+        }
+        expected = expected.merge(pandas.DataFrame(arg), how="left", left_on="date", right_on="date")
+
+    pandas.testing.assert_frame_equal(result.to_pd_data_frame(), expected)
+
+
+def test_nth_release_columns() -> None:
+    matrix = _result().to_vintage_matrix()
+
+    columns = matrix.nth_release_columns([0, 1, 5])
+
+    numpy.testing.assert_array_equal(columns[0], [0, 1, 3])
+    numpy.testing.assert_array_equal(columns[1], [2, 3, -1])
+    numpy.testing.assert_array_equal(columns[5], [-1, -1, -1])
+
+
+def test_to_pd_data_frame_keeps_vintages_with_same_time_stamp() -> None:
+    time = datetime(2000, 2, 1, tzinfo=timezone.utc)
+    result = GetAllVintageSeriesResult(
+        [
+            _vintage(None, [0.5]),
+            _vintage(time, [1.0]),
+            _vintage(time, [1.5, 2.0]),
+            _vintage(datetime(2000, 3, 1, tzinfo=timezone.utc), [1.7, 2.5]),
+        ],
+        "s",
+    )
+
+    df = result.to_pd_data_frame()
+
+    assert list(df.columns) == [
+        "date",
+        None,
+        f"{time}_1",
+        f"{time}_2",
+        datetime(2000, 3, 1, tzinfo=timezone.utc),
+    ]
+    numpy.testing.assert_array_equal(df[f"{time}_1"], [1.0, numpy.nan])
+    numpy.testing.assert_array_equal(df[f"{time}_2"], [1.5, 2.0])
+
+
+def test_as_of_with_vintage_without_time_stamp() -> None:
+    matrix = GetAllVintageSeriesResult(
+        [_vintage(None, [1.0]), _vintage(datetime(2000, 2, 1, tzinfo=timezone.utc), [2.0])], "s"
+    ).to_vintage_matrix()
+
+    numpy.testing.assert_array_equal(matrix.as_of(datetime(2000, 1, 1)), [1.0])
+    numpy.testing.assert_array_equal(matrix.as_of(datetime(2000, 3, 1)), [2.0])
+
+
+def test_results_share_is_error() -> None:
+    results = [
+        VintageMatrixResult("s", None, StatusCode.NOT_MODIFIED, None),
+        NthReleasesResult("s", None, StatusCode.NOT_MODIFIED, [], {}, None),
+        SeriesObservationHistoryResult("s", None, StatusCode.NOT_MODIFIED, []),
+    ]
+    assert all(x.is_error for x in results)
+
+    assert VintageMatrixResult("s", "Not found", StatusCode.OTHER, None).is_error
+    assert not NthReleasesResult("s", None, StatusCode.OK, [], {}, None).is_error
+    assert not SeriesObservationHistoryResult("s", None, StatusCode.OK, []).is_error